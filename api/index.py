@@ -5,6 +5,7 @@ from werkzeug.security import generate_password_hash, check_password_hash
 from functools import wraps
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+import click
 
 # Set environment variable to indicate serverless mode
 os.environ['VERCEL_ENV'] = 'production'
@@ -91,12 +92,40 @@ class Image(db.Model):
     alt_text = db.Column(db.String(500), nullable=True)
     caption = db.Column(db.String(500), nullable=True)
     tags = db.Column(db.String(500), nullable=True)  # JSON string of tags
+    
+    # SHA-256 of the stored bytes; rows with the same hash share one ImageBlob
+    content_hash = db.Column(db.String(64), nullable=True, index=True)
+    # 64-bit dHash as 16 hex digits; visually similar images differ in few bits
+    perceptual_hash = db.Column(db.String(16), nullable=True)
+
+class ImageBlob(db.Model):
+    __tablename__ = 'image_blobs'
+    sha256 = db.Column(db.String(64), primary_key=True)
+    file_path = db.Column(db.String(500), nullable=False)
+    file_size = db.Column(db.Integer, nullable=False)  # in bytes
+    mime_type = db.Column(db.String(100), nullable=False)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)  # number of Image rows using this blob
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+def ensure_image_columns():
+    """Add columns introduced after the images table was first created"""
+    from sqlalchemy import inspect, text
+    
+    columns = {column['name'] for column in inspect(db.engine).get_columns('images')}
+    if 'content_hash' not in columns:
+        with db.engine.begin() as connection:
+            connection.execute(text('ALTER TABLE images ADD COLUMN content_hash VARCHAR(64)'))
+            connection.execute(text('CREATE INDEX IF NOT EXISTS ix_images_content_hash ON images (content_hash)'))
+    if 'perceptual_hash' not in columns:
+        with db.engine.begin() as connection:
+            connection.execute(text('ALTER TABLE images ADD COLUMN perceptual_hash VARCHAR(16)'))
 
 # Initialize database
 def init_database():
     """Initialize database tables"""
     with app.app_context():
         db.create_all()
+        ensure_image_columns()
         
         # Create default admin user if not exists
         admin_email = 'admin@contentcreator.com'
@@ -230,57 +259,195 @@ def generate_image_id():
     """Generate unique image ID"""
     return f"IMG{uuid.uuid4().hex[:8].upper()}"
 
-def save_image_file(file, user_email, content_id=None):
-    """Save uploaded image file"""
+# Uploads are staged here, on the same filesystem as the blobs so moving them in is a rename
+STAGING_FOLDER = os.path.join(UPLOAD_FOLDER, '.staging')
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+def get_blob_path(content_hash):
+    """Blobs are sharded by hash prefix (uploads/ab/cd/<hash>) to keep directories small"""
+    return os.path.join(UPLOAD_FOLDER, content_hash[:2], content_hash[2:4], content_hash)
+
+# Leading bytes of each allowed format -> (extension, MIME type)
+IMAGE_SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', ('png', 'image/png')),
+    (b'\xff\xd8\xff', ('jpg', 'image/jpeg')),
+    (b'GIF87a', ('gif', 'image/gif')),
+    (b'GIF89a', ('gif', 'image/gif'))
+]
+
+class StorageQuotaExceeded(Exception):
+    """Raised when an upload would take a user past their storage limit"""
+
+def sniff_image_type(header):
+    """Identify the real image format from its magic bytes"""
+    for signature, image_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return image_type
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return ('webp', 'image/webp')
+    return None
+
+def ingest_image_stream(stream, max_bytes, quota_bytes=None):
+    """Write an upload to a staging file in one pass
+    
+    While copying in chunks this hashes the bytes, sniffs the format from the
+    first chunk, parses dimensions from the header only, and stops as soon as the
+    upload exceeds ``max_bytes`` or the user's remaining ``quota_bytes``.
+    Returns the staged upload; the caller moves it into place or removes it.
+    """
+    import hashlib
+    from PIL import ImageFile
+    
+    os.makedirs(STAGING_FOLDER, exist_ok=True)
+    tmp_path = os.path.join(STAGING_FOLDER, f"{uuid.uuid4().hex}.tmp")
+    digest = hashlib.sha256()
+    parser = ImageFile.Parser()
+    size = 0
+    image_type = None
+    dimensions = (None, None)
+    
     try:
-        # Generate unique filename
-        image_id = generate_image_id()
-        original_filename = secure_filename(file.filename)
-        file_extension = original_filename.rsplit('.', 1)[1].lower()
-        filename = f"{image_id}.{file_extension}"
-        
-        # Create user-specific directory
-        user_upload_dir = os.path.join(UPLOAD_FOLDER, user_email.replace('@', '_at_'))
-        os.makedirs(user_upload_dir, exist_ok=True)
-        
-        # Save file path
-        file_path = os.path.join(user_upload_dir, filename)
-        
-        # Get file size
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset to beginning
-        
-        # Check file size limit
-        if file_size > MAX_FILE_SIZE:
-            raise ValueError(f"File size exceeds limit ({MAX_FILE_SIZE / 1024 / 1024}MB)")
-        
-        # Save file
-        file.save(file_path)
-        
-        # Get image dimensions
-        try:
-            with PILImage.open(file_path) as img:
-                width, height = img.size
-        except Exception:
-            width, height = None, None
-        
-        # Create database record
-        image_record = Image(
-            id=image_id,
-            user_email=user_email,
-            content_id=content_id,
-            filename=filename,
-            original_filename=original_filename,
-            file_path=file_path,
-            file_size=file_size,
-            mime_type=f"image/{file_extension}",
-            width=width,
-            height=height
+        with open(tmp_path, 'wb') as out:
+            while True:
+                chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                
+                if image_type is None:
+                    image_type = sniff_image_type(chunk[:16])
+                    if image_type is None:
+                        raise ValueError(f'File content is not a supported image. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}')
+                
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"File size exceeds limit ({MAX_FILE_SIZE / 1024 / 1024}MB)")
+                if quota_bytes is not None and size > quota_bytes:
+                    raise StorageQuotaExceeded('Upload exceeds your remaining storage. Upgrade your subscription for more storage.')
+                
+                digest.update(chunk)
+                out.write(chunk)
+                
+                # The header is usually in the first chunk; stop parsing once the size is known
+                if dimensions == (None, None):
+                    try:
+                        parser.feed(chunk)
+                        if parser.image is not None:
+                            dimensions = parser.image.size
+                    except Exception:
+                        dimensions = (0, 0)
+        
+        if image_type is None:
+            raise ValueError('No image data received')
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    width, height = dimensions if dimensions != (0, 0) else (None, None)
+    return {
+        'tmp_path': tmp_path,
+        'sha256': digest.hexdigest(),
+        'size': size,
+        'extension': image_type[0],
+        'mime_type': image_type[1],
+        'width': width,
+        'height': height
+    }
+
+def store_image_blob(staged):
+    """Move a staged upload into blob storage once per SHA-256 and take a reference on the blob"""
+    from sqlalchemy.exc import IntegrityError
+    
+    content_hash = staged['sha256']
+    
+    # Existing blob: just count another reference
+    if ImageBlob.query.filter_by(sha256=content_hash).update(
+        {'ref_count': ImageBlob.ref_count + 1}, synchronize_session=False
+    ):
+        os.remove(staged['tmp_path'])
+        return ImageBlob.query.get(content_hash)
+    
+    blob_path = get_blob_path(content_hash)
+    if os.path.exists(blob_path):
+        os.remove(staged['tmp_path'])
+    else:
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        os.replace(staged['tmp_path'], blob_path)
+    
+    blob = ImageBlob(
+        sha256=content_hash,
+        file_path=blob_path,
+        file_size=staged['size'],
+        mime_type=staged['mime_type'],
+        ref_count=1
+    )
+    try:
+        with db.session.begin_nested():
+            db.session.add(blob)
+    except IntegrityError:
+        # Another request stored the same bytes first
+        ImageBlob.query.filter_by(sha256=content_hash).update(
+            {'ref_count': ImageBlob.ref_count + 1}, synchronize_session=False
         )
-        
-        db.session.add(image_record)
+        blob = ImageBlob.query.get(content_hash)
+    return blob
+
+def release_image_blob(content_hash):
+    """Drop one reference to a blob, deleting it with its variants when none remain"""
+    ImageBlob.query.filter_by(sha256=content_hash).update(
+        {'ref_count': ImageBlob.ref_count - 1}, synchronize_session=False
+    )
+    blob = ImageBlob.query.populate_existing().get(content_hash)
+    if blob is None or blob.ref_count > 0:
+        return None
+    
+    db.session.delete(blob)
+    return blob.file_path
+
+def add_image_record(staged, original_filename, user_email, content_id=None, perceptual_hash=None):
+    """Move a staged upload into blob storage and add its Image row to the session (not committed)"""
+    image_id = generate_image_id()
+    
+    # Save file (once per distinct content)
+    blob = store_image_blob(staged)
+    
+    if perceptual_hash is None:
+        # Identical bytes have the same fingerprint, so only new blobs are decoded
+        existing = Image.query.filter(
+            Image.content_hash == blob.sha256, Image.perceptual_hash.isnot(None)
+        ).with_entities(Image.perceptual_hash).first()
+        perceptual_hash = existing[0] if existing else compute_perceptual_hash(blob.file_path)
+    
+    # Create database record; file_size is charged to every user that references the blob
+    image_record = Image(
+        id=image_id,
+        user_email=user_email,
+        content_id=content_id,
+        filename=f"{image_id}.{staged['extension']}",
+        original_filename=original_filename,
+        file_path=blob.file_path,
+        file_size=staged['size'],
+        mime_type=staged['mime_type'],
+        width=staged['width'],
+        height=staged['height'],
+        content_hash=blob.sha256,
+        perceptual_hash=perceptual_hash
+    )
+    db.session.add(image_record)
+    return image_record
+
+def save_image_file(file, user_email, content_id=None, quota_bytes=None):
+    """Save uploaded image file, sharing storage with identical uploads
+    
+    ``quota_bytes`` is the user's remaining storage; the upload is rejected
+    while streaming as soon as it exceeds it or MAX_FILE_SIZE.
+    """
+    try:
+        # Stream to disk, hashing and probing as we go
+        staged = ingest_image_stream(file.stream, MAX_FILE_SIZE, quota_bytes)
+        image_record = add_image_record(staged, secure_filename(file.filename), user_email, content_id)
         db.session.commit()
+        index_new_images(user_email, [image_record])
         
         return image_record
         
@@ -288,30 +455,389 @@ def save_image_file(file, user_email, content_id=None):
         db.session.rollback()
         raise e
 
+UPLOAD_BATCH_WORKERS = int(os.environ.get('UPLOAD_BATCH_WORKERS', 4))
+UPLOAD_BATCH_MAX_FILES = int(os.environ.get('UPLOAD_BATCH_MAX_FILES', 200))
+
+def stage_upload(file):
+    """Stream one file of a batch to staging and fingerprint it (runs in the worker pool)"""
+    staged = ingest_image_stream(file.stream, MAX_FILE_SIZE)
+    try:
+        staged['perceptual_hash'] = compute_perceptual_hash(staged['tmp_path'])
+    except Exception:
+        os.remove(staged['tmp_path'])
+        raise
+    return staged
+
+def save_image_files(files, user_email, image_slots, quota_bytes, content_id=None):
+    """Save a batch of uploads, returning one result per file in request order
+    
+    Reading, hashing and fingerprinting run in a bounded pool; the image count
+    and storage quota are checked once against ``image_slots`` and
+    ``quota_bytes``, and every accepted file is committed in one transaction.
+    """
+    results = [None] * len(files)
+    staged_files = [None] * len(files)
+    
+    pending = {}
+    for index, file in enumerate(files):
+        if not file.filename or not allowed_file(file.filename):
+            results[index] = {
+                'filename': file.filename,
+                'success': False,
+                'error': f'File type not allowed. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}'
+            }
+        else:
+            pending[index] = file
+    
+    with ThreadPoolExecutor(max_workers=UPLOAD_BATCH_WORKERS, thread_name_prefix='upload') as executor:
+        futures = {index: executor.submit(stage_upload, file) for index, file in pending.items()}
+        for index, future in futures.items():
+            try:
+                staged_files[index] = future.result()
+            except ValueError as e:
+                results[index] = {'filename': files[index].filename, 'success': False, 'error': str(e)}
+            except Exception as e:
+                # One unreadable upload fails on its own; the rest of the batch still commits
+                print(f"Error staging upload {files[index].filename}: {e}")
+                results[index] = {'filename': files[index].filename, 'success': False, 'error': 'Could not save file'}
+    
+    # Admit files in request order while they fit the remaining count and storage
+    records = {}
+    try:
+        for index, staged in enumerate(staged_files):
+            if staged is None:
+                continue
+            if image_slots <= 0 or staged['size'] > quota_bytes:
+                os.remove(staged['tmp_path'])
+                limit = 'Image limit' if image_slots <= 0 else 'Storage limit'
+                results[index] = {
+                    'filename': files[index].filename,
+                    'success': False,
+                    'error': f'{limit} reached. Upgrade your subscription for more.'
+                }
+                continue
+            
+            records[index] = add_image_record(
+                staged, secure_filename(files[index].filename), user_email, content_id,
+                perceptual_hash=staged['perceptual_hash']
+            )
+            staged_files[index] = None
+            image_slots -= 1
+            quota_bytes -= staged['size']
+        db.session.commit()
+        index_new_images(user_email, list(records.values()))
+    except Exception:
+        db.session.rollback()
+        for staged in staged_files:
+            if staged is not None and os.path.exists(staged['tmp_path']):
+                os.remove(staged['tmp_path'])
+        raise
+    
+    for index, record in records.items():
+        results[index] = {
+            'filename': files[index].filename,
+            'success': True,
+            'image_id': record.id,
+            'file_size': record.file_size,
+            'width': record.width,
+            'height': record.height,
+            'url': f'/api/images/{record.id}'
+        }
+    return results, list(records.values())
+
 def get_user_storage_usage(user_email):
     """Get user's current storage usage in MB"""
-    images = Image.query.filter_by(user_email=user_email).all()
-    total_bytes = sum(img.file_size for img in images)
+    total_bytes = db.session.query(db.func.coalesce(db.func.sum(Image.file_size), 0)).filter(
+        Image.user_email == user_email
+    ).scalar()
     return total_bytes / (1024 * 1024)  # Convert to MB
 
 def delete_image_file(image_id, user_email):
-    """Delete image file and database record"""
+    """Delete image record, freeing the stored file once nothing references it"""
     image = Image.query.get(image_id)
     if image and image.user_email == user_email:
         try:
-            # Delete file
-            if os.path.exists(image.file_path):
-                os.remove(image.file_path)
+            if image.content_hash:
+                freed_path = release_image_blob(image.content_hash)
+            else:
+                # Files stored before deduplication belong to a single record
+                freed_path = image.file_path
             
             # Delete database record
             db.session.delete(image)
             db.session.commit()
+            
+            # Delete file
+            if freed_path:
+                if os.path.exists(freed_path):
+                    os.remove(freed_path)
+                delete_image_derivatives(get_derivative_key(image))
             return True
         except Exception as e:
             db.session.rollback()
             raise e
     return False
 
+# Image derivatives: resized, re-encoded variants rendered on demand and cached on disk.
+# The backend's renderer and platform table are shared so both entry points crop alike.
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+from PIL import ImageOps
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+from services.image_derivatives import ImageDerivatives, SIZE_PRESETS
+from services.platform_specs import PLATFORM_IMAGE_SPECS
+
+DERIVATIVE_FOLDER = os.path.join(UPLOAD_FOLDER, 'derivatives')
+image_derivatives = ImageDerivatives(DERIVATIVE_FOLDER)
+
+def get_derivative_key(image):
+    """Variants are shared by every record that points at the same bytes"""
+    return image.content_hash or image.id
+
+def prefetch_image_derivatives(image):
+    """Warm the thumbnail and feed variants right after an image is stored"""
+    if (image.mime_type or '').startswith('image/'):
+        image_derivatives.prefetch(get_derivative_key(image), image.file_path, SIZE_PRESETS)
+
+def delete_image_derivatives(key):
+    image_derivatives.delete(key)
+
+# How image bytes leave the server: 'python' streams them from Flask, 'x-accel' (nginx)
+# and 'x-sendfile' (Apache, lighttpd) let the front proxy send the file itself
+IMAGE_SERVE_MODE = os.environ.get('IMAGE_SERVE_MODE', 'python').lower()
+# Internal nginx location aliased to UPLOAD_FOLDER, used for X-Accel-Redirect
+IMAGE_ACCEL_PREFIX = os.environ.get('IMAGE_ACCEL_PREFIX', '/protected-uploads/')
+IMAGE_MAX_AGE = int(os.environ.get('IMAGE_MAX_AGE', 86400))
+
+def send_image_file(path, mimetype, etag=None, last_modified=None):
+    """Send an image from the upload folder, offloading the transfer to the proxy when configured
+    
+    Conditional requests are answered here in either mode, so a revalidation
+    never reaches the proxy's file handling. Callers check ownership first;
+    responses are marked private so shared caches never serve them to others.
+    """
+    upload_root = os.path.abspath(UPLOAD_FOLDER)
+    abs_path = os.path.abspath(path)
+    offload = IMAGE_SERVE_MODE in ('x-accel', 'x-sendfile') and \
+        os.path.commonpath([upload_root, abs_path]) == upload_root
+    
+    if not offload:
+        response = send_file(
+            path,
+            mimetype=mimetype,
+            conditional=True,
+            etag=etag if etag is not None else True,
+            last_modified=last_modified,
+            max_age=IMAGE_MAX_AGE
+        )
+        response.cache_control.private = True
+        return response
+    
+    response = app.response_class(mimetype=mimetype)
+    if etag:
+        response.set_etag(etag)
+    response.last_modified = last_modified or datetime.utcfromtimestamp(os.path.getmtime(abs_path))
+    response.cache_control.private = True
+    response.cache_control.max_age = IMAGE_MAX_AGE
+    response = response.make_conditional(request)
+    if response.status_code == 304:
+        return response
+    
+    if IMAGE_SERVE_MODE == 'x-accel':
+        relative_path = os.path.relpath(abs_path, upload_root).replace(os.sep, '/')
+        response.headers['X-Accel-Redirect'] = IMAGE_ACCEL_PREFIX.rstrip('/') + '/' + relative_path
+    else:
+        response.headers['X-Sendfile'] = abs_path
+    return response
+
+# Near-duplicate detection: a dHash per image and a BK-tree per user's library
+DUPLICATE_MAX_DISTANCE = int(os.environ.get('IMAGE_DUPLICATE_DISTANCE', 8))
+SIMILAR_MAX_DISTANCE = int(os.environ.get('IMAGE_SIMILAR_DISTANCE', 16))
+
+def compute_perceptual_hash(path):
+    """Return the 64-bit difference hash of an image file as 16 hex digits, or None if unreadable
+    
+    Each bit says whether a pixel of the 9x8 greyscale thumbnail is brighter than
+    its right-hand neighbour, so re-encoding and resizing barely change it.
+    """
+    try:
+        with PILImage.open(path) as img:
+            # JPEG can decode at a fraction of full size, which is all a 9x8 thumbnail needs
+            img.draft('L', (64, 64))
+            small = ImageOps.exif_transpose(img).convert('L').resize((9, 8), PILImage.LANCZOS)
+    except Exception:
+        return None
+    
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return f'{value:016x}'
+
+class BKTree:
+    """Burkhard-Keller tree over 64-bit hashes with Hamming distance
+    
+    Children are keyed by their distance to the parent; by the triangle
+    inequality a search within ``d`` of the query only descends into children
+    whose key lies within ``d`` of the node's own distance, which prunes most of
+    the tree for small ``d``.
+    """
+    
+    def __init__(self):
+        self.root = None
+        self.size = 0
+    
+    def add(self, value, item):
+        node = [value, [item], {}]
+        self.size += 1
+        if self.root is None:
+            self.root = node
+            return
+        current = self.root
+        while True:
+            distance = bin(value ^ current[0]).count('1')
+            if distance == 0:
+                current[1].append(item)
+                return
+            child = current[2].get(distance)
+            if child is None:
+                current[2][distance] = node
+                return
+            current = child
+    
+    def search(self, value, max_distance):
+        """Return (distance, item) pairs within ``max_distance``, closest first"""
+        results = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node_value, items, children = stack.pop()
+            distance = bin(value ^ node_value).count('1')
+            if distance <= max_distance:
+                results.extend((distance, item) for item in items)
+            # Copy the children: another request may be adding to the tree concurrently
+            for child_distance, child in list(children.items()):
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        results.sort(key=lambda result: result[0])
+        return results
+
+# user_email -> (library signature, BKTree); rebuilt whenever another worker changes the library
+perceptual_indexes = {}
+perceptual_indexes_lock = threading.Lock()
+
+def perceptual_signature(user_email):
+    """(image count, newest upload, fingerprinted count) for a user's library"""
+    return tuple(db.session.query(
+        db.func.count(Image.id), db.func.max(Image.created_at), db.func.count(Image.perceptual_hash)
+    ).filter(Image.user_email == user_email).one())
+
+def get_perceptual_index(user_email):
+    """Return the BK-tree of a user's fingerprinted images, rebuilding it if any worker changed the library
+    
+    Images without a fingerprint are left out until backfill_perceptual_hashes
+    reaches them; fingerprinting never happens on this path.
+    """
+    signature = perceptual_signature(user_email)
+    with perceptual_indexes_lock:
+        cached = perceptual_indexes.get(user_email)
+        if cached and cached[0] == signature:
+            return cached[1]
+    
+    tree = BKTree()
+    for image_id, perceptual_hash in db.session.query(Image.id, Image.perceptual_hash).filter(
+        Image.user_email == user_email, Image.perceptual_hash.isnot(None), Image.perceptual_hash != ''
+    ):
+        tree.add(int(perceptual_hash, 16), image_id)
+    
+    with perceptual_indexes_lock:
+        perceptual_indexes[user_email] = (signature, tree)
+    return tree
+
+def index_new_images(user_email, images):
+    """Add just-committed images to the user's cached tree instead of letting the next lookup rebuild it
+    
+    The tree is only extended when the library signature moved by exactly these
+    images; if anything else changed it, the cache is dropped and rebuilt lazily.
+    """
+    if not images:
+        return
+    signature = perceptual_signature(user_email)
+    with perceptual_indexes_lock:
+        cached = perceptual_indexes.get(user_email)
+        if not cached:
+            return
+        (count, newest, fingerprinted), tree = cached
+        created = [image.created_at for image in images] + ([newest] if newest else [])
+        expected = (
+            count + len(images),
+            max(created),
+            fingerprinted + sum(1 for image in images if image.perceptual_hash is not None)
+        )
+        if signature != expected:
+            perceptual_indexes.pop(user_email, None)
+            return
+        for image in images:
+            if image.perceptual_hash:
+                tree.add(int(image.perceptual_hash, 16), image.id)
+        perceptual_indexes[user_email] = (signature, tree)
+
+def backfill_perceptual_hashes(batch_size=200):
+    """Fingerprint images uploaded before perceptual hashes were recorded; returns the number processed
+    
+    Unreadable or missing files get an empty hash so they are not retried. Each
+    batch is committed separately, which also invalidates every worker's cached
+    trees through the fingerprinted count in the library signature.
+    """
+    processed = 0
+    while True:
+        batch = Image.query.filter(Image.perceptual_hash.is_(None)).limit(batch_size).all()
+        if not batch:
+            return processed
+        for image in batch:
+            readable = image.mime_type.startswith('image/') and os.path.exists(image.file_path)
+            image.perceptual_hash = (compute_perceptual_hash(image.file_path) if readable else None) or ''
+        db.session.commit()
+        processed += len(batch)
+
+@app.cli.command('backfill-perceptual-hashes')
+@click.option('--batch-size', default=200, show_default=True, type=int)
+def backfill_perceptual_hashes_command(batch_size):
+    """Fingerprint every image that does not have a perceptual hash yet"""
+    click.echo(f"Fingerprinted {backfill_perceptual_hashes(batch_size)} images")
+
+def run_perceptual_backfill():
+    """One backfill pass at startup; a lock file keeps it to one worker per host"""
+    import fcntl
+    
+    try:
+        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+        with open(os.path.join(UPLOAD_FOLDER, '.perceptual-backfill.lock'), 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return
+            with app.app_context():
+                processed = backfill_perceptual_hashes()
+                db.session.remove()
+            if processed:
+                print(f"Perceptual hash backfill: fingerprinted {processed} images")
+    except Exception as e:
+        print(f"Perceptual hash backfill error: {e}")
+
+def find_similar_images(user_email, perceptual_hash, max_distance, exclude_id=None):
+    """Return [(distance, image_id)] for a user's images within ``max_distance`` bits of a hash"""
+    if not perceptual_hash:
+        return []
+    tree = get_perceptual_index(user_email)
+    return [
+        (distance, image_id)
+        for distance, image_id in tree.search(int(perceptual_hash, 16), max_distance)
+        if image_id != exclude_id
+    ]
+
 # Sample content for demo purposes
 def initialize_demo_content():
     """Initialize demo content for demonstration"""
@@ -367,12 +893,13 @@ def initialize_demo_content():
         
         # Add status information
         if i == 0:  # First post - published
-            content_entry['status'] = 'published'
+            content_entry.status = 'published'
         elif i == 1:  # Second post - scheduled
-            content_entry['status'] = 'scheduled'
-            content_entry['scheduled_time'] = '2024-07-20 10:00 AM'
+            content_entry.status = 'scheduled'
+            content_entry.scheduled_time = datetime(2024, 7, 20, 10, 0)
         else:  # Other posts - draft
-            content_entry['status'] = 'draft'
+            content_entry.status = 'draft'
+    db.session.commit()
     
     # Add more sample content for other platforms
     additional_content = [
@@ -424,12 +951,13 @@ def initialize_demo_content():
         
         # Add status information
         if i == 0:  # Facebook post - published
-            content_entry['status'] = 'published'
+            content_entry.status = 'published'
         elif i == 1:  # YouTube post - scheduled
-            content_entry['status'] = 'scheduled'
-            content_entry['scheduled_time'] = '2024-07-22 02:00 PM'
+            content_entry.status = 'scheduled'
+            content_entry.scheduled_time = datetime(2024, 7, 22, 14, 0)
         else:  # Other posts - draft
-            content_entry['status'] = 'draft'
+            content_entry.status = 'draft'
+    db.session.commit()
     
     # Add performance data for all content
     content_manager.update_performance('CC1001', 'linkedin', views=156, likes=23, shares=5, comments=8)
@@ -441,9 +969,6 @@ def initialize_demo_content():
     content_manager.update_performance('CC1007', 'linkedin', views=289, likes=34, shares=7, comments=12)
     content_manager.update_performance('CC1008', 'instagram', views=567, likes=89, shares=12, comments=18)
 
-# Initialize demo content
-initialize_demo_content()
-
 def generate_dashboard_content(user_email, user_content):
     """Generate dynamic dashboard content based on user's content"""
     
@@ -5214,1188 +5739,65 @@ def translate_to_english(content):
 @app.route('/favicon.ico')
 def favicon():
     """Serve favicon"""
-    # Return a simple SVG favicon as data URI
+    # Return a simple SVG favicon
     svg_data = """<svg width="32" height="32" viewBox="0 0 32 32" fill="none" xmlns="http://www.w3.org/2000/svg">
 <rect width="32" height="32" rx="4" fill="#667EEA"/>
 <path d="M8 12L24 12L24 20H8V12Z" fill="white"/>
-<path d="M10 14L16 14L16 18SDEwVjE0WiIgZmlsbD0iIzY2N0VFQSIvPgo8cGF0aCBkPSJNMTggMTRMMjIgMTRMMjIgMThIMThWMTQiIGZpbGw9IiM2NjdFRUEiLz4KPHBhdGggZD0iTTggMjJMMjQgMjJMMjQgMjRIMFYyMloiIGZpbGw9IndoaXRlIi8+Cjwvc3ZnPgo=">
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        body { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); min-height: 100vh; }
-        .navbar { 
-            background: rgba(255,255,255,0.1) !important; 
-            backdrop-filter: blur(10px); 
-            position: fixed !important;
-            top: 0;
-            width: 100%;
-            z-index: 1000;
-        }
-        .navbar-brand { color: #fff !important; font-weight: bold; }
-        .nav-link { color: #fff !important; }
-        .nav-link:hover { color: #f0f0f0 !important; }
-        .main-content { padding: 100px 0 50px 0; color: #fff; }
-        .card { background: rgba(255,255,255,0.95); border: none; border-radius: 15px; }
-        .btn-primary { background: linear-gradient(45deg, #667eea, #764ba2); border: none; }
-        .feature-card { background: #fff; border-radius: 15px; padding: 30px; margin: 20px 0; box-shadow: 0 10px 30px rgba(0,0,0,0.1); color: #222; }
-        .feature-card h3, .feature-card p { color: #222 !important; text-shadow: none; }
-        h1, h2, h3, p, .lead { color: #fff !important; text-shadow: 0 2px 8px rgba(0,0,0,0.25); }
-        
-        /* Card text visibility fixes */
-        .card h3, .card h4, .card h5, .card h6 { color: #333 !important; text-shadow: none; }
-        .card p, .card span, .card div { color: #333 !important; text-shadow: none; }
-        .card label { color: #333 !important; font-weight: 600; text-shadow: none; }
-        .card .text-muted { color: #666 !important; text-shadow: none; }
-        .card .badge { color: #fff !important; text-shadow: none; }
-        .card strong { color: #333 !important; text-shadow: none; }
-        .card small { color: #666 !important; text-shadow: none; }
+<path d="M10 14L16 14L16 18H10V14Z" fill="#667EEA"/>
+<path d="M18 14L22 14L22 18H18V14" fill="#667EEA"/>
+<path d="M8 22L24 22L24 24H0V22Z" fill="white"/>
+</svg>"""
+    response = app.response_class(svg_data, mimetype='image/svg+xml')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+# Database initialization and API routes
+@app.route('/api/save-content', methods=['POST'])
+def save_content():
+    """Save generated content to user's library"""
+    try:
+        if 'user' not in session:
+            return jsonify({
+                'success': False,
+                'error': 'User not logged in'
+            }), 401
         
-        /* Form elements visibility */
-        .form-control, .form-select { 
-            border-radius: 10px; 
-            border: 2px solid #e0e0e0; 
-            color: #333 !important;
-            background: #fff !important;
-        }
-        .form-control:focus, .form-select:focus { 
-            border-color: #667eea; 
-            box-shadow: 0 0 0 0.2rem rgba(102, 126, 234, 0.25); 
-            color: #333 !important;
-        }
-        .form-label { color: #333 !important; font-weight: 600; text-shadow: none; }
+        data = request.get_json()
+        user_email = session['user']
         
-        /* Button text visibility */
-        .btn { color: #fff !important; text-shadow: none; }
-        .btn-outline-secondary { color: #6c757d !important; border-color: #6c757d; }
-        .btn-outline-primary { color: #667eea !important; border-color: #667eea; }
-        .btn-outline-success { color: #28a745 !important; border-color: #28a745; }
-        .btn-outline-info { color: #17a2b8 !important; border-color: #17a2b8; }
-        .btn-outline-warning { color: #ffc107 !important; border-color: #ffc107; }
-        .btn-outline-danger { color: #dc3545 !important; border-color: #dc3545; }
+        # Check user content limits
+        user = get_user(user_email)
+        if not user:
+            return jsonify({
+                'success': False,
+                'error': 'User not found'
+            }), 404
         
-        /* Direction Cards */
-        .direction-card {
-            background: #fff;
-            border: 2px solid #e0e0e0;
-            border-radius: 12px;
-            padding: 15px;
-            margin: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-align: center;
-            color: #333 !important;
-        }
-        .direction-card:hover {
-            border-color: #667eea;
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.2);
-        }
-        .direction-card.selected {
-            border-color: #667eea;
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            color: #fff !important;
-        }
-        .direction-card i {
-            font-size: 24px;
-            margin-bottom: 8px;
-        }
-        .direction-card div {
-            color: inherit !important;
-            text-shadow: none;
-        }
+        current_content_count = content_manager.get_content_count(user_email)
+        if current_content_count >= user.content_limit:
+            return jsonify({
+                'success': False,
+                'error': f'Content limit reached ({user.content_limit}). Upgrade your subscription for more content.'
+            }), 403
         
-        /* Step Progress */
-        .step-progress {
-            display: flex;
-            justify-content: center;
-            margin-bottom: 30px;
-        }
-        .step {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            background: rgba(255,255,255,0.3);
-            color: #fff;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 0 10px;
-            font-weight: bold;
-        }
-        .step.active {
-            background: #667eea;
-        }
-        .step.completed {
-            background: #28a745;
-        }
+        content_entry = content_manager.create_content(
+            user_email=user_email,
+            direction=data.get('direction'),
+            platform=data.get('platform'),
+            source=data.get('source'),
+            topic=data.get('topic'),
+            tone=data.get('tone'),
+            content_text=data.get('content'),
+            language=data.get('language', 'en'),
+            region=data.get('region')
+        )
         
-        /* User Welcome */
-        .user-welcome {
-            color: #fff;
-            font-size: 14px;
-            margin-right: 15px;
-        }
-        
-        /* Alert and notification visibility */
-        .alert { color: #333 !important; text-shadow: none; }
-        .alert h5 { color: #333 !important; text-shadow: none; }
-        .alert p { color: #333 !important; text-shadow: none; }
-        
-        /* Input group visibility */
-        .input-group-text { 
-            background: #f8f9fa !important; 
-            color: #495057 !important; 
-            border-color: #e0e0e0;
-        }
-        
-        /* Table visibility */
-        .table { color: #333 !important; }
-        .table th { color: #333 !important; }
-        .table td { color: #333 !important; }
-        
-        /* List visibility */
-        .list-group-item { color: #333 !important; }
-        
-        /* Modal visibility */
-        .modal-content { color: #333 !important; }
-        .modal-header { color: #333 !important; }
-        .modal-body { color: #333 !important; }
-        .modal-footer { color: #333 !important; }
-        
-        /* Dropdown visibility */
-        .dropdown-menu { color: #333 !important; }
-        .dropdown-item { color: #333 !important; }
-        .dropdown-item.active { 
-            background-color: #667eea !important; 
-            color: #fff !important; 
-        }
-        
-        /* Progress bar visibility */
-        .progress { background: rgba(255,255,255,0.3) !important; }
-        .progress-bar { color: #fff !important; }
-        
-        /* Spinner visibility */
-        .fa-spinner { color: #667eea !important; }
-        
-        /* Ensure all text in cards is visible */
-        .card * { color: inherit !important; }
-        .card .text-primary { color: #667eea !important; }
-        .card .text-success { color: #28a745 !important; }
-        .card .text-warning { color: #ffc107 !important; }
-        .card .text-info { color: #17a2b8 !important; }
-        .card .text-danger { color: #dc3545 !important; }
-    </style>
-</head>
-<body>
-    <!-- Navigation -->
-    <nav class="navbar navbar-expand-lg navbar-dark">
-        <div class="container">
-            <a class="navbar-brand" href="/">
-                <i class="fas fa-rocket me-2"></i>Content Creator Pro
-            </a>
-            <button class="navbar-toggler" type="button" data-bs-toggle="collapse" data-bs-target="#navbarNav">
-                <span class="navbar-toggler-icon"></span>
-            </button>
-            <div class="collapse navbar-collapse" id="navbarNav">
-                <ul class="navbar-nav ms-auto">
-                    <!-- Language Selector -->
-                    <li class="nav-item dropdown me-3">
-                        <a class="nav-link dropdown-toggle" href="#" role="button" data-bs-toggle="dropdown">
-                            <i class="fas fa-globe me-1"></i>
-                            <span id="current-language" data-translate="english">English</span>
-                        </a>
-                        <ul class="dropdown-menu">
-                            <li><a class="dropdown-item language-option" href="#" data-lang="en">
-                                <i class="fas fa-flag me-2"></i><span data-translate="english">English</span>
-                            </a></li>
-                            <li><a class="dropdown-item language-option" href="#" data-lang="zh">
-                                <i class="fas fa-flag me-2"></i><span data-translate="chinese">中文</span>
-                            </a></li>
-                        </ul>
-                    </li>
-                    
-                    <li class="nav-item">
-                        <a class="nav-link" href="/home"><i class="fas fa-home me-1"></i><span data-translate="home">Home</span></a>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/generator"><i class="fas fa-magic me-1"></i><span data-translate="generator">Generator</span></a>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/dashboard"><i class="fas fa-chart-line me-1"></i><span data-translate="dashboard">Dashboard</span></a>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/library"><i class="fas fa-book me-1"></i><span data-translate="library">Library</span></a>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/social-media-manager"><i class="fas fa-share-alt me-1"></i><span data-translate="post_management">Post Management</span></a>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/settings"><i class="fas fa-cog me-1"></i><span data-translate="settings">Settings</span></a>
-                    </li>
-                    {% if 'user' in session %}
-                    <li class="nav-item">
-                        <span class="user-welcome">
-                            <i class="fas fa-user me-1"></i><span data-translate="welcome">Welcome</span>, {{ session['user'].split('@')[0] if '@' in session['user'] else session['user'] }}
-                        </span>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/logout"><i class="fas fa-sign-out-alt me-1"></i><span data-translate="logout">Logout</span></a>
-                    </li>
-                    {% else %}
-                    <li class="nav-item">
-                        <a class="nav-link" href="/login"><i class="fas fa-sign-in-alt me-1"></i><span data-translate="login">Login</span></a>
-                    </li>
-                    <li class="nav-item">
-                        <a class="nav-link" href="/register"><i class="fas fa-user-plus me-1"></i><span data-translate="register">Register</span></a>
-                    </li>
-                    {% endif %}
-                </ul>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <div class="main-content">
-
-        
-        <!-- Flash Messages -->
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                <div class="container mb-4">
-                    {% for category, message in messages %}
-                        <div class="alert alert-{{ 'danger' if category == 'error' else category }} alert-dismissible fade show" role="alert">
-                            <i class="fas fa-{{ 'exclamation-triangle' if category == 'error' or category == 'danger' else 'check-circle' if category == 'success' else 'info-circle' }} me-2"></i>
-                            {{ message }}
-                            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-                        </div>
-                    {% endfor %}
-                </div>
-            {% endif %}
-        {% endwith %}
-        
-        {{ content | safe }}
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-    
-    <!-- Translation System -->
-    <script>
-    // Global variables
-    let currentLanguage = '{{ session.get("language", "en") }}';
-    
-    // Translation dictionary
-    const translations = {
-        en: {
-            // Navigation
-            'dashboard': 'Dashboard',
-            'generator': 'Generator',
-            'library': 'Library',
-            'settings': 'Settings',
-            'account': 'Account',
-            'logout': 'Logout',
-            'login': 'Login',
-            'register': 'Register',
-            'english': 'English',
-            'chinese': '中文',
-            'home': 'Home',
-            'welcome': 'Welcome',
-            
-            // Common
-            'loading': 'Loading...',
-            'error': 'Error',
-            'success': 'Success',
-            'cancel': 'Cancel',
-            'save': 'Save',
-            'edit': 'Edit',
-            'delete': 'Delete',
-            'close': 'Close',
-            'submit': 'Submit',
-            'back': 'Back',
-            'next': 'Next',
-            'previous': 'Previous',
-            'continue': 'Continue',
-            'finish': 'Finish',
-            
-            // Generator page
-            'content_generator': 'Content Generator',
-            'step_1': 'Step 1',
-            'step_2': 'Step 2',
-            'step_3': 'Step 3',
-            'step_4': 'Step 4',
-            'step_5': 'Step 5',
-            'choose_direction': 'Choose Your Content Direction',
-            'choose_platform': 'Choose Your Platform',
-            'what_inspires': 'What Inspires You?',
-            'generate_content': 'Generate Content',
-            'linkedin': 'LinkedIn',
-            'facebook': 'Facebook',
-            'instagram': 'Instagram',
-            'twitter': 'Twitter',
-            'youtube_shorts': 'YouTube Shorts',
-            'blog_article': 'Blog Article',
-            'professional': 'Professional',
-            'casual': 'Casual',
-            'inspirational': 'Inspirational',
-            'educational': 'Educational',
-            'entertaining': 'Entertaining',
-            
-            // Landing page
-            'content_creator_pro': 'Content Creator Pro',
-            'ai_powered_platform': 'AI-Powered Content Generation Platform',
-            'multi_platform_content': 'Multi-Platform Content',
-            'generate_content_for': 'Generate content for',
-            'platforms_list': 'LinkedIn, Facebook, Instagram, Twitter, YouTube, and blogs',
-            'smart_direction': 'Smart Direction',
-            'content_directions_desc': '18 content directions with',
-            'regional_context': 'regional and cultural context',
-            'ai_powered': 'AI-Powered',
-            'advanced_ai_generation': 'Advanced AI content generation with',
-            'tone_customization': 'tone and style customization',
-            'start_creating': 'Start Creating',
-            'try_demo': 'Try Demo',
-            
-            // Content directions
-            'business_finance': 'Business & Finance',
-            'technology': 'Technology',
-            'health_wellness': 'Health & Wellness',
-            'education': 'Education',
-            'entertainment': 'Entertainment',
-            'travel_tourism': 'Travel & Tourism',
-            'food_cooking': 'Food & Cooking',
-            'fashion_beauty': 'Fashion & Beauty',
-            'sports_fitness': 'Sports & Fitness',
-            'science_research': 'Science & Research',
-            'politics_news': 'Politics & News',
-            'environment': 'Environment',
-            'personal_dev': 'Personal Dev',
-            'parenting_family': 'Parenting & Family',
-            'art_creativity': 'Art & Creativity',
-            'real_estate': 'Real Estate',
-            'automotive': 'Automotive',
-            'pet_care': 'Pet Care',
-            
-            // Generator page
-            'create_engaging_content': 'Create engaging content with AI assistance',
-            'choose_your_focus': 'Choose Your Focus',
-            'next_step': 'Next Step',
-            
-            // Step titles
-            'step_2': 'Step 2',
-            'step_3': 'Step 3',
-            'step_3_5': 'Step 3.5',
-            'step_4': 'Step 4',
-            'what_type_content': 'What Type of Content?',
-            'what_inspires_you': 'What Inspires You?',
-            'choose_your_topic': 'Choose Your Topic',
-            'how_should_sound': 'How Should It Sound?',
-            
-            // Content types
-            'linkedin_post': 'LinkedIn Post',
-            'facebook_post': 'Facebook Post',
-            'instagram_post': 'Instagram Post',
-            'twitter_post': 'Twitter Post',
-            'youtube_short': 'YouTube Short',
-            'blog_article': 'Blog Article',
-            
-            // Inspiration sources
-            'latest_news': 'Latest News',
-            'popular_books': 'Popular Books',
-            'trending_threads': 'Trending Threads',
-            'podcasts': 'Podcasts',
-            'youtube_videos': 'YouTube Videos',
-            'research_papers': 'Research Papers',
-            'case_studies': 'Case Studies',
-            'trending_topics': 'Trending Topics',
-            
-            // Topic selection
-            'book_title': 'Book Title',
-            'author': 'Author',
-            'enter_book_title': 'Enter book title...',
-            'enter_author_name': 'Enter author name...',
-            'find_topics': 'Find Topics',
-            'podcast_link': 'Podcast Link',
-            'enter_podcast_url': 'Enter podcast URL...',
-            'youtube_video_link': 'YouTube Video Link',
-            'enter_youtube_video_url': 'Enter YouTube video URL...',
-            'research_paper_pdf': 'Research Paper (PDF)',
-            'upload_find_topics': 'Upload & Find Topics',
-            'available_topics': 'Available Topics',
-            'refresh': 'Refresh',
-            'podcast_link': 'Podcast Link',
-            'enter_podcast_url': 'Enter podcast URL...',
-            'youtube_video_link': 'YouTube Video Link',
-            'enter_youtube_video_url': 'Enter YouTube video URL...',
-            'research_paper_pdf': 'Research Paper (PDF)',
-            'generated_content': 'Generated Content',
-            'copy': 'Copy',
-            'save_to_library': 'Save to Library',
-            'humorous': 'Humorous',
-            'serious': 'Serious',
-            'welcome_back': 'Welcome back',
-            'your_focus': 'Your focus',
-            'quick_stats': 'Quick Stats',
-            'content_generated': 'Content Generated',
-            'this_month': 'This Month',
-            'library_items': 'Library Items',
-            'social_posts': 'Social Posts',
-            'quick_actions': 'Quick Actions',
-            'generate_new_content': 'Generate New Content',
-            'view_library': 'View Library',
-            'social_media': 'Social Media',
-            'analytics': 'Analytics',
-            'recent_content_by_direction': 'Recent Content by Direction',
-            'business': 'Business',
-            'tech': 'Tech',
-            'twitter_thread': 'Twitter Thread',
-            '2_hours_ago': '2 hours ago',
-            '1_day_ago': '1 day ago',
-            '3_days_ago': '3 days ago',
-            '1_week_ago': '1 week ago',
-            'linkedin': 'LinkedIn',
-            'twitter': 'Twitter',
-            'instagram': 'Instagram',
-            'blog': 'Blog',
-            'email': 'Email',
-            'password': 'Password',
-            'already_have_account': 'Already have an account?',
-            'login_here': 'Login here',
-            'dont_have_account': "Don't have an account?",
-            'register_here': 'Register here',
-            'demo_credentials': 'Demo Credentials:',
-            'social_media_performance': 'Social Media Performance',
-            'content_performance_by_direction': 'Content Performance by Direction',
-            'no_content_generated_yet': 'No content generated yet.',
-            'no_social_media_content_yet': 'No social media content yet.',
-            'no_posts_yet': 'No posts yet',
-            'linkedin_manager': 'LinkedIn Manager',
-        'social_media_manager': 'Social Media Manager',
-        'post_management': 'Post Management',
-        'account_management': 'Account Management',
-        'connect_account': 'Connect Account',
-        'disconnect_account': 'Disconnect Account',
-        'manage_account': 'Manage Account',
-        'account_status': 'Account Status',
-        'permissions': 'Permissions',
-        'security': 'Security',
-        'export_data': 'Export Data',
-        'revoke_permissions': 'Revoke Permissions',
-            'translate_to_chinese': 'Translate to Chinese',
-            'translate_to_english': 'Translate to English',
-            'step_5': 'Step 5',
-            'review_and_generate': 'Review & Generate',
-            'your_selections': 'Your Selections',
-            'direction': 'Direction',
-            'platform': 'Platform',
-            'source': 'Source',
-            'topic': 'Topic',
-            'tone': 'Tone',
-            'review_message': 'Review your selections above. Click Generate to create your content.',
-            
-            // Tone options
-            'professional': 'Professional',
-            'casual': 'Casual',
-            'inspirational': 'Inspirational',
-            'educational': 'Educational',
-            'humorous': 'Humorous',
-            'serious': 'Serious',
-            
-            // Navigation buttons
-            'previous': 'Previous',
-            'generate_content': 'Generate Content',
-            
-            // Result section
-            'generated_content': 'Generated Content',
-            'copy': 'Copy',
-            'save_to_library': 'Save to Library'
-        },
-        zh: {
-            // Navigation
-            'dashboard': '仪表板',
-            'generator': '生成器',
-            'library': '库',
-            'settings': '设置',
-            'account': '账户',
-            'logout': '登出',
-            'login': '登录',
-            'register': '注册',
-            'english': 'English',
-            'chinese': '中文',
-            'home': '首页',
-            'welcome': '欢迎',
-            
-            // Common
-            'loading': '加载中...',
-            'error': '错误',
-            'success': '成功',
-            'cancel': '取消',
-            'save': '保存',
-            'edit': '编辑',
-            'delete': '删除',
-            'close': '关闭',
-            'submit': '提交',
-            'back': '返回',
-            'next': '下一步',
-            'previous': '上一步',
-            'continue': '继续',
-            'finish': '完成',
-            
-            // Generator page
-            'content_generator': '内容生成器',
-            'step_1': '第1步',
-            'step_2': '第2步',
-            'step_3': '第3步',
-            'step_4': '第4步',
-            'step_5': '第5步',
-            'choose_direction': '选择您的内容方向',
-            'choose_platform': '选择您的平台',
-            'what_inspires': '什么激励着您？',
-            'generate_content': '生成内容',
-            'linkedin': '领英',
-            'facebook': '脸书',
-            'instagram': 'Instagram',
-            'twitter': '推特',
-            'youtube_shorts': 'YouTube短视频',
-            'blog_article': '博客文章',
-            'professional': '专业',
-            'casual': '随意',
-            'inspirational': '励志',
-            'educational': '教育',
-            'entertaining': '娱乐',
-            
-            // Landing page
-            'content_creator_pro': '内容创作者专业版',
-            'ai_powered_platform': 'AI驱动的内容生成平台',
-            'multi_platform_content': '多平台内容',
-            'generate_content_for': '为以下平台生成内容',
-            'platforms_list': '领英、脸书、Instagram、推特、YouTube和博客',
-            'smart_direction': '智能方向',
-            'content_directions_desc': '18个内容方向，具有',
-            'regional_context': '区域和文化背景',
-            'ai_powered': 'AI驱动',
-            'advanced_ai_generation': '先进的AI内容生成，具有',
-            'tone_customization': '语气和风格定制',
-            'start_creating': '开始创作',
-            'try_demo': '试用演示',
-            
-            // Content directions
-            'business_finance': '商业与金融',
-            'technology': '技术',
-            'health_wellness': '健康与保健',
-            'education': '教育',
-            'entertainment': '娱乐',
-            'travel_tourism': '旅游',
-            'food_cooking': '美食烹饪',
-            'fashion_beauty': '时尚美容',
-            'sports_fitness': '运动健身',
-            'science_research': '科学研究',
-            'politics_news': '政治新闻',
-            'environment': '环境',
-            'personal_dev': '个人发展',
-            'parenting_family': '育儿家庭',
-            'art_creativity': '艺术创意',
-            'real_estate': '房地产',
-            'automotive': '汽车',
-            'pet_care': '宠物护理',
-            
-            // Generator page
-            'create_engaging_content': '使用AI辅助创建引人入胜的内容',
-            'choose_your_focus': '选择您的重点',
-            'next_step': '下一步',
-            
-            // Step titles
-            'step_2': '第2步',
-            'step_3': '第3步',
-            'step_3_5': '第3.5步',
-            'step_4': '第4步',
-            'what_type_content': '什么类型的内容？',
-            'what_inspires_you': '什么激励着您？',
-            'choose_your_topic': '选择您的主题',
-            'how_should_sound': '应该听起来如何？',
-            
-            // Content types
-            'linkedin_post': '领英帖子',
-            'facebook_post': '脸书帖子',
-            'instagram_post': 'Instagram帖子',
-            'twitter_post': '推特帖子',
-            'youtube_short': 'YouTube短视频',
-            'blog_article': '博客文章',
-            
-            // Inspiration sources
-            'latest_news': '最新新闻',
-            'popular_books': '热门书籍',
-            'trending_threads': '热门讨论',
-            'podcasts': '播客',
-            'youtube_videos': 'YouTube视频',
-            'research_papers': '研究论文',
-            'case_studies': '案例研究',
-            'trending_topics': '热门话题',
-            
-            // Topic selection
-            'book_title': '书名',
-            'author': '作者',
-            'enter_book_title': '输入书名...',
-            'enter_author_name': '输入作者姓名...',
-            'find_topics': '查找主题',
-            'podcast_link': '播客链接',
-            'enter_podcast_url': '输入播客URL...',
-            'youtube_video_link': 'YouTube视频链接',
-            'enter_youtube_video_url': '输入YouTube视频URL...',
-            'research_paper_pdf': '研究论文(PDF)',
-            'upload_find_topics': '上传并查找主题',
-            'available_topics': '可用主题',
-            'refresh': '刷新',
-            'podcast_link': '播客链接',
-            'enter_podcast_url': '输入播客网址...',
-            'youtube_video_link': 'YouTube视频链接',
-            'enter_youtube_video_url': '输入YouTube视频网址...',
-            'research_paper_pdf': '研究论文 (PDF)',
-            'generated_content': '生成的内容',
-            'copy': '复制',
-            'save_to_library': '保存到库',
-            'humorous': '幽默',
-            'serious': '严肃',
-            'welcome_back': '欢迎回来',
-            'your_focus': '您的重点',
-            'quick_stats': '快速统计',
-            'content_generated': '生成的内容',
-            'this_month': '本月',
-            'library_items': '库项目',
-            'social_posts': '社交帖子',
-            'quick_actions': '快速操作',
-            'generate_new_content': '生成新内容',
-            'view_library': '查看库',
-            'social_media': '社交媒体',
-            'analytics': '分析',
-            'recent_content_by_direction': '按方向的最新内容',
-            'business': '商业',
-            'tech': '科技',
-            'twitter_thread': 'Twitter线程',
-            '2_hours_ago': '2小时前',
-            '1_day_ago': '1天前',
-            '3_days_ago': '3天前',
-            '1_week_ago': '1周前',
-            'linkedin': '领英',
-            'twitter': '推特',
-            'instagram': 'Instagram',
-            'blog': '博客',
-            'email': '邮箱',
-            'password': '密码',
-            'already_have_account': '已有账户？',
-            'login_here': '在此登录',
-            'dont_have_account': '没有账户？',
-            'register_here': '在此注册',
-            'demo_credentials': '演示凭据：',
-            'social_media_performance': '社交媒体表现',
-            'content_performance_by_direction': '按方向的内容表现',
-            'no_content_generated_yet': '尚未生成内容。',
-            'no_social_media_content_yet': '尚无社交媒体内容。',
-            'no_posts_yet': '尚无帖子',
-            'linkedin_manager': 'LinkedIn管理器',
-        'social_media_manager': '社交媒体管理器',
-        'post_management': '帖子管理',
-        'account_management': '账户管理',
-        'connect_account': '连接账户',
-        'disconnect_account': '断开连接',
-        'manage_account': '管理账户',
-        'account_status': '账户状态',
-        'permissions': '权限',
-        'security': '安全',
-        'export_data': '导出数据',
-        'revoke_permissions': '撤销权限',
-            'translate_to_chinese': '翻译成中文',
-            'translate_to_english': '翻译成英文',
-            'step_5': '第5步',
-            'review_and_generate': '审查和生成',
-            'your_selections': '您的选择',
-            'direction': '方向',
-            'platform': '平台',
-            'source': '来源',
-            'topic': '主题',
-            'tone': '语调',
-            'review_message': '查看上面的选择。点击生成来创建您的内容。',
-            
-            // Tone options
-            'professional': '专业',
-            'casual': '随意',
-            'inspirational': '励志',
-            'educational': '教育',
-            'humorous': '幽默',
-            'serious': '严肃',
-            
-            // Navigation buttons
-            'previous': '上一步',
-            'generate_content': '生成内容',
-            
-            // Result section
-            'generated_content': '生成的内容',
-            'copy': '复制',
-            'save_to_library': '保存到库'
-        }
-    };
-    
-    // Translation functions
-    function switchLanguage(lang) {
-
-        currentLanguage = lang;
-        
-        // Update UI to show current language
-        updateLanguageDisplay(lang);
-        
-        // Translate the entire page
-        translatePage(lang);
-        
-        // Send AJAX request to update server-side language preference
-        $.ajax({
-            url: '/language/' + lang,
-            method: 'GET',
-            headers: {
-                'X-Requested-With': 'XMLHttpRequest'
-            },
-            success: function(response) {
-    
-            },
-            error: function(xhr, status, error) {
-
-            }
-        });
-    }
-    
-    function updateLanguageDisplay(lang) {
-
-        const languageNames = {
-            'en': 'English',
-            'zh': '中文'
-        };
-        
-        $('#current-language').text(languageNames[lang] || 'English');
-        
-        // Update the dropdown text as well
-        $('.language-option').each(function() {
-            const optionLang = $(this).data('lang');
-            if (optionLang === lang) {
-                $(this).addClass('active');
-                // Update the dropdown toggle text
-                $('#current-language').text(languageNames[optionLang]);
-            } else {
-                $(this).removeClass('active');
-            }
-        });
-    }
-    
-    function translatePage(lang) {
-
-        const langDict = translations[lang] || translations['en'];
-
-        
-        // Count elements to translate
-        const elementsToTranslate = $('[data-translate]');
-
-        
-        // Translate all elements with data-translate attribute
-        $('[data-translate]').each(function() {
-            const key = $(this).data('translate');
-            const translation = langDict[key];
-            if (translation) {
-                $(this).text(translation);
-                // Translation applied
-            } else {
-                // No translation found
-            }
-        });
-        
-        // Translate placeholders
-        $('[data-translate-placeholder]').each(function() {
-            const key = $(this).data('translate-placeholder');
-            const translation = langDict[key];
-            if (translation) {
-                $(this).attr('placeholder', translation);
-                // Placeholder translated
-            } else {
-                // No placeholder translation found
-            }
-        });
-        
-        // Update HTML lang attribute
-        $('html').attr('lang', lang);
-
-    }
-    
-    // Initialize on page load
-    $(document).ready(function() {
-
-        
-        // Set up event listeners for language selector
-        $('.language-option').on('click', function(e) {
-
-            e.preventDefault();
-            const lang = $(this).data('lang');
-            switchLanguage(lang);
-        });
-        
-        // Test if language options exist
-
-        $('.language-option').each(function() {
-
-        });
-        
-        // Initialize language system
-
-        updateLanguageDisplay(currentLanguage);
-        translatePage(currentLanguage);
-        
-        // Set active language option
-        $('.language-option').each(function() {
-            const optionLang = $(this).data('lang');
-            if (optionLang === currentLanguage) {
-                $(this).addClass('active');
-            }
-        });
-        
-
-    });
-    </script>
-    
-    {{ scripts | safe if scripts else '' }}
-</body>
-</html>
-"""
-
-# Landing page content
-LANDING_CONTENT = """
-<div class="container">
-    <div class="text-center">
-        <h1 class="display-4 mb-4">🚀 <span data-translate="content_creator_pro">Content Creator Pro</span></h1>
-        <p class="lead mb-5"><span data-translate="ai_powered_platform">AI-Powered Content Generation Platform</span></p>
-        <div class="row">
-            <div class="col-md-4">
-                <div class="feature-card">
-                    <h3><i class="fas fa-share-alt me-2"></i><span data-translate="multi_platform_content">Multi-Platform Content</span></h3>
-                    <p><span data-translate="generate_content_for">Generate content for</span> <b><span data-translate="platforms_list">LinkedIn, Facebook, Instagram, Twitter, YouTube, and blogs</span></b>.</p>
-                </div>
-            </div>
-            <div class="col-md-4">
-                <div class="feature-card">
-                    <h3><i class="fas fa-bullseye me-2"></i><span data-translate="smart_direction">Smart Direction</span></h3>
-                    <p><span data-translate="content_directions_desc">18 content directions with</span> <b><span data-translate="regional_context">regional and cultural context</span></b>.</p>
-                </div>
-            </div>
-            <div class="col-md-4">
-                <div class="feature-card">
-                    <h3><i class="fas fa-brain me-2"></i><span data-translate="ai_powered">AI-Powered</span></h3>
-                    <p><span data-translate="advanced_ai_generation">Advanced AI content generation with</span> <b><span data-translate="tone_customization">tone and style customization</span></b>.</p>
-                </div>
-            </div>
-        </div>
-        <div class="mt-5">
-            <a href="/generator" class="btn btn-primary btn-lg me-3">
-                <i class="fas fa-magic me-2"></i><span data-translate="start_creating">Start Creating</span>
-            </a>
-            <button class="btn btn-outline-light btn-lg" onclick="showDemo()">
-                <i class="fas fa-play me-2"></i><span data-translate="try_demo">Try Demo</span>
-            </button>
-        </div>
-    </div>
-</div>
-"""
-
-# Generator page content - Updated to match wireframes
-GENERATOR_CONTENT = """
-<div class="container">
-    <div class="row justify-content-center">
-        <div class="col-lg-10">
-            <div class="text-center mb-5">
-                <h1><i class="fas fa-magic me-2"></i><span data-translate="content_generator">Content Generator</span></h1>
-                <p class="lead"><span data-translate="create_engaging_content">Create engaging content with AI assistance</span></p>
-            </div>
-            
-            <!-- Step Progress -->
-            <div class="step-progress">
-                <div class="step active">1</div>
-                <div class="step">2</div>
-                <div class="step">3</div>
-                <div class="step">4</div>
-                <div class="step">5</div>
-            </div>
-            
-            <div class="card">
-                <div class="card-body p-4">
-                    <form id="generatorForm">
-                        <!-- Step 1: Content Direction -->
-                        <div id="step1" class="step-content">
-                            <h3 class="text-center mb-4"><span data-translate="step_1">Step 1</span>: <span data-translate="choose_your_focus">Choose Your Focus</span></h3>
-                            <div class="row">
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="business_finance">
-                                        <i class="fas fa-briefcase"></i>
-                                        <div data-translate="business_finance">Business & Finance</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="technology">
-                                        <i class="fas fa-laptop-code"></i>
-                                        <div data-translate="technology">Technology</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="health_wellness">
-                                        <i class="fas fa-heartbeat"></i>
-                                        <div data-translate="health_wellness">Health & Wellness</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="education">
-                                        <i class="fas fa-graduation-cap"></i>
-                                        <div data-translate="education">Education</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="entertainment">
-                                        <i class="fas fa-film"></i>
-                                        <div data-translate="entertainment">Entertainment</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="travel_tourism">
-                                        <i class="fas fa-plane"></i>
-                                        <div data-translate="travel_tourism">Travel & Tourism</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="food_cooking">
-                                        <i class="fas fa-utensils"></i>
-                                        <div data-translate="food_cooking">Food & Cooking</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="fashion_beauty">
-                                        <i class="fas fa-tshirt"></i>
-                                        <div data-translate="fashion_beauty">Fashion & Beauty</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="sports_fitness">
-                                        <i class="fas fa-dumbbell"></i>
-                                        <div data-translate="sports_fitness">Sports & Fitness</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="science_research">
-                                        <i class="fas fa-microscope"></i>
-                                        <div data-translate="science_research">Science & Research</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="politics_current_events">
-                                        <i class="fas fa-newspaper"></i>
-                                        <div data-translate="politics_news">Politics & News</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="environment_sustainability">
-                                        <i class="fas fa-leaf"></i>
-                                        <div data-translate="environment">Environment</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="personal_development">
-                                        <i class="fas fa-chart-line"></i>
-                                        <div data-translate="personal_dev">Personal Dev</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="parenting_family">
-                                        <i class="fas fa-users"></i>
-                                        <div data-translate="parenting_family">Parenting & Family</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="art_creativity">
-                                        <i class="fas fa-palette"></i>
-                                        <div data-translate="art_creativity">Art & Creativity</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="real_estate">
-                                        <i class="fas fa-home"></i>
-                                        <div data-translate="real_estate">Real Estate</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="automotive">
-                                        <i class="fas fa-car"></i>
-                                        <div data-translate="automotive">Automotive</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-3 col-sm-6">
-                                    <div class="direction-card" data-direction="pet_care">
-                                        <i class="fas fa-paw"></i>
-                                        <div data-translate="pet_care">Pet Care</div>
-                                    </div>
-                                </div>
-                            </div>
-                            <div class="text-center mt-4">
-                                <button type="button" class="btn btn-primary btn-lg" onclick="nextStep()" id="step1Next" disabled>
-                                    <span data-translate="next_step">Next Step</span> <i class="fas fa-arrow-right ms-2"></i>
-                                </button>
-                            </div>
-                        </div>
-                        
-                        <!-- Step 2: Content Type -->
-                        <div id="step2" class="step-content" style="display: none;">
-                            <h3 class="text-center mb-4"><span data-translate="step_2">Step 2</span>: <span data-translate="what_type_content">What Type of Content?</span></h3>
-                            <div class="row">
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-platform="linkedin">
-                                        <i class="fab fa-linkedin"></i>
-                                        <div data-translate="linkedin_post">LinkedIn Post</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-platform="facebook">
-                                        <i class="fab fa-facebook"></i>
-                                        <div data-translate="facebook_post">Facebook Post</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-platform="instagram">
-                                        <i class="fab fa-instagram"></i>
-                                        <div data-translate="instagram_post">Instagram Post</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-platform="twitter">
-                                        <i class="fab fa-twitter"></i>
-                                        <div data-translate="twitter_post">Twitter Post</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-platform="youtube">
-                                        <i class="fab fa-youtube"></i>
-                                        <div data-translate="youtube_short">YouTube Short</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-platform="blog">
-                                        <i class="fas fa-blog"></i>
-                                        <div data-translate="blog_article">Blog Article</div>
-                                    </div>
-                                </div>
-                            </div>
-                            <div class="text-center mt-4">
-                                <button type="button" class="btn btn-secondary btn-lg me-3" onclick="prevStep()">
-                                    <i class="fas fa-arrow-left me-2"></i><span data-translate="previous">Previous</span>
-                                </button>
-                                <button type="button" class="btn btn-primary btn-lg" onclick="nextStep()">
-                                    <span data-translate="next_step">Next Step</span> <i class="fas fa-arrow-right ms-2"></i>
-                                </button>
-                            </div>
-                        </div>
-                        
-                        <!-- Step 3: Inspiration Source -->
-                        <div id="step3" class="step-content" style="display: none;">
-                            <h3 class="text-center mb-4"><span data-translate="step_3">Step 3</span>: <span data-translate="what_inspires_you">What Inspires You?</span></h3>
-                            <div class="row">
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="news">
-                                        <i class="fas fa-newspaper"></i>
-                                        <div data-translate="latest_news">Latest News</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="books">
-                                        <i class="fas fa-book"></i>
-                                        <div data-translate="popular_books">Popular Books</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="threads">
-                                        <i class="fas fa-comments"></i>
-                                        <div data-translate="trending_threads">Trending Threads</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="podcasts">
-                                        <i class="fas fa-podcast"></i>
-                                        <div data-translate="podcasts">Podcasts</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="videos">
-                                        <i class="fas fa-video"></i>
-                                        <div data-translate="youtube_videos">YouTube Videos</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="research">
-                                        <i class="fas fa-file-alt"></i>
-                                        <div data-translate="research_papers">Research Papers</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="case_studies">
-                                        <i class="fas fa-chart-bar"></i>
-                                        <div data-translate="case_studies">Case Studies</div>
-                                    </div>
-                                </div>
-                                <div class="col-md-4 col-sm-6 mb-3">
-                                    <div class="direction-card" data-source="trends">
-                                        <i class="fas fa-fire"></i>
-                                        <div data-translate="trending_topics">Trending Topics</div>
-                                    </div>
-                                </div>
-                            </div>
-                            <div class="text-center mt-4">
-                                <button type="button" class="btn btn-secondary btn-lg me-3" onclick="prevStep()">
-                                    <i class="fas fa-arrow-left me-2"></i><span data-translate="previous">Previous</span>
-                               
-
-# Database initialization and API routes
-@app.route('/api/save-content', methods=['POST'])
-def save_content():
-    """Save generated content to user's library"""
-    try:
-        if 'user' not in session:
-            return jsonify({
-                'success': False,
-                'error': 'User not logged in'
-            }), 401
-        
-        data = request.get_json()
-        user_email = session['user']
-        
-        # Check user content limits
-        user = get_user(user_email)
-        if not user:
-            return jsonify({
-                'success': False,
-                'error': 'User not found'
-            }), 404
-        
-        current_content_count = content_manager.get_content_count(user_email)
-        if current_content_count >= user.content_limit:
-            return jsonify({
-                'success': False,
-                'error': f'Content limit reached ({user.content_limit}). Upgrade your subscription for more content.'
-            }), 403
-        
-        content_entry = content_manager.create_content(
-            user_email=user_email,
-            direction=data.get('direction'),
-            platform=data.get('platform'),
-            source=data.get('source'),
-            topic=data.get('topic'),
-            tone=data.get('tone'),
-            content_text=data.get('content'),
-            language=data.get('language', 'en'),
-            region=data.get('region')
-        )
-        
-        return jsonify({
-            'success': True,
-            'content_id': content_entry.id,
-            'message': 'Content saved successfully'
-        })
+        return jsonify({
+            'success': True,
+            'content_id': content_entry.id,
+            'message': 'Content saved successfully'
+        })
         
     except Exception as e:
         return jsonify({
@@ -6479,6 +5881,13 @@ def upload_image():
                 'error': 'User not found'
             }), 404
         
+        # Reject bodies that cannot fit before reading them
+        if request.content_length and request.content_length > MAX_FILE_SIZE + 64 * 1024:
+            return jsonify({
+                'success': False,
+                'error': f"File size exceeds limit ({MAX_FILE_SIZE / 1024 / 1024}MB)"
+            }), 413
+        
         # Check if file was uploaded
         if 'image' not in request.files:
             return jsonify({
@@ -6519,8 +5928,15 @@ def upload_image():
         # Get content_id if provided
         content_id = request.form.get('content_id')
         
-        # Save image
-        image_record = save_image_file(file, user_email, content_id)
+        # Save image, rejecting it mid-stream if it outgrows the size or storage limit
+        remaining_bytes = int((user.storage_limit_mb - current_storage) * 1024 * 1024)
+        image_record = save_image_file(file, user_email, content_id, quota_bytes=remaining_bytes)
+        prefetch_image_derivatives(image_record)
+        
+        # Warn when the library already holds a near-identical image
+        duplicates = find_similar_images(
+            user_email, image_record.perceptual_hash, DUPLICATE_MAX_DISTANCE, exclude_id=image_record.id
+        )
         
         return jsonify({
             'success': True,
@@ -6529,9 +5945,18 @@ def upload_image():
             'file_size': image_record.file_size,
             'width': image_record.width,
             'height': image_record.height,
+            'possible_duplicates': [
+                {'id': image_id, 'distance': distance, 'url': f'/api/images/{image_id}'}
+                for distance, image_id in duplicates
+            ],
             'message': 'Image uploaded successfully'
         })
         
+    except StorageQuotaExceeded as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 403
     except ValueError as e:
         return jsonify({
             'success': False,
@@ -6543,15 +5968,100 @@ def upload_image():
             'error': str(e)
         }), 500
 
+@app.route('/api/upload-images', methods=['POST'])
+def upload_images():
+    """Upload many image files in one request (multipart field ``images``)"""
+    try:
+        if 'user' not in session:
+            return jsonify({
+                'success': False,
+                'error': 'User not logged in'
+            }), 401
+        
+        user_email = session['user']
+        user = get_user(user_email)
+        
+        if not user:
+            return jsonify({
+                'success': False,
+                'error': 'User not found'
+            }), 404
+        
+        files = request.files.getlist('images')
+        if not files:
+            return jsonify({
+                'success': False,
+                'error': 'No image files provided'
+            }), 400
+        if len(files) > UPLOAD_BATCH_MAX_FILES:
+            return jsonify({
+                'success': False,
+                'error': f'Too many files in one upload (maximum {UPLOAD_BATCH_MAX_FILES})'
+            }), 400
+        
+        # Check limits once for the whole batch
+        current_image_count = Image.query.filter_by(user_email=user_email).count()
+        if current_image_count >= user.image_limit:
+            return jsonify({
+                'success': False,
+                'error': f'Image limit reached ({user.image_limit}). Upgrade your subscription for more images.'
+            }), 403
+        
+        current_storage = get_user_storage_usage(user_email)
+        if current_storage >= user.storage_limit_mb:
+            return jsonify({
+                'success': False,
+                'error': f'Storage limit reached ({user.storage_limit_mb}MB). Upgrade your subscription for more storage.'
+            }), 403
+        
+        results, records = save_image_files(
+            files,
+            user_email,
+            image_slots=user.image_limit - current_image_count,
+            quota_bytes=int((user.storage_limit_mb - current_storage) * 1024 * 1024),
+            content_id=request.form.get('content_id')
+        )
+        # Same near-duplicate warning as single uploads; other files of this batch count too
+        results_by_id = {result['image_id']: result for result in results if result.get('success')}
+        for image_record in records:
+            prefetch_image_derivatives(image_record)
+            duplicates = find_similar_images(
+                user_email, image_record.perceptual_hash, DUPLICATE_MAX_DISTANCE, exclude_id=image_record.id
+            )
+            results_by_id[image_record.id]['possible_duplicates'] = [
+                {'id': image_id, 'distance': distance, 'url': f'/api/images/{image_id}'}
+                for distance, image_id in duplicates
+            ]
+        
+        return jsonify({
+            'success': bool(records),
+            'results': results,
+            'uploaded': len(records),
+            'failed': len(results) - len(records),
+            'message': f'{len(records)} of {len(results)} images uploaded'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/images/<image_id>', methods=['GET'])
 def get_image(image_id):
-    """Get image file"""
+    """Get image file (owner only)"""
     try:
+        if 'user' not in session:
+            return jsonify({
+                'success': False,
+                'error': 'User not logged in'
+            }), 401
+        
         image = Image.query.get(image_id)
-        if not image:
+        if not image or image.user_email != session['user']:
             return jsonify({
                 'success': False,
-                'error': 'Image not found'
+                'error': 'Image not found or access denied'
             }), 404
         
         # Check if file exists
@@ -6561,8 +6071,111 @@ def get_image(image_id):
                 'error': 'Image file not found'
             }), 404
         
-        # Return image file
-        return send_file(image.file_path, mimetype=image.mime_type)
+        # Return image file (bytes are immutable per image, so the content hash is a strong ETag)
+        return send_image_file(
+            image.file_path,
+            image.mime_type,
+            etag=image.content_hash,
+            last_modified=image.created_at
+        )
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/images/<image_id>/similar', methods=['GET'])
+def get_similar_images(image_id):
+    """List the user's images that look like this one (``?max_distance=`` bits, default IMAGE_SIMILAR_DISTANCE)"""
+    try:
+        if 'user' not in session:
+            return jsonify({
+                'success': False,
+                'error': 'User not logged in'
+            }), 401
+        
+        user_email = session['user']
+        image = Image.query.get(image_id)
+        if not image or image.user_email != user_email:
+            return jsonify({
+                'success': False,
+                'error': 'Image not found or access denied'
+            }), 404
+        
+        max_distance = min(request.args.get('max_distance', SIMILAR_MAX_DISTANCE, type=int), 32)
+        if image.perceptual_hash is None and os.path.exists(image.file_path):
+            # Not reached by the backfill yet: fingerprint just this image
+            image.perceptual_hash = compute_perceptual_hash(image.file_path) or ''
+            db.session.commit()
+        matches = find_similar_images(user_email, image.perceptual_hash, max_distance, exclude_id=image.id)
+        
+        images_by_id = {img.id: img for img in Image.query.filter(Image.id.in_([image_id for _, image_id in matches]))}
+        similar = []
+        for distance, match_id in matches:
+            img = images_by_id.get(match_id)
+            if img is None:
+                continue
+            similar.append({
+                'id': img.id,
+                'filename': img.original_filename,
+                'width': img.width,
+                'height': img.height,
+                'file_size': img.file_size,
+                'distance': distance,
+                'duplicate': distance <= DUPLICATE_MAX_DISTANCE,
+                'url': f'/api/images/{img.id}',
+                'thumbnail_url': f'/api/images/{img.id}/thumb'
+            })
+        
+        return jsonify({
+            'success': True,
+            'image_id': image.id,
+            'similar': similar,
+            'total': len(similar)
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/images/<image_id>/<variant>', methods=['GET'])
+def get_image_variant(image_id, variant):
+    """Get a resized, re-encoded variant of an image (thumb, feed or a platform name; owner only)"""
+    try:
+        if 'user' not in session:
+            return jsonify({
+                'success': False,
+                'error': 'User not logged in'
+            }), 401
+        
+        image = Image.query.get(image_id)
+        if not image or image.user_email != session['user'] or not os.path.exists(image.file_path):
+            return jsonify({
+                'success': False,
+                'error': 'Image not found or access denied'
+            }), 404
+        
+        requested_format = request.args.get('format')
+        spec = image_derivatives.resolve_variant(variant, PLATFORM_IMAGE_SPECS)
+        fmt = image_derivatives.negotiate_format(request.headers.get('Accept', ''), requested_format)
+        if spec is None or fmt is None:
+            return jsonify({
+                'success': False,
+                'error': f'Unsupported image variant or format: {variant}'
+            }), 400
+        
+        path = image_derivatives.get(get_derivative_key(image), image.file_path, variant, spec, fmt)
+        if path is None:
+            # Still rendering: fall back to the original this once
+            return redirect(url_for('get_image', image_id=image_id))
+        
+        response = send_image_file(path, image_derivatives.mimetype(fmt))
+        if not requested_format:
+            response.vary.add('Accept')
+        return response
         
     except Exception as e:
         return jsonify({
@@ -6625,7 +6238,10 @@ def get_user_images():
                 'created_at': img.created_at.isoformat(),
                 'content_id': img.content_id,
                 'alt_text': img.alt_text,
-                'caption': img.caption
+                'caption': img.caption,
+                'url': f'/api/images/{img.id}',
+                'thumbnail_url': f'/api/images/{img.id}/thumb',
+                'feed_url': f'/api/images/{img.id}/feed'
             })
         
         return jsonify({
@@ -6772,6 +6388,9 @@ def generate_mock_image(prompt, style):
         'generated_at': datetime.utcnow().isoformat()
     }
 
+# Placeholder cards come from the backend's renderer, which caches fonts, backgrounds and finished cards
+from services.card_renderer import card_renderer
+
 def create_mock_image_record(user_email, mock_data, prompt):
     """Create a mock image record in database"""
     image_id = generate_image_id()
@@ -6779,27 +6398,14 @@ def create_mock_image_record(user_email, mock_data, prompt):
     # Create a placeholder image file
     placeholder_path = os.path.join(UPLOAD_FOLDER, f"{image_id}.png")
     
-    # Create a simple placeholder image using PIL
+    # Create a placeholder image (rendered once per style, then reused)
+    width, height = card_renderer.size_for(None)
     try:
-        from PIL import Image as PILImage, ImageDraw, ImageFont
-        
-        # Create a 1200x630 image (social media optimized)
-        img = PILImage.new('RGB', (1200, 630), color='#667EEA')
-        draw = ImageDraw.Draw(img)
-        
-        # Add text
-        try:
-            font = ImageFont.truetype("arial.ttf", 40)
-        except:
-            font = ImageFont.load_default()
-        
-        # Draw title
-        draw.text((600, 200), "AI Generated Image", fill='white', anchor='mm', font=font)
-        draw.text((600, 280), f"Style: {mock_data['style'].title()}", fill='white', anchor='mm', font=font)
-        draw.text((600, 360), "Content Creator Pro", fill='white', anchor='mm', font=font)
-        
-        # Save image
-        img.save(placeholder_path)
+        with open(placeholder_path, 'wb') as f:
+            f.write(card_renderer.render(
+                'placeholder', "AI Generated Image",
+                subtitle=f"Style: {mock_data['style'].title()}", style=mock_data['style']
+            ))
         
         # Create database record
         image_record = Image(
@@ -6810,8 +6416,8 @@ def create_mock_image_record(user_email, mock_data, prompt):
             file_path=placeholder_path,
             file_size=os.path.getsize(placeholder_path),
             mime_type='image/png',
-            width=1200,
-            height=630,
+            width=width,
+            height=height,
             alt_text=f"AI generated image in {mock_data['style']} style",
             caption=prompt[:100] + "..." if len(prompt) > 100 else prompt
         )
@@ -6845,6 +6451,202 @@ def create_mock_image_record(user_email, mock_data, prompt):
         
         return image_record
 
+# Orphan scanner: files under UPLOAD_FOLDER that no record references, and records whose file is gone
+ORPHAN_SCAN_WORKERS = int(os.environ.get('ORPHAN_SCAN_WORKERS', 8))
+ORPHAN_SCAN_BATCH_SIZE = int(os.environ.get('ORPHAN_SCAN_BATCH_SIZE', 1000))
+# Files younger than this may belong to an upload that has not committed yet
+ORPHAN_MIN_AGE_SECONDS = int(os.environ.get('ORPHAN_MIN_AGE_SECONDS', 3600))
+# Run the scan in the background every N seconds (0 disables it)
+ORPHAN_SCAN_INTERVAL = int(os.environ.get('ORPHAN_SCAN_INTERVAL', 0))
+ORPHAN_SCAN_RECLAIM = os.environ.get('ORPHAN_SCAN_RECLAIM', 'false').lower() == 'true'
+ORPHAN_REPORT_LIMIT = 100
+
+def is_protected_upload_path(path):
+    """Dot-entries (staging, in-progress writes, lock files) and lock files are never orphans"""
+    relative = os.path.relpath(path, UPLOAD_FOLDER)
+    return any(part.startswith('.') for part in relative.split(os.sep)) or path.endswith('.lock')
+
+def scan_upload_tree(path):
+    """List (path, size, mtime) for every file below ``path`` with os.scandir, skipping dot-entries"""
+    files = []
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if is_protected_upload_path(entry.path):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((entry.path, stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            continue
+    return files
+
+def iter_upload_files(executor):
+    """Yield lists of upload files, one per top-level entry, scanning the subtrees in parallel
+    
+    Derivatives are skipped; they are checked per image key instead. So are
+    dot-entries and lock files, which belong to running jobs.
+    """
+    subtrees, loose = [], []
+    with os.scandir(UPLOAD_FOLDER) as entries:
+        for entry in entries:
+            if is_protected_upload_path(entry.path):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path != DERIVATIVE_FOLDER:
+                    subtrees.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                loose.append((entry.path, stat.st_size, stat.st_mtime))
+    
+    yield loose
+    for files in executor.map(scan_upload_tree, subtrees):
+        yield files
+
+def find_unreferenced_paths(paths):
+    """Return the subset of ``paths`` that no Image or ImageBlob row points at"""
+    referenced = {path for (path,) in db.session.query(Image.file_path).filter(Image.file_path.in_(paths))}
+    referenced.update(path for (path,) in db.session.query(ImageBlob.file_path).filter(ImageBlob.file_path.in_(paths)))
+    return [path for path in paths if path not in referenced]
+
+def find_unreferenced_derivative_keys(keys):
+    """Return the derivative keys (content hash or image id) with no matching image"""
+    referenced = {key for (key,) in db.session.query(Image.content_hash).filter(Image.content_hash.in_(keys))}
+    referenced.update(key for (key,) in db.session.query(Image.id).filter(Image.id.in_(keys)))
+    return [key for key in keys if key not in referenced]
+
+def scan_orphans(dry_run=True, workers=None, batch_size=None, min_age=None):
+    """Find (and unless ``dry_run``, delete) files in UPLOAD_FOLDER that nothing references
+    
+    The tree is walked with os.scandir in parallel and compared with the
+    database in batches of ``batch_size`` paths, so memory stays bounded. Image
+    rows whose file is missing are only reported: they belong to users and need
+    a decision, not a cleanup. Returns a report with throughput stats.
+    """
+    import time
+    
+    workers = workers or ORPHAN_SCAN_WORKERS
+    batch_size = batch_size or ORPHAN_SCAN_BATCH_SIZE
+    cutoff = time.time() - (ORPHAN_MIN_AGE_SECONDS if min_age is None else min_age)
+    started = time.monotonic()
+    report = {
+        'dry_run': dry_run,
+        'files_scanned': 0,
+        'bytes_scanned': 0,
+        'orphan_files': 0,
+        'orphan_bytes': 0,
+        'orphan_derivative_sets': 0,
+        'reclaimed_files': 0,
+        'reclaimed_bytes': 0,
+        'missing_files': 0,
+        'orphans': [],
+        'missing': []
+    }
+    
+    def handle_orphans(batch):
+        sizes = {path: size for path, size in batch}
+        for path in find_unreferenced_paths(list(sizes)):
+            report['orphan_files'] += 1
+            report['orphan_bytes'] += sizes[path]
+            if len(report['orphans']) < ORPHAN_REPORT_LIMIT:
+                report['orphans'].append(path)
+            # Never delete a lock or staging file, even if a caller passes one in
+            if not dry_run and not is_protected_upload_path(path):
+                try:
+                    os.remove(path)
+                    report['reclaimed_files'] += 1
+                    report['reclaimed_bytes'] += sizes[path]
+                except FileNotFoundError:
+                    pass
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='orphan-scan') as executor:
+        # Files without any referencing row
+        batch = []
+        for files in iter_upload_files(executor):
+            for path, size, mtime in files:
+                report['files_scanned'] += 1
+                report['bytes_scanned'] += size
+                if mtime > cutoff:
+                    continue
+                batch.append((path, size))
+                if len(batch) >= batch_size:
+                    handle_orphans(batch)
+                    batch = []
+        if batch:
+            handle_orphans(batch)
+        
+        # Derivative sets whose source image is gone
+        keys = list(image_derivatives.keys())
+        for start in range(0, len(keys), batch_size):
+            for key in find_unreferenced_derivative_keys(keys[start:start + batch_size]):
+                report['orphan_derivative_sets'] += 1
+                if not dry_run:
+                    delete_image_derivatives(key)
+        
+        # Rows whose file is missing, checked in parallel per batch
+        query = db.session.query(Image.id, Image.file_path).order_by(Image.id).yield_per(batch_size)
+        rows = []
+        
+        def check_missing(rows):
+            for (image_id, path), exists in zip(rows, executor.map(os.path.exists, [path for _, path in rows])):
+                if not exists:
+                    report['missing_files'] += 1
+                    if len(report['missing']) < ORPHAN_REPORT_LIMIT:
+                        report['missing'].append({'image_id': image_id, 'file_path': path})
+        
+        for row in query:
+            rows.append(row)
+            if len(rows) >= batch_size:
+                check_missing(rows)
+                rows = []
+        if rows:
+            check_missing(rows)
+    
+    elapsed = time.monotonic() - started
+    report['elapsed_seconds'] = round(elapsed, 3)
+    report['files_per_second'] = round(report['files_scanned'] / elapsed) if elapsed else report['files_scanned']
+    return report
+
+@app.cli.command('scan-orphans')
+@click.option('--reclaim', is_flag=True, help='Delete orphaned files instead of only reporting them')
+@click.option('--workers', type=int, default=None, help='Parallel directory scanners')
+@click.option('--batch-size', type=int, default=None, help='Paths compared with the database per query')
+@click.option('--min-age', type=int, default=None, help='Ignore files modified less than this many seconds ago')
+def scan_orphans_command(reclaim, workers, batch_size, min_age):
+    """Report (or with --reclaim, delete) upload files no image references"""
+    import json
+    
+    report = scan_orphans(dry_run=not reclaim, workers=workers, batch_size=batch_size, min_age=min_age)
+    click.echo(json.dumps(report, indent=2))
+
+def run_orphan_scans():
+    """Background loop for ORPHAN_SCAN_INTERVAL; a lock file keeps it to one worker per host"""
+    import fcntl
+    import time
+    
+    while True:
+        time.sleep(ORPHAN_SCAN_INTERVAL)
+        try:
+            with open(os.path.join(UPLOAD_FOLDER, '.orphan-scan.lock'), 'a') as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                with app.app_context():
+                    report = scan_orphans(dry_run=not ORPHAN_SCAN_RECLAIM)
+                    db.session.remove()
+                print(f"Orphan scan: {report['orphan_files']} orphaned files ({report['orphan_bytes']} bytes), "
+                      f"{report['missing_files']} missing files, {report['files_per_second']} files/s")
+        except Exception as e:
+            print(f"Orphan scan error: {e}")
+
+if ORPHAN_SCAN_INTERVAL > 0:
+    threading.Thread(target=run_orphan_scans, name='orphan-scan', daemon=True).start()
+
 # Initialize database on startup
 with app.app_context():
     try:
@@ -6854,5 +6656,9 @@ with app.app_context():
     except Exception as e:
         print(f"Database initialization error: {e}")
 
+# Fingerprint legacy uploads in the background once the tables exist
+if os.environ.get('PERCEPTUAL_BACKFILL_ON_START', 'true').lower() == 'true':
+    threading.Thread(target=run_perceptual_backfill, name='perceptual-backfill', daemon=True).start()
+
 if __name__ == '__main__':
     app.run()
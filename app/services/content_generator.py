@@ -1,14 +1,23 @@
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from flask import current_app
 from .stable_diffusion import StableDiffusionService
 
 class ContentGenerator:
     """Content generation service using DeepSeek AI and Stable Diffusion"""
     
+    # Variation styles and the prompt instruction used for each
+    VARIATION_STYLES = [
+        ('Storytelling', 'Variation 1: Focus on storytelling and personal connection'),
+        ('Data-driven', 'Variation 2: Emphasize data and statistics'),
+        ('Humorous', 'Variation 3: Use humor and lighthearted approach')
+    ]
+    
     def __init__(self):
         self.api_key = current_app.config.get('DEEPSEEK_API_KEY')
         self.api_base = current_app.config.get('DEEPSEEK_API_BASE', 'https://api.deepseek.com')
+        self.variations_mode = current_app.config.get('DEEPSEEK_VARIATIONS_MODE', 'batch')
         self.stable_diffusion = StableDiffusionService()
         
         # Content templates for different platforms
@@ -120,11 +129,8 @@ Requirements:
             direction_context=direction_context
         )
         
-        # Generate content using DeepSeek
-        generated_text = self._call_deepseek_api(prompt, template_config['max_length'])
-        
-        # Generate variations
-        variations = self._generate_variations(prompt, template_config['max_length'])
+        # Generate content and variations using DeepSeek
+        generated_text, variations = self._generate_content_with_variations(prompt, template_config['max_length'])
         
         # Generate media suggestions
         media_suggestions = self._generate_media_suggestions(content_type, content_direction, specific_content)
@@ -907,34 +913,105 @@ Requirements:
         else:
             return f"Generated content based on: {prompt[:100]}... (Mock response for development)"
     
-    def _generate_variations(self, prompt, max_length):
-        """Generate content variations"""
-        variations = []
+    def _generate_content_with_variations(self, prompt, max_length):
+        """Generate the main content and its variations
         
-        # Generate 3 variations with different approaches
-        variation_prompts = [
-            prompt + "\n\nVariation 1: Focus on storytelling and personal connection",
-            prompt + "\n\nVariation 2: Emphasize data and statistics",
-            prompt + "\n\nVariation 3: Use humor and lighthearted approach"
-        ]
+        In 'batch' mode everything is requested in a single structured completion;
+        if that fails, or in 'parallel' mode, the four calls are issued concurrently.
+        """
+        if self.api_key and self.variations_mode == 'batch':
+            batch = self._call_deepseek_batch(prompt, max_length)
+            if batch is not None:
+                return batch
         
-        for i, var_prompt in enumerate(variation_prompts, 1):
-            try:
-                variation_content = self._call_deepseek_api(var_prompt, max_length)
-                variations.append({
-                    'id': i,
-                    'content': variation_content,
-                    'style': ['Storytelling', 'Data-driven', 'Humorous'][i-1]
-                })
-            except Exception:
-                # Add mock variation
-                variations.append({
-                    'id': i,
-                    'content': f"Variation {i}: {self._generate_mock_content(prompt, max_length)}",
-                    'style': ['Storytelling', 'Data-driven', 'Humorous'][i-1]
-                })
+        variation_prompts = [prompt + f"\n\n{instruction}" for _, instruction in self.VARIATION_STYLES]
+        with ThreadPoolExecutor(max_workers=1 + len(variation_prompts)) as executor:
+            main_future = executor.submit(self._call_deepseek_api, prompt, max_length)
+            variation_futures = [executor.submit(self._call_deepseek_api, var_prompt, max_length)
+                                 for var_prompt in variation_prompts]
+            generated_text = main_future.result()
+            variation_contents = []
+            for i, future in enumerate(variation_futures, 1):
+                try:
+                    variation_contents.append(future.result())
+                except Exception:
+                    # Add mock variation
+                    variation_contents.append(f"Variation {i}: {self._generate_mock_content(prompt, max_length)}")
+        
+        return generated_text, self._build_variations(variation_contents)
+    
+    def _call_deepseek_batch(self, prompt, max_length):
+        """Request the main content and all variations in one DeepSeek completion
+        
+        Returns ``(content, variations)`` or None when the response is unusable.
+        """
+        styles = '\n'.join(f'- "{style}": {instruction.split(": ", 1)[1]}' for style, instruction in self.VARIATION_STYLES)
+        batch_prompt = (
+            prompt
+            + "\n\nWrite the main post and one variation for each of these styles:\n"
+            + styles
+            + '\n\nRespond with a JSON object of the form {"content": "<main post>", "variations": '
+            + '[{"style": "<style>", "content": "<post>"}, ...]} and nothing else. '
+            + "Every post must follow all of the requirements above."
+        )
         
-        return variations
+        try:
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json'
+            }
+            
+            data = {
+                'model': 'deepseek-chat',
+                'messages': [
+                    {
+                        'role': 'system',
+                        'content': 'You are a professional content creator specializing in social media and blog content. Generate high-quality, engaging content that follows the provided specifications exactly. Always answer with valid JSON.'
+                    },
+                    {
+                        'role': 'user',
+                        'content': batch_prompt
+                    }
+                ],
+                'max_tokens': min(max_length * 2 * (1 + len(self.VARIATION_STYLES)), 8000),
+                'temperature': 0.7,
+                'top_p': 0.9,
+                'response_format': {'type': 'json_object'}
+            }
+            
+            response = requests.post(
+                f'{self.api_base}/v1/chat/completions',
+                headers=headers,
+                json=data,
+                timeout=60
+            )
+            
+            if response.status_code != 200:
+                return None
+            
+            result = json.loads(response.json()['choices'][0]['message']['content'])
+            content = result['content'].strip()
+            by_style = {item['style']: item['content'].strip() for item in result['variations']}
+            variation_contents = [by_style[style] for style, _ in self.VARIATION_STYLES]
+            if not content or not all(variation_contents):
+                return None
+            
+            return content, self._build_variations(variation_contents)
+            
+        except Exception:
+            # Caller falls back to concurrent per-variation calls
+            return None
+    
+    def _build_variations(self, variation_contents):
+        """Pair variation texts with their ids and style labels"""
+        return [
+            {
+                'id': i,
+                'content': variation_content,
+                'style': style
+            }
+            for i, ((style, _), variation_content) in enumerate(zip(self.VARIATION_STYLES, variation_contents), 1)
+        ]
     
     def _generate_media_suggestions(self, content_type, content_direction, source_content):
         """Generate media suggestions for the content"""
@@ -3,6 +3,7 @@ import base64
 import json
 from flask import current_app
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 class StableDiffusionService:
     """Stable Diffusion image generation service"""
@@ -202,6 +203,14 @@ class StableDiffusionService:
     
     def _call_stable_diffusion_api(self, prompt, width, height):
         """Call Stable Diffusion API to generate image"""
+        return self._call_stable_diffusion_api_samples(prompt, width, height, samples=1)[0]
+    
+    def _call_stable_diffusion_api_samples(self, prompt, width, height, samples=1):
+        """Call Stable Diffusion API for ``samples`` images in one request
+        
+        Returns the base64 data of every successful sample; samples the API
+        filtered or failed are dropped, so the list may be shorter than requested.
+        """
         try:
             headers = {
                 'Authorization': f'Bearer {self.api_key}',
@@ -214,7 +223,7 @@ class StableDiffusionService:
                 'cfg_scale': 7,
                 'height': height,
                 'width': width,
-                'samples': 1,
+                'samples': samples,
                 'steps': 30,
                 'style_preset': 'photographic'
             }
@@ -223,15 +232,19 @@ class StableDiffusionService:
                 self.api_base,
                 headers=headers,
                 json=data,
-                timeout=60
+                # Larger batches take proportionally longer to render
+                timeout=60 + 30 * (samples - 1)
             )
             
             if response.status_code == 200:
                 result = response.json()
-                if 'artifacts' in result and len(result['artifacts']) > 0:
+                images = [
+                    artifact['base64'] for artifact in result.get('artifacts', [])
+                    if artifact.get('base64') and artifact.get('finishReason', 'SUCCESS') == 'SUCCESS'
+                ]
+                if images:
                     # Return base64 encoded image data
-                    image_data = result['artifacts'][0]['base64']
-                    return image_data
+                    return images
                 else:
                     raise Exception("No image generated in response")
             else:
@@ -242,19 +255,95 @@ class StableDiffusionService:
             current_app.logger.error(f"Stable Diffusion API error: {str(e)}")
             raise e
     
-    def generate_multiple_images(self, platform, content_direction, topic, tone, count=3):
-        """Generate multiple image variations"""
+    def generate_multiple_images(self, platform, content_direction, topic, tone, count=3, mode=None, max_concurrency=None):
+        """Generate multiple image variations
+        
+        ``mode`` is 'batch' (one API request for ``count`` samples of the same prompt)
+        or 'parallel' (distinct prompt variations rendered concurrently, at most
+        ``max_concurrency`` at a time). Defaults come from SD_MULTI_IMAGE_MODE and
+        SD_MAX_CONCURRENCY. Failed samples are left out, so fewer than ``count``
+        images may be returned.
+        """
+        mode = mode or os.environ.get('SD_MULTI_IMAGE_MODE', 'batch')
+        if count <= 0:
+            return []
+        if mode == 'batch':
+            return self._generate_images_batched(platform, content_direction, topic, tone, count)
+        return self._generate_images_parallel(platform, content_direction, topic, tone, count, max_concurrency)
+    
+    def _generate_images_batched(self, platform, content_direction, topic, tone, count):
+        """Render ``count`` samples of one prompt in a single API request"""
         images = []
         
-        for i in range(count):
-            try:
+        try:
+            platform_config = self.platform_configs.get(platform, self.platform_configs['facebook'])
+            if platform_config['aspect_ratio'] not in self.supported_ratios:
+                platform_config = self._get_closest_supported_ratio(platform)
+            aspect_ratio = platform_config['aspect_ratio']
+            width = self.supported_ratios[aspect_ratio]['width']
+            height = self.supported_ratios[aspect_ratio]['height']
+            
+            prompt = self._build_image_prompt(content_direction, topic, tone, platform)
+            
+            # The API accepts at most 10 samples per request
+            for offset in range(0, count, 10):
+                samples = min(10, count - offset)
+                try:
+                    batch = self._call_stable_diffusion_api_samples(prompt, width, height, samples=samples)
+                except Exception as e:
+                    current_app.logger.error(f"Error generating image batch of {samples}: {str(e)}")
+                    continue
+                
+                for image_data in batch:
+                    images.append({
+                        'image_data': image_data,
+                        'platform': platform,
+                        'dimensions': {
+                            'width': width,
+                            'height': height,
+                            'aspect_ratio': aspect_ratio
+                        },
+                        'format': platform_config['format'],
+                        'file_size': len(image_data),
+                        'prompt_used': prompt,
+                        'content_direction': content_direction,
+                        'topic': topic,
+                        'tone': tone,
+                        'variation': len(images) + 1
+                    })
+                    
+        except Exception as e:
+            current_app.logger.error(f"Error generating image batch: {str(e)}")
+        
+        if len(images) < count:
+            current_app.logger.warning(f"Generated {len(images)} of {count} requested images")
+        return images
+    
+    def _generate_images_parallel(self, platform, content_direction, topic, tone, count, max_concurrency=None):
+        """Render distinct prompt variations concurrently with a concurrency cap"""
+        max_concurrency = max_concurrency or int(os.environ.get('SD_MAX_CONCURRENCY', 3))
+        app = current_app._get_current_object()
+        
+        def render(i):
+            # Worker threads need their own app context for logging
+            with app.app_context():
                 # Slightly vary the prompt for each image
                 varied_topic = f"{topic} - variation {i+1}"
-                image_result = self.generate_image(platform, content_direction, varied_topic, tone)
+                return self.generate_image(platform, content_direction, varied_topic, tone)
+        
+        images = []
+        with ThreadPoolExecutor(max_workers=min(count, max_concurrency)) as executor:
+            futures = [executor.submit(render, i) for i in range(count)]
+            for i, future in enumerate(futures):
+                try:
+                    image_result = future.result()
+                except Exception as e:
+                    current_app.logger.error(f"Error generating image variation {i+1}: {str(e)}")
+                    continue
+                if 'error' in image_result:
+                    current_app.logger.error(f"Error generating image variation {i+1}: {image_result['error']}")
+                    continue
                 images.append(image_result)
-            except Exception as e:
-                current_app.logger.error(f"Error generating image variation {i+1}: {str(e)}")
-                continue
         
         return images
     
@@ -102,6 +102,20 @@ except Exception as e:
     print(f"❌ Error registering routes: {e}")
     # Continue with basic app functionality
 
+# Background image rendering
+try:
+    from services.image_jobs import image_jobs
+    image_jobs.init_app(app)
+except Exception as e:
+    print(f"⚠️ Image job queue unavailable: {e}")
+
+# Shared Google Search client (one per process instead of one per request)
+try:
+    from services import google_search_service
+    google_search_service.init_app(app)
+except Exception as e:
+    print(f"⚠️ Google Search service unavailable: {e}")
+
 # Health check endpoint
 @app.route('/health')
 def health_check():
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the image_jobs table used by background image rendering
+Run this to update the database schema
+"""
+
+from dotenv import load_dotenv
+from app import app, db
+from models import ImageJob
+
+def add_image_jobs_table():
+    with app.app_context():
+        try:
+            # checkfirst makes the script safe to run more than once
+            ImageJob.__table__.create(db.engine, checkfirst=True)
+            
+            print("✅ image_jobs table ready!")
+            
+        except Exception as e:
+            print(f"❌ Error: {e}")
+
+if __name__ == '__main__':
+    load_dotenv()
+    add_image_jobs_table()
@@ -72,4 +72,25 @@ class Image(db.Model):
     # Image metadata
     alt_text = db.Column(db.String(500), nullable=True)
     caption = db.Column(db.String(500), nullable=True)
-    tags = db.Column(db.String(500), nullable=True)  # JSON string of tags 
\ No newline at end of file
+    tags = db.Column(db.String(500), nullable=True)  # JSON string of tags 
+
+
+class ImageJob(db.Model):
+    __tablename__ = 'image_jobs'
+    id = db.Column(db.String(32), primary_key=True)
+    user_email = db.Column(db.String(120), nullable=True)
+    kind = db.Column(db.String(30), nullable=False)  # prompt, content, multi_platform
+    params = db.Column(db.Text, nullable=False)  # JSON string of render parameters
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Execution state
+    status = db.Column(db.String(20), default='queued')  # queued, running, succeeded, failed
+    progress = db.Column(db.Integer, default=0)  # 0-100
+    attempts = db.Column(db.Integer, default=0)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    # Outcome
+    result = db.Column(db.Text, nullable=True)  # JSON string with the stored image reference
+    error = db.Column(db.Text, nullable=True)
@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context
 from models import db, User, Content
 import uuid
+import json
 import random
 import os
 from sqlalchemy import text
@@ -16,12 +17,15 @@ except ImportError:
 
 # Import Google Search services
 try:
-    from services.google_search_service import GoogleSearchService
+    from services.google_search_service import get_google_search_service, debug_log
     GOOGLE_SERVICE_AVAILABLE = True
 except ImportError:
     GOOGLE_SERVICE_AVAILABLE = False
     print("Warning: Google Search service not available.")
 
+    def debug_log(message):
+        pass
+
 api_routes = Blueprint('api', __name__)
 
 @api_routes.route('/test', methods=['GET'])
@@ -1155,148 +1159,38 @@ def get_recommended_frequency(platform):
 
 def get_platform_specifications(platform):
     """Get platform-specific image specifications."""
-    # This is a simplified example. A real implementation would involve AI models.
-    return {
-        'facebook': {'width': 1200, 'height': 628, 'aspect_ratio': '2:1'},
-        'instagram': {'width': 1080, 'height': 1080, 'aspect_ratio': '1:1'},
-        'linkedin': {'width': 1200, 'height': 628, 'aspect_ratio': '2:1'},
-        'twitter': {'width': 1024, 'height': 512, 'aspect_ratio': '2:1'},
-        'youtube_shorts': {'width': 1080, 'height': 1920, 'aspect_ratio': '9:16'},
-        'blog': {'width': 1200, 'height': 628, 'aspect_ratio': '2:1'}
-    }
+    from services.platform_specs import PLATFORM_IMAGE_SPECS
+    # Copies, so callers can adjust a spec without changing the shared table
+    return {name: dict(spec) for name, spec in PLATFORM_IMAGE_SPECS.items()}
 
 @api_routes.route('/generate', methods=['POST'])
 def generate_content():
     """Generate content based on user input using AI workflow"""
+    if 'text/event-stream' in request.headers.get('Accept', ''):
+        return generate_content_stream()
+    
     try:
         data = request.get_json()
-        
-        # Extract parameters with new structure
-        direction = data.get('direction', 'business_finance')
-        platform = data.get('platform', 'linkedin')
-        post_type = data.get('postType', 'posts')
-        source = data.get('source', 'personal_experience')
-        source_details = data.get('sourceDetails', {})
-        selected_topic = data.get('selectedTopic', 'Business Strategy')
-        tone = data.get('tone', 'professional')
-        language = data.get('language', 'en')
-        image_style = data.get('imageStyle', 'professional')
-        generate_images = data.get('generate_images', True)
+        params = extract_generation_params(data)
         
         # Generate content text based on parameters
-        content_text = generate_content_text(direction, platform, source, selected_topic, tone, language)
+        content_text = generate_content_text(
+            params['direction'], params['platform'], params['source'], params['selected_topic'],
+            params['tone'], params['language'], use_cache=not params['bypass_cache']
+        )
         
         # Generate images using Stable Diffusion
-        generated_images = {'primary': None, 'variations': [], 'total_count': 0}
-        if generate_images:
-            try:
-                from services.stable_diffusion import StableDiffusionService
-                from flask import current_app
-                
-                # Create image prompt based on content and style
-                image_prompt = f"Professional {image_style} style image for {platform} post about {selected_topic} in {direction.replace('_', ' ')} category, high quality, trending on artstation"
-                
-                # Generate image with proper app context
-                with current_app.app_context():
-                    stable_diffusion = StableDiffusionService()
-                    primary_image = stable_diffusion.generate_image_with_prompt(
-                        platform=platform,
-                        prompt=image_prompt,
-                        content_direction=direction,
-                        topic=selected_topic,
-                        tone=tone,
-                        language=language
-                    )
-                
-                if 'error' not in primary_image and primary_image.get('image_data'):
-                    # Store the image data and return a hash reference
-                    import hashlib
-                    image_hash = hashlib.md5(f"{platform}_{selected_topic}_{image_style}".encode()).hexdigest()
-                    
-                    # Store in application cache
-                    if not hasattr(current_app, 'image_cache'):
-                        current_app.image_cache = {}
-                    current_app.image_cache[image_hash] = primary_image.get('image_data')
-                    
-                    generated_images = {
-                        'primary': image_hash,
-                        'variations': [],
-                        'total_count': 1,
-                        'prompt_used': image_prompt
-                    }
-                else:
-                    generated_images = {
-                        'primary': None,
-                        'variations': [],
-                        'total_count': 0,
-                        'note': 'Image generation failed',
-                        'error': primary_image.get('error', 'Unknown error')
-                    }
-                
-            except Exception as e:
-                print(f"Error in image generation: {str(e)}")
-                generated_images = {
-                    'primary': None,
-                    'variations': [],
-                    'total_count': 0,
-                    'note': f'Image generation error: {str(e)}'
-                }
-        else:
-            generated_images = {
-                'primary': None,
-                'variations': [],
-                'total_count': 0,
-                'note': 'Image generation disabled'
-            }
-        
-        # Build comprehensive response
-        response = {
-            'content': {
-                'text': content_text,
-                'length': len(content_text),
-                'max_length': 1300,
-                'hashtags': extract_hashtags(content_text),
-                'call_to_action': extract_call_to_action(content_text),
-                'word_count': len(content_text.split()),
-                'readability_score': calculate_readability_score(content_text)
-            },
-            'variations': [],
-            'images': generated_images,
-            'media_suggestions': {
-                'images': [f"Professional {direction} related image"],
-                'videos': [],
-                'graphics': []
-            },
-            'platform_specifications': get_platform_specifications(platform),
-            'metadata': {
-                'content_direction': direction,
-                'content_type': platform,
-                'post_type': post_type,
-                'source_type': source,
-                'source_details': source_details,
-                'selected_topic': selected_topic,
-                'tone': tone,
-                'region': 'global',
-                'language': language,
-                'image_style': image_style,
-                'generated_at': datetime.utcnow().isoformat() + 'Z',
-                'platform': platform.upper(),
-                'content_category': direction,
-                'ai_enhanced': True
-            },
-            'analytics': generate_analytics_data(platform, direction, tone, content_text),
-            'validation': {
-                'compliance_check': validate_content(content_text, platform),
-                'quality_score': calculate_content_quality_score(content_text, platform),
-                'optimization_suggestions': generate_optimization_suggestions(content_text, platform),
-                'performance_insights': generate_performance_insights(platform)
-            }
-        }
+        generated_images = generate_content_images(params)
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'data': response
+            'data': build_generation_response(params, content_text, generated_images)
         })
+        if generated_images.get('job_id'):
+            # Text is ready; the image is still rendering in the background
+            response.status_code = 202
+            response.headers['Location'] = generated_images['status_url']
+        return response
         
     except Exception as e:
         print(f"Error in generate_content: {str(e)}")
@@ -1305,7 +1199,254 @@ def generate_content():
             'error': str(e)
         }), 500
 
-def generate_content_text(direction, platform, source, topic, tone, language):
+@api_routes.route('/generate/stream', methods=['POST'])
+def generate_content_stream():
+    """Stream generated content as server-sent events.
+    
+    Emits ``delta`` events carrying text fragments as DeepSeek produces them and a
+    final ``done`` event with the same payload ``/generate`` returns (hashtags,
+    analytics, image references). Errors are reported as an ``error`` event.
+    """
+    data = request.get_json() or {}
+    params = extract_generation_params(data)
+    
+    def event_stream():
+        try:
+            chunks = []
+            for delta in stream_content_text(params):
+                chunks.append(delta)
+                yield format_sse('delta', {'text': delta})
+            
+            content_text = ''.join(chunks).strip()
+            generated_images = generate_content_images(params)
+            yield format_sse('done', {
+                'success': True,
+                'data': build_generation_response(params, content_text, generated_images)
+            })
+        except Exception as e:
+            print(f"Error in generate_content_stream: {str(e)}")
+            yield format_sse('error', {'success': False, 'error': str(e)})
+    
+    return Response(
+        stream_with_context(event_stream()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+def format_sse(event, payload):
+    """Serialize one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+def is_async_request(data=None):
+    """Whether the caller asked for image rendering to run as a background job"""
+    flag = request.args.get('async')
+    if flag is None and data:
+        flag = data.get('async')
+    return str(flag).lower() in ('1', 'true', 'yes')
+
+def submit_image_job(kind, params):
+    """Queue a Stable Diffusion render and describe the job for the response"""
+    from services.image_jobs import image_jobs
+    
+    job = image_jobs.submit(kind, params, user_email=session.get('user'))
+    return {
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': f'/api/jobs/{job.id}'
+    }
+
+def image_job_accepted(kind, params):
+    """Queue an image job and answer 202, or 429 when the job backlog is full"""
+    from services.image_jobs import JobQueueFull
+    
+    try:
+        job = submit_image_job(kind, params)
+    except JobQueueFull as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 429
+    
+    response = jsonify({
+        'success': True,
+        'data': job
+    })
+    response.status_code = 202
+    response.headers['Location'] = job['status_url']
+    return response
+
+def extract_generation_params(data):
+    """Read generation parameters from a /generate request body"""
+    return {
+        'direction': data.get('direction', 'business_finance'),
+        'platform': data.get('platform', 'linkedin'),
+        'post_type': data.get('postType', 'posts'),
+        'source': data.get('source', 'personal_experience'),
+        'source_details': data.get('sourceDetails', {}),
+        'selected_topic': data.get('selectedTopic', 'Business Strategy'),
+        'tone': data.get('tone', 'professional'),
+        'language': data.get('language', 'en'),
+        'image_style': data.get('imageStyle', 'professional'),
+        'generate_images': data.get('generate_images', True),
+        'async_images': is_async_request(data),
+        'bypass_cache': data.get('bypass_cache', False)
+    }
+
+def stream_content_text(params):
+    """Yield content text fragments, falling back to a single template block on failure"""
+    try:
+        from services.ai_service import ai_service
+        
+        yield from ai_service.stream_content(
+            direction=params['direction'],
+            platform=params['platform'],
+            source=params['source'],
+            topic=params['selected_topic'],
+            tone=params['tone'],
+            language=params['language'],
+            use_cache=not params['bypass_cache']
+        )
+    except ImportError:
+        yield generate_content_text(
+            params['direction'], params['platform'], params['source'], params['selected_topic'],
+            params['tone'], params['language']
+        )
+
+def generate_content_images(params):
+    """Generate the primary Stable Diffusion image for a generation request"""
+    if not params['generate_images']:
+        return {
+            'primary': None,
+            'variations': [],
+            'total_count': 0,
+            'note': 'Image generation disabled'
+        }
+    
+    platform = params['platform']
+    direction = params['direction']
+    selected_topic = params['selected_topic']
+    image_style = params['image_style']
+    
+    try:
+        from services.stable_diffusion import StableDiffusionService
+        from flask import current_app
+        
+        # Create image prompt based on content and style
+        image_prompt = f"Professional {image_style} style image for {platform} post about {selected_topic} in {direction.replace('_', ' ')} category, high quality, trending on artstation"
+        
+        if params['async_images']:
+            job = submit_image_job('prompt', {
+                'platform': platform,
+                'prompt': image_prompt,
+                'content_direction': direction,
+                'topic': selected_topic,
+                'tone': params['tone'],
+                'language': params['language']
+            })
+            return {
+                'primary': None,
+                'variations': [],
+                'total_count': 0,
+                'prompt_used': image_prompt,
+                **job
+            }
+        
+        # Generate image with proper app context
+        with current_app.app_context():
+            stable_diffusion = StableDiffusionService()
+            primary_image = stable_diffusion.generate_image_with_prompt(
+                platform=platform,
+                prompt=image_prompt,
+                content_direction=direction,
+                topic=selected_topic,
+                tone=params['tone'],
+                language=params['language']
+            )
+        
+        if 'error' not in primary_image and primary_image.get('image_data'):
+            # Store the image in the shared on-disk store and return its content hash
+            from services.image_store import image_store
+            from services.image_derivatives import image_derivatives, SIZE_PRESETS
+            image_hash = image_store.put_base64(primary_image.get('image_data'))
+            image_derivatives.prefetch(image_hash, image_store.object_path(image_hash), SIZE_PRESETS)
+            
+            return {
+                'primary': image_hash,
+                'variations': [],
+                'total_count': 1,
+                'prompt_used': image_prompt
+            }
+        
+        return {
+            'primary': None,
+            'variations': [],
+            'total_count': 0,
+            'note': 'Image generation failed',
+            'error': primary_image.get('error', 'Unknown error')
+        }
+        
+    except Exception as e:
+        print(f"Error in image generation: {str(e)}")
+        return {
+            'primary': None,
+            'variations': [],
+            'total_count': 0,
+            'note': f'Image generation error: {str(e)}'
+        }
+
+def build_generation_response(params, content_text, generated_images):
+    """Assemble the /generate response payload around the generated text and images"""
+    direction = params['direction']
+    platform = params['platform']
+    tone = params['tone']
+    
+    return {
+        'content': {
+            'text': content_text,
+            'length': len(content_text),
+            'max_length': 1300,
+            'hashtags': extract_hashtags(content_text),
+            'call_to_action': extract_call_to_action(content_text),
+            'word_count': len(content_text.split()),
+            'readability_score': calculate_readability_score(content_text)
+        },
+        'variations': [],
+        'images': generated_images,
+        'media_suggestions': {
+            'images': [f"Professional {direction} related image"],
+            'videos': [],
+            'graphics': []
+        },
+        'platform_specifications': get_platform_specifications(platform),
+        'metadata': {
+            'content_direction': direction,
+            'content_type': platform,
+            'post_type': params['post_type'],
+            'source_type': params['source'],
+            'source_details': params['source_details'],
+            'selected_topic': params['selected_topic'],
+            'tone': tone,
+            'region': 'global',
+            'language': params['language'],
+            'image_style': params['image_style'],
+            'generated_at': datetime.utcnow().isoformat() + 'Z',
+            'platform': platform.upper(),
+            'content_category': direction,
+            'ai_enhanced': True
+        },
+        'analytics': generate_analytics_data(platform, direction, tone, content_text),
+        'validation': {
+            'compliance_check': validate_content(content_text, platform),
+            'quality_score': calculate_content_quality_score(content_text, platform),
+            'optimization_suggestions': generate_optimization_suggestions(content_text, platform),
+            'performance_insights': generate_performance_insights(platform)
+        }
+    }
+
+def generate_content_text(direction, platform, source, topic, tone, language, use_cache=True):
     """Generate content text based on parameters using AI service with proper formats"""
     
     try:
@@ -1320,7 +1461,8 @@ def generate_content_text(direction, platform, source, topic, tone, language):
             topic=topic,
             tone=tone,
             language=language,
-            generate_images=False  # Images are handled separately
+            generate_images=False,  # Images are handled separately
+            use_cache=use_cache
         )
         
         return content_text
@@ -1584,6 +1726,63 @@ def extract_visual_elements(content_text, direction, tone):
     
     return tone_visuals
 
+@api_routes.route('/analyze', methods=['POST'])
+def analyze_content():
+    """Run the AI analysis calls for a piece of content concurrently"""
+    try:
+        data = request.get_json() or {}
+        
+        content = data.get('content')
+        if not content:
+            return jsonify({
+                'success': False,
+                'error': 'Content is required'
+            }), 400
+        
+        if not AI_SERVICE_AVAILABLE:
+            return jsonify({
+                'success': False,
+                'error': 'AI service not available'
+            }), 503
+        
+        timeout = data.get('timeout')
+        if timeout is not None:
+            try:
+                timeout = float(timeout)
+            except (TypeError, ValueError):
+                timeout = None
+            if timeout is None or not 0 < timeout < float('inf'):
+                return jsonify({
+                    'success': False,
+                    'error': 'timeout must be a positive number of seconds'
+                }), 400
+        
+        try:
+            analysis = ai_service.analyze_concurrently(
+                content=content,
+                platform=data.get('platform', 'linkedin'),
+                direction=data.get('direction', 'business_finance'),
+                tone=data.get('tone', 'professional'),
+                tasks=data.get('tasks'),
+                timeout=timeout
+            )
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'data': analysis
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @api_routes.route('/translate', methods=['POST'])
 def translate_content():
     """Translate content between languages"""
@@ -1658,6 +1857,20 @@ def get_directions():
         'directions': CONTENT_DIRECTIONS
     })
 
+@api_routes.route('/ai/stats', methods=['GET'])
+def get_ai_stats():
+    """Get response cache, request coalescing and search quota counters"""
+    from services.llm_cache import llm_cache
+    from services.single_flight import single_flight
+    from services.search_cache import search_cache
+    
+    return jsonify({
+        'success': True,
+        'cache': dict(llm_cache.stats),
+        'single_flight': dict(single_flight.stats),
+        'search_cache': search_cache.get_stats()
+    })
+
 @api_routes.route('/translations', methods=['GET'])
 def get_translations():
     """Get translation dictionary"""
@@ -1711,6 +1924,50 @@ def generate_image():
         tone = data.get('tone', 'professional')
         language = data.get('language', 'en')
         
+        # One render cropped for several platforms
+        platforms = data.get('platforms')
+        if platforms:
+            specs = get_platform_specifications(platform)
+            unknown = [name for name in platforms if name not in specs]
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unsupported platforms: {', '.join(unknown)}"
+                }), 400
+            
+            multi_platform_params = {
+                'targets': {name: specs[name] for name in platforms},
+                'content_direction': content_direction,
+                'topic': topic,
+                'tone': tone,
+                'language': language,
+                'prompt': data.get('prompt')
+            }
+            if is_async_request(data):
+                return image_job_accepted('multi_platform', multi_platform_params)
+            
+            from services.stable_diffusion import StableDiffusionService
+            image_result = StableDiffusionService().generate_multi_platform_images(**multi_platform_params)
+            if 'error' in image_result:
+                return jsonify({
+                    'success': False,
+                    'error': image_result['error']
+                }), 502
+            
+            return jsonify({
+                'success': True,
+                'data': image_result
+            })
+        
+        if is_async_request(data):
+            return image_job_accepted('content', {
+                'platform': platform,
+                'content_direction': content_direction,
+                'topic': topic,
+                'tone': tone,
+                'language': language
+            })
+        
         # Import Stable Diffusion service from backend
         from services.stable_diffusion import StableDiffusionService
         stable_diffusion = StableDiffusionService()
@@ -1952,7 +2209,7 @@ def google_search():
             }), 400
         
         if GOOGLE_SERVICE_AVAILABLE:
-            google_service = GoogleSearchService()
+            google_service = get_google_search_service()
             results = google_service.search(query, country)
             
             return jsonify({
@@ -1980,7 +2237,7 @@ def google_news():
         category = data.get('category', 'all')
         
         if GOOGLE_SERVICE_AVAILABLE:
-            google_service = GoogleSearchService()
+            google_service = get_google_search_service()
             results = google_service.get_news(country, category)
             
             return jsonify({
@@ -2014,7 +2271,7 @@ def google_trends():
             }), 400
         
         if GOOGLE_SERVICE_AVAILABLE:
-            google_service = GoogleSearchService()
+            google_service = get_google_search_service()
             results = google_service.get_trends(query, country)
             
             return jsonify({
@@ -2040,7 +2297,7 @@ def get_youtube_video_info():
         data = request.get_json()
         video_id = data.get('videoId')
         
-        print(f"🔍 DEBUG: YouTube video info request for video ID: {video_id}")
+        debug_log(f"🔍 DEBUG: YouTube video info request for video ID: {video_id}")
         
         if not video_id:
             return jsonify({
@@ -2049,10 +2306,10 @@ def get_youtube_video_info():
             }), 400
         
         if GOOGLE_SERVICE_AVAILABLE:
-            google_service = GoogleSearchService()
-            print(f"🔍 DEBUG: Calling get_youtube_video_details for video ID: {video_id}")
+            google_service = get_google_search_service()
+            debug_log(f"🔍 DEBUG: Calling get_youtube_video_details for video ID: {video_id}")
             video_info = google_service.get_youtube_video_details(video_id)
-            print(f"🔍 DEBUG: Received video info: {video_info}")
+            debug_log(f"🔍 DEBUG: Received video info: {video_info}")
             
             return jsonify({
                 'success': True,
@@ -2087,7 +2344,7 @@ def google_books():
             }), 400
         
         if GOOGLE_SERVICE_AVAILABLE:
-            google_service = GoogleSearchService()
+            google_service = get_google_search_service()
             results = google_service.get_books(query, country)
             
             return jsonify({
@@ -2106,6 +2363,30 @@ def google_books():
             'error': str(e)
         }), 500
 
+def discovery_rotation(kind, data):
+    """Return the (seed, offset) used to pick from a cached discovery pool
+    
+    The seed is fixed per session and the offset advances on every call, so a
+    user sees the pool in a stable shuffled order without repeats until it wraps.
+    Clients without a session cookie can send ``seed`` and ``page`` instead.
+    """
+    if data.get('seed'):
+        # A malformed or negative page starts the rotation from the beginning
+        try:
+            page = max(int(data.get('page', 0)), 0)
+        except (TypeError, ValueError, OverflowError):
+            page = 0
+        return str(data['seed']), page
+    
+    seed = session.get('discovery_seed')
+    if seed is None:
+        seed = session['discovery_seed'] = uuid.uuid4().hex
+    offsets = dict(session.get('discovery_offsets', {}))
+    offset = offsets.get(kind, 0)
+    offsets[kind] = offset + 1
+    session['discovery_offsets'] = offsets
+    return seed, offset
+
 @api_routes.route('/videos/generate-link', methods=['POST'])
 def generate_video_link():
     """Generate popular video links based on direction and categories"""
@@ -2134,8 +2415,9 @@ def generate_video_link():
         search_query = ' '.join(search_terms)
         
         # Use Google Search service to find real videos (with web scraping fallback)
-        google_service = GoogleSearchService()
-        videos = google_service.search_youtube_videos(direction, category_keywords, country)
+        google_service = get_google_search_service()
+        seed, offset = discovery_rotation('videos', data)
+        videos = google_service.search_youtube_videos(direction, category_keywords, country, seed=seed, offset=offset)
         
         return jsonify({
             'success': True,
@@ -2157,14 +2439,14 @@ def generate_video_link():
 @api_routes.route('/podcasts/generate-link', methods=['POST'])
 def generate_podcast_link():
     """Generate popular podcast links based on direction and categories"""
-    print(f"🎤 DEBUG: Podcast API called with data: {request.get_json()}")
+    debug_log(f"🎤 DEBUG: Podcast API called with data: {request.get_json()}")
     try:
         data = request.get_json()
         direction = data.get('direction', '')
         categories = data.get('categories', {})
         country = data.get('country', 'US')
         
-        print(f"🎤 DEBUG: Extracted - direction={direction}, categories={categories}, country={country}")
+        debug_log(f"🎤 DEBUG: Extracted - direction={direction}, categories={categories}, country={country}")
         
         # Extract category keywords for search
         category_keywords = []
@@ -2185,10 +2467,11 @@ def generate_podcast_link():
         search_query = ' '.join(search_terms)
         
         # Use Google Search service to find real podcasts (with web scraping fallback)
-        print(f"🎤 DEBUG: Calling GoogleSearchService.search_podcasts()")
-        google_service = GoogleSearchService()
-        podcasts = google_service.search_podcasts(direction, category_keywords, country)
-        print(f"🎤 DEBUG: GoogleSearchService returned {len(podcasts)} podcasts")
+        debug_log(f"🎤 DEBUG: Calling GoogleSearchService.search_podcasts()")
+        google_service = get_google_search_service()
+        seed, offset = discovery_rotation('podcasts', data)
+        podcasts = google_service.search_podcasts(direction, category_keywords, country, seed=seed, offset=offset)
+        debug_log(f"🎤 DEBUG: GoogleSearchService returned {len(podcasts)} podcasts")
         
         # Create search query for display
         search_terms = [direction.replace('_', ' ')]
@@ -2207,8 +2490,8 @@ def generate_podcast_link():
                 'message': f'Found {len(podcasts)} podcasts for {direction.replace("_", " ")} using real Google search'
             }
         }
-        print(f"🎤 DEBUG: Returning response with {len(podcasts)} podcasts")
-        print(f"🎤 DEBUG: First podcast title: {podcasts[0]['title'] if podcasts else 'None'}")
+        debug_log(f"🎤 DEBUG: Returning response with {len(podcasts)} podcasts")
+        debug_log(f"🎤 DEBUG: First podcast title: {podcasts[0]['title'] if podcasts else 'None'}")
         return jsonify(response_data)
     except Exception as e:
         return jsonify({
@@ -2277,35 +2560,158 @@ def debug_google_search():
             'error': str(e)
         }), 500
 
+@api_routes.route('/jobs/<job_id>', methods=['GET'])
+def get_image_job(job_id):
+    """Get the status and result of a background image job"""
+    try:
+        from services.image_jobs import image_jobs
+        
+        job = image_jobs.get(job_id)
+        # Jobs queued by a signed-in user are theirs alone; anonymous jobs are reachable only by their random id
+        if job is None or (job.user_email and job.user_email != session.get('user')):
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': image_jobs.to_dict(job)
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@api_routes.route('/image/<image_hash>/<variant>', methods=['GET'])
+def get_image_variant(image_hash, variant):
+    """Serve a resized, re-encoded variant of a stored image
+    
+    ``variant`` is ``thumb``, ``feed`` or a platform name from the platform
+    specifications. The format comes from ``?format=`` or, failing that, the best
+    of AVIF/WebP the client accepts. Variants are rendered once in the background
+    and cached on disk.
+    """
+    try:
+        from flask import send_file
+        from services.image_store import image_store
+        from services.image_derivatives import image_derivatives
+        
+        image_info = image_store.info(image_hash)
+        if image_info is None:
+            return jsonify({
+                'success': False,
+                'error': 'Image not found or expired'
+            }), 404
+        
+        spec = image_derivatives.resolve_variant(variant, get_platform_specifications(variant))
+        requested_format = request.args.get('format')
+        fmt = image_derivatives.negotiate_format(request.headers.get('Accept', ''), requested_format)
+        if spec is None or fmt is None:
+            return jsonify({
+                'success': False,
+                'error': f'Unsupported image variant or format: {variant}'
+            }), 400
+        
+        path = image_derivatives.get(image_hash, image_info['path'], variant, spec, fmt)
+        if path is None:
+            # Still rendering: point the client at the original for now
+            response = jsonify({
+                'success': False,
+                'error': 'Image variant is being generated',
+                'original_url': f'/api/image/{image_hash}'
+            })
+            response.status_code = 503
+            response.headers['Retry-After'] = '2'
+            return response
+        
+        response = send_file(
+            path,
+            mimetype=image_derivatives.mimetype(fmt),
+            conditional=True,
+            etag=f'{image_hash}-{variant}-{fmt}',
+            max_age=31536000
+        )
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        if not requested_format:
+            response.vary.add('Accept')
+        response.headers.add('Access-Control-Allow-Origin', '*')
+        return response
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @api_routes.route('/image/<image_hash>', methods=['GET'])
 def get_image(image_hash):
-    """Get image data by hash reference"""
+    """Serve a stored image by its content hash
+    
+    Images are returned as binary with a strong ETag and immutable caching, and
+    support conditional and range requests. ``?format=json`` returns the legacy
+    base64 JSON envelope for older clients.
+    """
     try:
-        from flask import current_app
+        from flask import send_file
+        from services.image_store import image_store
         
-        # Check if image exists in cache
-        if not hasattr(current_app, 'image_cache') or image_hash not in current_app.image_cache:
+        # Check if image exists in the store
+        image_info = image_store.info(image_hash)
+        if image_info is None:
             return jsonify({
                 'success': False,
                 'error': 'Image not found or expired'
             }), 404
         
-        image_data = current_app.image_cache[image_hash]
-        
-        # Return image as base64 data with CORS headers
-        response = jsonify({
-            'success': True,
-            'data': {
-                'image_data': image_data,
-                'format': 'base64',
-                'hash': image_hash
-            }
-        })
+        if request.args.get('format') == 'json':
+            import base64
+            
+            # The image may have been evicted since info() was read
+            image_bytes = image_store.get(image_hash)
+            if image_bytes is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Image not found or expired'
+                }), 404
+            image_data = base64.b64encode(image_bytes).decode('ascii')
+            
+            # Return image as base64 data with CORS headers
+            response = jsonify({
+                'success': True,
+                'data': {
+                    'image_data': image_data,
+                    'format': 'base64',
+                    'hash': image_hash
+                }
+            })
+        else:
+            # The URL is content-addressed, so the image can be cached forever
+            try:
+                response = send_file(
+                    image_info['path'],
+                    mimetype=image_info['content_type'],
+                    conditional=True,
+                    etag=image_hash,
+                    last_modified=image_info['created_at'],
+                    max_age=31536000
+                )
+            except FileNotFoundError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Image not found or expired'
+                }), 404
+            response.cache_control.public = True
+            response.cache_control.immutable = True
         
         # Add CORS headers for frontend access
         response.headers.add('Access-Control-Allow-Origin', '*')
-        response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
+        response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Range, If-None-Match')
         response.headers.add('Access-Control-Allow-Methods', 'GET')
+        response.headers.add('Access-Control-Expose-Headers', 'ETag, Content-Length, Content-Range, Accept-Ranges')
         
         return response
         
@@ -2313,4 +2719,57 @@ def get_image(image_hash):
         return jsonify({
             'success': False,
             'error': str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+@api_routes.route('/thumb', methods=['GET'])
+def get_thumbnail():
+    """Serve remote video and podcast artwork shrunk to card size
+    
+    ``?url=`` is the original thumbnail URL (allowlisted hosts only) and
+    ``?size=`` one of ``video``, ``square`` or ``small``. Each source is fetched
+    once and cached on disk; sources that fail are remembered for a while so
+    broken links do not cost an upstream request every time.
+    """
+    try:
+        from flask import send_file, redirect
+        from services.thumbnail_proxy import thumbnail_proxy, ThumbnailUnavailable, PIL_AVAILABLE
+        
+        url = request.args.get('url', '')
+        size = request.args.get('size', 'video')
+        try:
+            if not PIL_AVAILABLE:
+                # Nothing to resize with; send the browser to the allowlisted original instead
+                thumbnail_proxy.validate(url, size)
+                return redirect(url, 302)
+            path = thumbnail_proxy.get(url, size)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except ThumbnailUnavailable as e:
+            response = jsonify({
+                'success': False,
+                'error': str(e)
+            })
+            response.status_code = 404
+            response.cache_control.public = True
+            response.cache_control.max_age = thumbnail_proxy.negative_ttl
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response
+        
+        response = send_file(
+            path,
+            mimetype='image/jpeg',
+            conditional=True,
+            max_age=int(os.environ.get('THUMB_MAX_AGE', 604800))
+        )
+        response.cache_control.public = True
+        response.headers.add('Access-Control-Allow-Origin', '*')
+        return response
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
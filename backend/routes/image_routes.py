@@ -13,7 +13,7 @@ except ImportError:
     print("Info: Cloudinary not available - using Stable Diffusion for image generation")
 
 try:
-    from PIL import Image as PILImage, ImageDraw, ImageFont
+    from PIL import Image as PILImage
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -67,6 +67,18 @@ def generate_image():
         except ImportError:
             image_prompt = generate_image_prompt(content_text, image_style, platform, direction)
         
+        from routes.api_routes import image_job_accepted, is_async_request
+        if is_async_request(data):
+            # Render in the background; the client polls /api/jobs/<id>
+            return image_job_accepted('prompt', {
+                'platform': platform,
+                'prompt': image_prompt,
+                'content_direction': direction,
+                'topic': content_text[:50],
+                'tone': 'professional',
+                'language': 'en'
+            })
+        
         # Generate image using Stable Diffusion
         try:
             from services.stable_diffusion import StableDiffusionService
@@ -175,25 +187,11 @@ def create_mock_image(prompt, style, user_email):
         if not PIL_AVAILABLE:
             return "https://via.placeholder.com/1200x630/667EEA/FFFFFF?text=AI+Generated+Image"
             
-        # Create a simple placeholder image using PIL
-        img = PILImage.new('RGB', (1200, 630), color=0x667EEA)  # #667EEA as hex
-        draw = ImageDraw.Draw(img)
-        
-        # Add text
-        try:
-            font = ImageFont.truetype("arial.ttf", 40)
-        except:
-            font = ImageFont.load_default()
-        
-        # Draw title
-        draw.text((600, 200), "AI Generated Image", fill='white', anchor='mm', font=font)
-        draw.text((600, 280), f"Style: {style.title()}", fill='white', anchor='mm', font=font)
-        draw.text((600, 360), "Content Creator Pro", fill='white', anchor='mm', font=font)
-        
-        # Save to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
+        # Render (or reuse) the placeholder card
+        from services.card_renderer import card_renderer
+        img_bytes = io.BytesIO(card_renderer.render(
+            'placeholder', "AI Generated Image", subtitle=f"Style: {style.title()}", style=style
+        ))
         
         if CLOUDINARY_AVAILABLE:
             # Upload to Cloudinary
@@ -231,6 +229,59 @@ def create_mock_image(prompt, style, user_email):
         # Fallback: return a placeholder URL
         return "https://via.placeholder.com/1200x630/667EEA/FFFFFF?text=AI+Generated+Image"
 
+@image_routes.route('/card', methods=['POST'])
+def generate_card():
+    """Render a text-overlay card (title or quote) for a post"""
+    try:
+        data = request.get_json() or {}
+        
+        text = data.get('text', '').strip()
+        if not text:
+            return jsonify({
+                'success': False,
+                'error': 'Card text is required'
+            }), 400
+        
+        if not PIL_AVAILABLE:
+            return jsonify({
+                'success': False,
+                'error': 'Image rendering not available'
+            }), 503
+        
+        from services.card_renderer import card_renderer
+        from services.image_store import image_store
+        
+        kind = data.get('kind', 'title')
+        if kind not in ('title', 'quote'):
+            return jsonify({
+                'success': False,
+                'error': 'Card kind must be title or quote'
+            }), 400
+        
+        card = card_renderer.render(
+            kind,
+            text,
+            subtitle=data.get('subtitle'),
+            style=data.get('style', 'modern'),
+            platform=data.get('platform')
+        )
+        image_hash = image_store.put(card)
+        width, height = card_renderer.size_for(data.get('platform'))
+        
+        return jsonify({
+            'success': True,
+            'image_hash': image_hash,
+            'image_url': f'/api/image/{image_hash}',
+            'width': width,
+            'height': height
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @image_routes.route('/upload', methods=['POST'])
 def upload_image():
     """Upload image file"""
@@ -314,6 +365,165 @@ def upload_image():
             'error': str(e)
         }), 500
 
+UPLOAD_BATCH_WORKERS = int(os.environ.get('UPLOAD_BATCH_WORKERS', 4))
+UPLOAD_BATCH_MAX_FILES = int(os.environ.get('UPLOAD_BATCH_MAX_FILES', 200))
+
+def get_upload_size(file):
+    """Size of an uploaded file in bytes, measured without reading it"""
+    file.stream.seek(0, os.SEEK_END)
+    size = file.stream.tell()
+    file.stream.seek(0)
+    return size
+
+def upload_to_cloudinary(file, user_email):
+    """Upload one file of a batch (runs in the worker pool, outside the app context)"""
+    return cloudinary.uploader.upload(
+        file,
+        folder=f"content_creator/{user_email.replace('@', '_at_')}",
+        public_id=f"uploaded_{uuid.uuid4().hex[:8]}",
+        overwrite=True
+    )
+
+@image_routes.route('/upload/batch', methods=['POST'])
+def upload_images_batch():
+    """Upload many image files in one request (multipart field ``images``)
+    
+    Limits are checked once for the batch against the file sizes, so files that
+    do not fit are never sent. The rest are uploaded to Cloudinary from a
+    bounded worker pool, and all records are committed together. The response
+    has one result per file, in request order.
+    """
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if not CLOUDINARY_AVAILABLE:
+            return jsonify({
+                'success': False,
+                'error': 'Image uploads are not available'
+            }), 503
+        
+        if 'user' not in session:
+            return jsonify({
+                'success': False,
+                'error': 'User not logged in'
+            }), 401
+        
+        user_email = session['user']
+        user = User.query.get(user_email)
+        
+        if not user:
+            return jsonify({
+                'success': False,
+                'error': 'User not found'
+            }), 404
+        
+        files = [file for file in request.files.getlist('images') if file.filename]
+        if not files:
+            return jsonify({
+                'success': False,
+                'error': 'No image files provided'
+            }), 400
+        if len(files) > UPLOAD_BATCH_MAX_FILES:
+            return jsonify({
+                'success': False,
+                'error': f'Too many files in one upload (maximum {UPLOAD_BATCH_MAX_FILES})'
+            }), 400
+        
+        # Check limits once for the whole batch
+        current_image_count, used_bytes = db.session.query(
+            db.func.count(Image.id), db.func.coalesce(db.func.sum(Image.file_size), 0)
+        ).filter(Image.user_email == user_email).one()
+        image_slots = user.image_limit - current_image_count
+        quota_bytes = user.storage_limit_mb * 1024 * 1024 - used_bytes
+        if image_slots <= 0:
+            return jsonify({
+                'success': False,
+                'error': f'Image limit reached ({user.image_limit}). Upgrade your subscription for more images.'
+            }), 403
+        
+        # Admit files in request order while they fit the remaining count and storage;
+        # the rest are not sent to Cloudinary at all
+        results = [None] * len(files)
+        admitted = []
+        reserved_bytes = 0
+        for index, file in enumerate(files):
+            size = get_upload_size(file)
+            if len(admitted) >= image_slots:
+                error = f'Image limit reached ({user.image_limit}). Upgrade your subscription for more images.'
+            elif reserved_bytes + size > quota_bytes:
+                error = f'Storage limit reached ({user.storage_limit_mb}MB). Upgrade your subscription for more storage.'
+            else:
+                admitted.append(index)
+                reserved_bytes += size
+                continue
+            results[index] = {'filename': file.filename, 'success': False, 'error': error}
+        
+        with ThreadPoolExecutor(max_workers=UPLOAD_BATCH_WORKERS, thread_name_prefix='upload') as executor:
+            futures = {index: executor.submit(upload_to_cloudinary, files[index], user_email) for index in admitted}
+        
+        records = []
+        for index, future in futures.items():
+            file = files[index]
+            try:
+                result = future.result()
+            except Exception as e:
+                results[index] = {'filename': file.filename, 'success': False, 'error': str(e)}
+                continue
+            
+            # Cloudinary may store more bytes than were sent; the quota still applies to what it kept
+            if result['bytes'] > quota_bytes:
+                try:
+                    cloudinary.uploader.destroy(result['public_id'])
+                except Exception as e:
+                    print(f"Could not remove over-quota upload {result['public_id']}: {e}")
+                results[index] = {
+                    'filename': file.filename,
+                    'success': False,
+                    'error': f'Storage limit reached ({user.storage_limit_mb}MB). Upgrade your subscription for more storage.'
+                }
+                continue
+            quota_bytes -= result['bytes']
+            
+            image_record = Image(
+                id=generate_image_id(),
+                user_email=user_email,
+                filename=result['public_id'],
+                original_filename=file.filename,
+                file_path=result['secure_url'],
+                file_size=result['bytes'],
+                mime_type=result['format'],
+                width=result.get('width'),
+                height=result.get('height')
+            )
+            db.session.add(image_record)
+            records.append(image_record)
+            results[index] = {
+                'filename': file.filename,
+                'success': True,
+                'image_id': image_record.id,
+                'image_url': result['secure_url'],
+                'file_size': result['bytes'],
+                'width': result.get('width'),
+                'height': result.get('height')
+            }
+        
+        db.session.commit()
+        
+        return jsonify({
+            'success': bool(records),
+            'results': results,
+            'uploaded': len(records),
+            'failed': len(results) - len(records),
+            'message': f'{len(records)} of {len(results)} images uploaded'
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @image_routes.route('/list', methods=['GET'])
 def list_images():
     """Get user's images"""
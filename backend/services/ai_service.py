@@ -1,11 +1,19 @@
 import os
-import requests
 import json
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional
+
+from .http_client import http_client
+from .llm_cache import llm_cache
+from .single_flight import single_flight
 
 class DeepSeekAIService:
     """Service for interacting with DeepSeek AI API"""
     
+    # Analysis calls that can be fanned out together by analyze_concurrently
+    ANALYSIS_TASKS = ('quality', 'hashtags', 'optimization_suggestions', 'enhanced_content', 'image_prompt')
+    
     def __init__(self):
         self.api_key = os.environ.get('DEEPSEEK_API_KEY')
         self.base_url = "https://api.deepseek.com/v1"
@@ -13,52 +21,210 @@ class DeepSeekAIService:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Shared pool so concurrent requests cannot open an unbounded number of upstream calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.environ.get('AI_FANOUT_MAX_WORKERS', 10)),
+            thread_name_prefix='deepseek-fanout'
+        )
+    
+    def analyze_concurrently(self, content: str, platform: str, direction: str, tone: str = 'professional',
+                             tasks: Optional[List[str]] = None, timeout: Optional[float] = None) -> Dict[str, any]:
+        """Run a subset of the analysis calls for one piece of content at the same time
+
+        ``tasks`` is any subset of ``ANALYSIS_TASKS`` (all of them by default). Every
+        task gets an entry in ``results`` with its ``status`` (ok/error/timeout),
+        ``elapsed`` seconds and either ``data`` or ``error``, so one slow or failing
+        call never hides the others. Wall-clock time is bounded by the slowest call,
+        or by ``timeout`` when given.
+        """
+        
+        calls = {
+            'quality': lambda: self.analyze_content_quality(content, platform, direction),
+            'hashtags': lambda: self.generate_hashtags(content, direction, platform),
+            'optimization_suggestions': lambda: self.generate_optimization_suggestions(content, platform),
+            'enhanced_content': lambda: self.enhance_content(content, platform, tone, direction),
+            'image_prompt': lambda: self.generate_image_prompt(content, direction, platform)
+        }
+        
+        requested = list(tasks) if tasks else list(self.ANALYSIS_TASKS)
+        unknown = [name for name in requested if name not in calls]
+        if unknown:
+            raise ValueError(f"Unknown analysis tasks: {', '.join(unknown)}")
+        
+        def timed(call):
+            started = time.monotonic()
+            return call(), time.monotonic() - started
+        
+        started = time.monotonic()
+        futures = {name: self._executor.submit(timed, calls[name]) for name in dict.fromkeys(requested)}
+        wait(futures.values(), timeout=timeout)
+        
+        results = {}
+        for name, future in futures.items():
+            if not future.done():
+                future.cancel()
+                results[name] = {'status': 'timeout', 'elapsed': round(time.monotonic() - started, 3)}
+                continue
+            try:
+                data, elapsed = future.result()
+                results[name] = {'status': 'ok', 'elapsed': round(elapsed, 3), 'data': data}
+            except Exception as e:
+                print(f"Error in concurrent analysis task {name}: {str(e)}")
+                results[name] = {'status': 'error', 'elapsed': round(time.monotonic() - started, 3), 'error': str(e)}
+        
+        return {
+            'results': results,
+            'elapsed': round(time.monotonic() - started, 3),
+            'success': all(result['status'] == 'ok' for result in results.values())
+        }
     
-    def generate_content(self, direction: str, platform: str, source: str, topic: str, tone: str, language: str = 'en', generate_images: bool = True) -> str:
-        """Generate content using DeepSeek AI"""
+    def generate_content(self, direction: str, platform: str, source: str, topic: str, tone: str, language: str = 'en', generate_images: bool = True, use_cache: bool = True) -> str:
+        """Generate content using DeepSeek AI
+
+        Identical prompts are served from the response cache unless ``use_cache`` is False.
+        """
         
         if not self.api_key:
             return self._fallback_content_generation(direction, platform, source, topic, tone, language)
         
         try:
-            # Create a detailed prompt for better content generation
-            prompt = self._create_content_prompt(direction, platform, source, topic, tone, language)
+            payload = self._build_content_payload(direction, platform, source, topic, tone, language)
             
-            payload = {
-                "model": "deepseek-chat",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional content creator specializing in social media content generation. Create engaging, platform-specific content that resonates with the target audience."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 1000,
-                "temperature": 0.7
-            }
+            cache_key = llm_cache.make_key(payload)
+            if use_cache:
+                cached_content = llm_cache.get(cache_key)
+                if cached_content is not None:
+                    return cached_content
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
+            def request_content():
+                response = http_client.post(
+                    f"{self.base_url}/chat/completions",
+                    headers=self.headers,
+                    json=payload,
+                    timeout=30
+                )
+                
+                if response.status_code != 200:
+                    print(f"DeepSeek API error: {response.status_code} - {response.text}")
+                    return None
+                
                 result = response.json()
                 content = result['choices'][0]['message']['content'].strip()
+                llm_cache.set(cache_key, content)
                 return content
-            else:
-                print(f"DeepSeek API error: {response.status_code} - {response.text}")
+            
+            # Identical prompts already in flight (here or, when enabled, in another worker) share one call
+            content = single_flight.do(
+                cache_key,
+                request_content,
+                recheck=(lambda: llm_cache.get(cache_key)) if use_cache else None
+            )
+            if content is None:
                 return self._fallback_content_generation(direction, platform, source, topic, tone, language)
+            return content
                 
         except Exception as e:
             print(f"Error calling DeepSeek API: {str(e)}")
             return self._fallback_content_generation(direction, platform, source, topic, tone, language)
     
+    def stream_content(self, direction: str, platform: str, source: str, topic: str, tone: str, language: str = 'en', use_cache: bool = True) -> Iterator[str]:
+        """Generate content using DeepSeek AI, yielding text fragments as they arrive
+
+        Cached completions are yielded as a single fragment. If the request fails before
+        any text was produced the fallback template is yielded instead; a failure
+        mid-stream is raised so the caller can report it.
+        """
+        
+        if not self.api_key:
+            yield self._fallback_content_generation(direction, platform, source, topic, tone, language)
+            return
+        
+        payload = self._build_content_payload(direction, platform, source, topic, tone, language)
+        cache_key = llm_cache.make_key(payload)
+        if use_cache:
+            cached_content = llm_cache.get(cache_key)
+            if cached_content is not None:
+                yield cached_content
+                return
+        
+        chunks = []
+        try:
+            response = http_client.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=dict(payload, stream=True),
+                timeout=30,
+                stream=True
+            )
+            
+            if response.status_code != 200:
+                print(f"DeepSeek API error: {response.status_code} - {response.text}")
+                response.close()
+                yield self._fallback_content_generation(direction, platform, source, topic, tone, language)
+                return
+            
+            with response:
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    data = line[len('data:'):].strip()
+                    if data == '[DONE]':
+                        break
+                    delta = json.loads(data)['choices'][0].get('delta', {}).get('content')
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+                        
+        except Exception as e:
+            print(f"Error streaming from DeepSeek API: {str(e)}")
+            if chunks:
+                raise
+            yield self._fallback_content_generation(direction, platform, source, topic, tone, language)
+            return
+        
+        llm_cache.set(cache_key, ''.join(chunks).strip())
+    
+    def _post_chat_completion(self, payload: Dict[str, any], timeout: float = 30):
+        """POST a chat completion, coalescing identical payloads that are already in flight
+
+        The response body is read before it is shared, so every caller can use it.
+        """
+        
+        def request_completion():
+            response = http_client.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=payload,
+                timeout=timeout
+            )
+            response.content
+            return response
+        
+        return single_flight.do(f"chat:{llm_cache.make_key(payload)}", request_completion)
+    
+    def _build_content_payload(self, direction: str, platform: str, source: str, topic: str, tone: str, language: str) -> Dict[str, any]:
+        """Build the chat completion payload for content generation"""
+        
+        # Create a detailed prompt for better content generation
+        prompt = self._create_content_prompt(direction, platform, source, topic, tone, language)
+        
+        return {
+            "model": "deepseek-chat",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional content creator specializing in social media content generation. Create engaging, platform-specific content that resonates with the target audience."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": 1000,
+            "temperature": 0.7
+        }
+    
     def _create_content_prompt(self, direction: str, platform: str, source: str, topic: str, tone: str, language: str) -> str:
         """Create a detailed prompt for content generation following platform-specific formats"""
         
@@ -293,12 +459,7 @@ Generate the image prompt now:
                 "temperature": 0.7
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_chat_completion(payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -396,12 +557,7 @@ Provide a JSON response with:
                 "temperature": 0.3
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_chat_completion(payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -466,12 +622,7 @@ Return as a JSON array of strings.
                 "temperature": 0.5
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_chat_completion(payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -527,12 +678,7 @@ Return as a JSON array of suggestion strings.
                 "temperature": 0.4
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_chat_completion(payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -589,12 +735,7 @@ Return the enhanced content only, no explanations.
                 "temperature": 0.6
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_chat_completion(payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -736,12 +877,7 @@ Generate 5 creative topics now:
                 "temperature": 0.8
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            response = self._post_chat_completion(payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
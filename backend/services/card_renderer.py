@@ -0,0 +1,190 @@
+import io
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+try:
+    from PIL import Image as PILImage, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from .platform_specs import PLATFORM_IMAGE_SPECS
+
+# Fonts tried in order; the first one that loads is used for every card
+FONT_CANDIDATES = {
+    'regular': ['DejaVuSans.ttf', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 'arial.ttf', 'Arial.ttf'],
+    'bold': ['DejaVuSans-Bold.ttf', '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 'arialbd.ttf', 'Arial Bold.ttf']
+}
+
+# Card sizes per platform, from the shared platform image specifications
+CARD_SIZES = {name: (spec['width'], spec['height']) for name, spec in PLATFORM_IMAGE_SPECS.items()}
+CARD_SIZES['default'] = (1200, 630)
+
+# Background gradient (top, bottom) and text colour per style
+CARD_STYLES = {
+    'modern': ('#667EEA', '#764BA2', 'white'),
+    'professional': ('#1E3A5F', '#2E5C8A', 'white'),
+    'minimalist': ('#F5F5F5', '#E0E0E0', '#222222'),
+    'vibrant': ('#FF6B6B', '#FFD93D', 'white'),
+    'dark': ('#141E30', '#243B55', 'white'),
+    'nature': ('#134E5E', '#71B280', 'white')
+}
+
+
+@lru_cache(maxsize=64)
+def get_font(size: int, weight: str = 'regular') -> 'ImageFont.ImageFont':
+    """Load a font once per process for each size and weight"""
+    candidates = list(FONT_CANDIDATES.get(weight, FONT_CANDIDATES['regular']))
+    if os.environ.get('CARD_FONT_PATH'):
+        candidates.insert(0, os.environ['CARD_FONT_PATH'])
+    for candidate in candidates:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 has only the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=32)
+def get_template(style: str, size: Tuple[int, int]) -> 'PILImage.Image':
+    """Pre-render the gradient background for a style and size"""
+    top, bottom, _ = CARD_STYLES.get(style, CARD_STYLES['modern'])
+    top_rgb = PILImage.new('RGB', (1, 1), top).getpixel((0, 0))
+    bottom_rgb = PILImage.new('RGB', (1, 1), bottom).getpixel((0, 0))
+
+    # Build a one-pixel-wide gradient and stretch it, instead of drawing every row
+    gradient = PILImage.new('RGB', (1, 256))
+    for y in range(256):
+        t = y / 255
+        gradient.putpixel((0, y), tuple(round(a + (b - a) * t) for a, b in zip(top_rgb, bottom_rgb)))
+    return gradient.resize(size, PILImage.BILINEAR)
+
+
+def wrap_text(text: str, font: 'ImageFont.ImageFont', max_width: int, max_lines: int) -> list:
+    """Greedy word wrap by rendered width, ellipsizing past ``max_lines``"""
+    lines, current = [], ''
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if font.getlength(candidate) <= max_width or not current:
+            current = candidate
+        else:
+            lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        while last and font.getlength(last + '…') > max_width:
+            last = last[:-1]
+        lines[-1] = last.rstrip() + '…'
+    return lines
+
+
+class CardRenderer:
+    """Renders placeholder, title and quote cards as PNG bytes.
+
+    Fonts and gradient backgrounds are cached per process, and finished cards
+    are memoized by their parameters, so repeated placeholders cost a dictionary
+    lookup instead of a render and PNG encode.
+    """
+
+    KINDS = ('placeholder', 'title', 'quote')
+
+    def __init__(self):
+        self.max_entries = int(os.environ.get('CARD_CACHE_ENTRIES', 128))
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'renders': 0}
+
+    @staticmethod
+    def size_for(platform: Optional[str]) -> Tuple[int, int]:
+        return CARD_SIZES.get(platform or 'default', CARD_SIZES['default'])
+
+    def render(self, kind: str, title: str, subtitle: Optional[str] = None, style: str = 'modern',
+               platform: Optional[str] = None) -> bytes:
+        """Return PNG bytes for a card, rendering it only the first time"""
+        if kind not in self.KINDS:
+            raise ValueError(f"Unsupported card kind: {kind}")
+
+        size = self.size_for(platform)
+        key = hashlib.sha256(json.dumps([kind, title, subtitle, style, size]).encode('utf-8')).hexdigest()
+        with self._lock:
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return data
+
+        img = get_template(style, size).copy()
+        getattr(self, f'_draw_{kind}')(ImageDraw.Draw(img), size, title, subtitle, style)
+
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG')
+        data = buffer.getvalue()
+
+        with self._lock:
+            self._cache[key] = data
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            self.stats['renders'] += 1
+        return data
+
+    @staticmethod
+    def _text_color(style: str) -> str:
+        return CARD_STYLES.get(style, CARD_STYLES['modern'])[2]
+
+    def _draw_placeholder(self, draw, size, title, subtitle, style):
+        width, height = size
+        font = get_font(round(height * 0.065))
+        color = self._text_color(style)
+        draw.text((width / 2, height * 0.32), title, fill=color, anchor='mm', font=font)
+        if subtitle:
+            draw.text((width / 2, height * 0.44), subtitle, fill=color, anchor='mm', font=font)
+        draw.text((width / 2, height * 0.57), "Content Creator Pro", fill=color, anchor='mm', font=font)
+
+    def _draw_title(self, draw, size, title, subtitle, style):
+        width, height = size
+        margin = round(width * 0.08)
+        color = self._text_color(style)
+        title_font = get_font(round(min(width, height) * 0.09), 'bold')
+        lines = wrap_text(title, title_font, width - 2 * margin, 4)
+        line_height = round(title_font.size * 1.2)
+
+        subtitle_font = get_font(round(min(width, height) * 0.045))
+        block_height = line_height * len(lines) + (round(subtitle_font.size * 2) if subtitle else 0)
+        y = (height - block_height) / 2
+        for line in lines:
+            draw.text((margin, y), line, fill=color, font=title_font)
+            y += line_height
+        if subtitle:
+            draw.text((margin, y + subtitle_font.size * 0.6), subtitle, fill=color, font=subtitle_font)
+
+    def _draw_quote(self, draw, size, title, subtitle, style):
+        width, height = size
+        margin = round(width * 0.1)
+        color = self._text_color(style)
+        quote_font = get_font(round(min(width, height) * 0.065))
+        lines = wrap_text(f"“{title}”", quote_font, width - 2 * margin, 6)
+        line_height = round(quote_font.size * 1.35)
+
+        y = (height - line_height * len(lines)) / 2 - (quote_font.size if subtitle else 0)
+        for line in lines:
+            draw.text((width / 2, y), line, fill=color, anchor='ma', font=quote_font)
+            y += line_height
+        if subtitle:
+            attribution_font = get_font(round(min(width, height) * 0.04), 'bold')
+            draw.text((width / 2, y + quote_font.size * 0.6), f"— {subtitle}", fill=color, anchor='ma', font=attribution_font)
+
+# Global instance
+card_renderer = CardRenderer()
@@ -0,0 +1,146 @@
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+
+class HTTPClient:
+    """Shared outbound HTTP client with per-host keep-alive pools and retries"""
+
+    # Status codes worth retrying: rate limiting and transient upstream errors
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Methods that are safe to send twice; anything else may bill or act twice upstream
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(self):
+        self.pool_connections = int(os.environ.get('HTTP_POOL_CONNECTIONS', 4))
+        self.pool_maxsize = int(os.environ.get('HTTP_POOL_MAXSIZE', 20))
+        self.connect_timeout = float(os.environ.get('HTTP_CONNECT_TIMEOUT', 5))
+        self.read_timeout = float(os.environ.get('HTTP_READ_TIMEOUT', 30))
+        self.max_retries = int(os.environ.get('HTTP_MAX_RETRIES', 2))
+        self.backoff_base = float(os.environ.get('HTTP_BACKOFF_BASE', 0.5))
+        self.backoff_max = float(os.environ.get('HTTP_BACKOFF_MAX', 8))
+
+        # One session per host so every upstream gets its own keep-alive pool
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the shared pools"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request through the shared pools"""
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, timeout: Union[float, Tuple[float, float], None] = None,
+                retries: Optional[int] = None, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """Send a request, retrying connection errors and 429/5xx responses with jittered backoff.
+
+        ``timeout`` may be a single read timeout (the configured connect timeout is
+        used) or a ``(connect, read)`` tuple, matching ``requests`` semantics.
+
+        Requests that are not ``idempotent`` (by default, anything but GET, HEAD,
+        OPTIONS, PUT and DELETE) are only retried when the connection could not be
+        opened or the upstream answered 429 with a Retry-After header, since the
+        upstream cannot have started work in either case.
+        """
+        session = self._get_session(url)
+        timeout = self._resolve_timeout(timeout)
+        max_retries = self.max_retries if retries is None else retries
+        if idempotent is None:
+            idempotent = method.upper() in self.IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            try:
+                response = session.request(method, url, timeout=timeout, **kwargs)
+            except requests.ConnectionError as e:
+                # Read timeouts are not retried: the upstream already spent the full budget
+                if attempt >= max_retries or not (idempotent or self._is_connect_error(e)):
+                    raise
+                self._sleep(attempt)
+                attempt += 1
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES or attempt >= max_retries:
+                return response
+
+            delay = self._retry_after(response)
+            if not idempotent and not (response.status_code == 429 and delay is not None):
+                return response
+            response.close()
+            self._sleep(attempt, delay)
+            attempt += 1
+
+    def _get_session(self, url: str) -> requests.Session:
+        """Return the keep-alive session for the URL's host, creating it on first use"""
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+
+        session = self._sessions.get(host_key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    max_retries=0
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host_key] = session
+        return session
+
+    def _resolve_timeout(self, timeout):
+        """Normalise the timeout argument to a (connect, read) tuple"""
+        if timeout is None:
+            return (self.connect_timeout, self.read_timeout)
+        if isinstance(timeout, (tuple, list)):
+            return tuple(timeout)
+        return (self.connect_timeout, float(timeout))
+
+    @staticmethod
+    def _is_connect_error(error: requests.ConnectionError) -> bool:
+        """True if the request failed before a connection was established, so nothing was sent"""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Read a numeric Retry-After header, if the upstream sent one"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    def _sleep(self, attempt: int, delay: Optional[float] = None):
+        """Back off before the next attempt using full jitter unless the server asked for a delay"""
+        if delay is None:
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        time.sleep(min(delay, self.backoff_max))
+
+    def close(self):
+        """Close every pooled session"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+# Global instance
+http_client = HTTPClient()
@@ -0,0 +1,173 @@
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Iterable, Iterator, Optional
+
+try:
+    from PIL import Image as PILImage, ImageOps, features
+    from .smart_crop import smart_crop
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+DEFAULT_DERIVATIVE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'derivatives')
+
+# Size presets shared by every image; platform targets are added per request
+SIZE_PRESETS = {
+    'thumb': {'width': 200, 'height': 200, 'fit': 'contain'},
+    'feed': {'width': 640, 'height': 640, 'fit': 'contain'}
+}
+
+# AVIF is only produced when Pillow was built with AVIF support (Pillow 11.2+ with
+# libavif). The pinned Pillow 10.0.1 has none, so there it negotiates WebP or JPEG.
+FORMATS = {
+    'avif': {'mimetype': 'image/avif', 'pil_format': 'AVIF', 'options': {'quality': 60}},
+    'webp': {'mimetype': 'image/webp', 'pil_format': 'WEBP', 'options': {'quality': 80, 'method': 4}},
+    'jpeg': {'mimetype': 'image/jpeg', 'pil_format': 'JPEG', 'options': {'quality': 85, 'optimize': True, 'progressive': True}}
+}
+
+
+class ImageDerivatives:
+    """Resized and re-encoded variants of stored images, rendered on demand.
+
+    A variant is identified by the source image key, a preset name (``thumb``,
+    ``feed`` or a platform from the platform specifications) and an output
+    format. Rendering happens on a background pool; identical concurrent
+    requests share one render, and the result is cached on disk under
+    ``<root>/<hh>/<key>/<variant>.<ext>`` for every later request. AVIF is
+    offered only when the installed Pillow can encode it (see FORMATS).
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get('IMAGE_DERIVATIVE_PATH', DEFAULT_DERIVATIVE_PATH)
+        self.wait_seconds = float(os.environ.get('IMAGE_DERIVATIVE_WAIT', 10))
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.environ.get('IMAGE_DERIVATIVE_WORKERS', 2)),
+            thread_name_prefix='image-derivative'
+        )
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def supported_formats() -> Iterable[str]:
+        if not PIL_AVAILABLE:
+            return []
+        return [name for name in FORMATS if name == 'jpeg' or features.check(name)]
+
+    def negotiate_format(self, accept: str, requested: Optional[str] = None) -> Optional[str]:
+        """Pick the output format from an explicit request or the Accept header"""
+        supported = self.supported_formats()
+        if requested:
+            requested = 'jpeg' if requested == 'jpg' else requested
+            return requested if requested in supported else None
+        for name in ('avif', 'webp'):
+            if name in supported and FORMATS[name]['mimetype'] in (accept or ''):
+                return name
+        return 'jpeg'
+
+    @staticmethod
+    def resolve_variant(variant: str, platform_specs: Dict[str, Dict]) -> Optional[Dict]:
+        """Return the size spec for a preset or platform name"""
+        if variant in SIZE_PRESETS:
+            return SIZE_PRESETS[variant]
+        spec = platform_specs.get(variant)
+        if spec:
+            return {'width': spec['width'], 'height': spec['height'], 'fit': 'cover'}
+        return None
+
+    @staticmethod
+    def mimetype(fmt: str) -> str:
+        return FORMATS[fmt]['mimetype']
+
+    def path_for(self, key: str, variant: str, fmt: str) -> str:
+        return os.path.join(self.root, key[:2], key, f"{variant}.{fmt}")
+
+    def keys(self) -> Iterator[str]:
+        """Yield the key of every source image that has cached variants"""
+        if not os.path.isdir(self.root):
+            return
+        with os.scandir(self.root) as shards:
+            for shard in shards:
+                if not shard.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(shard.path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            yield entry.name
+
+    def delete(self, key: str):
+        """Remove every cached variant of a source image"""
+        shutil.rmtree(os.path.join(self.root, key[:2], key), ignore_errors=True)
+
+    def get(self, key: str, source_path: str, variant: str, spec: Dict, fmt: str) -> Optional[str]:
+        """Return the path of a rendered variant, rendering it if needed
+
+        Returns None if the render does not finish within IMAGE_DERIVATIVE_WAIT
+        seconds; it keeps running in the background and is cached once done.
+        """
+        path = self.path_for(key, variant, fmt)
+        if os.path.exists(path):
+            return path
+
+        future = self.submit(key, source_path, variant, spec, fmt)
+        try:
+            return future.result(timeout=self.wait_seconds)
+        except FutureTimeoutError:
+            return None
+
+    def submit(self, key: str, source_path: str, variant: str, spec: Dict, fmt: str):
+        """Schedule a render unless the same variant is already being rendered"""
+        path = self.path_for(key, variant, fmt)
+        with self._lock:
+            future = self._pending.get(path)
+            if future is None:
+                future = self._executor.submit(self._render, source_path, path, spec, fmt)
+                self._pending[path] = future
+                future.add_done_callback(lambda _: self._forget(path))
+        return future
+
+    def prefetch(self, key: str, source_path: str, variants: Dict[str, Dict], formats: Iterable[str] = ('webp',)):
+        """Warm the cache for a set of variants without waiting for them"""
+        for variant, spec in variants.items():
+            for fmt in formats:
+                if fmt in self.supported_formats() and not os.path.exists(self.path_for(key, variant, fmt)):
+                    self.submit(key, source_path, variant, spec, fmt)
+
+    def _forget(self, path: str):
+        with self._lock:
+            self._pending.pop(path, None)
+
+    def _render(self, source_path: str, path: str, spec: Dict, fmt: str) -> str:
+        with PILImage.open(source_path) as img:
+            img = ImageOps.exif_transpose(img)
+            size = (spec['width'], spec['height'])
+            if spec['fit'] == 'cover':
+                img = smart_crop(img, size)
+            else:
+                img = img.copy()
+                img.thumbnail(size, PILImage.LANCZOS)
+
+            if fmt == 'jpeg' and img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            elif img.mode not in ('RGB', 'RGBA', 'L'):
+                img = img.convert('RGBA')
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial image
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    img.save(f, FORMATS[fmt]['pil_format'], **FORMATS[fmt]['options'])
+                # mkstemp creates 0600 files; variants may be served directly by the web server
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        return path
+
+# Global instance
+image_derivatives = ImageDerivatives()
@@ -0,0 +1,210 @@
+import os
+import json
+import uuid
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from models import db, ImageJob
+
+
+class JobQueueFull(Exception):
+    """Raised when too many image jobs are already waiting"""
+
+
+class TransientJobError(RuntimeError):
+    """A render failed for a reason that may clear up, such as a network error or a 5xx"""
+
+
+class ImageJobManager:
+    """Runs Stable Diffusion renders off the request path.
+
+    Jobs are persisted in the ``image_jobs`` table and executed by a bounded
+    thread pool in each web worker. Workers claim a job with a conditional
+    update, so a job queued by one worker and re-submitted by another after a
+    restart still runs exactly once. Finished images go to the shared image
+    store and the job records the resulting hash.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.max_workers = int(os.environ.get('IMAGE_JOB_WORKERS', 2))
+        self.max_pending = int(os.environ.get('IMAGE_JOB_MAX_PENDING', 50))
+        # Running jobs older than this are assumed to belong to a worker that died
+        self.stale_after = int(os.environ.get('IMAGE_JOB_STALE_SECONDS', 300))
+        self.max_attempts = int(os.environ.get('IMAGE_JOB_MAX_ATTEMPTS', 3))
+        # Retries wait base * 2^(attempt - 1) seconds, capped at the maximum
+        self.retry_base = float(os.environ.get('IMAGE_JOB_RETRY_BASE', 5))
+        self.retry_max = float(os.environ.get('IMAGE_JOB_RETRY_MAX', 120))
+        self._executor = None
+
+    def init_app(self, app):
+        """Bind to the Flask app and resume unfinished jobs
+
+        The ``image_jobs`` table is created by ``db.create_all()`` or
+        migrations/add_image_jobs_table.py, not here.
+        """
+        self.app = app
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='image-job')
+        app.extensions['image_jobs'] = self
+
+        with app.app_context():
+            self._requeue_unfinished()
+
+    def submit(self, kind: str, params: Dict[str, Any], user_email: Optional[str] = None) -> ImageJob:
+        """Persist a new job and schedule it; raises JobQueueFull when the backlog is too long"""
+        if self._executor is None:
+            raise RuntimeError('Image job manager is not initialised')
+
+        pending = ImageJob.query.filter(ImageJob.status.in_(['queued', 'running'])).count()
+        if pending >= self.max_pending:
+            raise JobQueueFull(f'Too many image jobs pending ({pending}). Please retry shortly.')
+
+        job = ImageJob(
+            id=uuid.uuid4().hex,
+            user_email=user_email,
+            kind=kind,
+            params=json.dumps(params),
+            status='queued',
+            progress=0
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        self._executor.submit(self._run, job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[ImageJob]:
+        return ImageJob.query.get(job_id)
+
+    @staticmethod
+    def to_dict(job: ImageJob) -> Dict[str, Any]:
+        return {
+            'id': job.id,
+            'kind': job.kind,
+            'status': job.status,
+            'progress': job.progress,
+            'attempts': job.attempts,
+            'result': json.loads(job.result) if job.result else None,
+            'error': job.error,
+            'created_at': job.created_at.isoformat() + 'Z' if job.created_at else None,
+            'started_at': job.started_at.isoformat() + 'Z' if job.started_at else None,
+            'finished_at': job.finished_at.isoformat() + 'Z' if job.finished_at else None
+        }
+
+    def _requeue_unfinished(self):
+        """Put stale running jobs back in the queue and schedule every queued job
+
+        A job that has used all its attempts is failed instead, so one that keeps
+        taking its worker down is not retried forever.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        stale = ImageJob.query.filter(ImageJob.status == 'running', ImageJob.started_at < cutoff)
+        stale.filter(ImageJob.attempts >= self.max_attempts).update({
+            'status': 'failed',
+            'progress': 0,
+            'error': 'Worker stopped while rendering; no attempts left',
+            'finished_at': datetime.utcnow()
+        }, synchronize_session=False)
+        stale.filter(ImageJob.attempts < self.max_attempts).update(
+            {'status': 'queued', 'progress': 0}, synchronize_session=False
+        )
+        db.session.commit()
+
+        for job in ImageJob.query.filter_by(status='queued').order_by(ImageJob.created_at).all():
+            self._executor.submit(self._run, job.id)
+
+    def _claim(self, job_id: str) -> bool:
+        """Atomically move a queued job to running; False if another worker got it first"""
+        claimed = ImageJob.query.filter_by(id=job_id, status='queued').update({
+            'status': 'running',
+            'progress': 10,
+            'attempts': ImageJob.attempts + 1,
+            'started_at': datetime.utcnow()
+        }, synchronize_session=False)
+        db.session.commit()
+        return claimed == 1
+
+    def _run(self, job_id: str):
+        with self.app.app_context():
+            try:
+                if not self._claim(job_id):
+                    return
+
+                job = ImageJob.query.get(job_id)
+                result = self._render(job.kind, json.loads(job.params))
+                job.status = 'succeeded'
+                job.progress = 100
+                job.result = json.dumps(result)
+                job.error = None
+            except Exception as e:
+                db.session.rollback()
+                job = ImageJob.query.get(job_id)
+                if job is None:
+                    return
+                self.app.logger.error(f"Image job {job_id} failed: {str(e)}")
+                job.status = 'queued' if job.attempts < self.max_attempts and self._is_transient(e) else 'failed'
+                job.error = str(e)
+                job.progress = 0
+                if job.status == 'queued':
+                    db.session.commit()
+                    self._schedule_retry(job_id, job.attempts)
+                    return
+
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+
+    def _schedule_retry(self, job_id: str, attempts: int):
+        """Resubmit a failed job after an exponential delay"""
+        delay = min(self.retry_max, self.retry_base * 2 ** max(0, attempts - 1))
+        timer = threading.Timer(delay, self._executor.submit, args=(self._run, job_id))
+        # A job still waiting at shutdown stays queued and is resumed on the next start
+        timer.daemon = True
+        timer.start()
+
+    def _render(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Render one image and store it, returning the job result"""
+        from services.stable_diffusion import StableDiffusionService
+        from services.image_store import image_store
+        from services.image_derivatives import image_derivatives, SIZE_PRESETS
+
+        stable_diffusion = StableDiffusionService()
+        if kind == 'multi_platform':
+            # Already stored per platform by the service
+            image_result = stable_diffusion.generate_multi_platform_images(**params)
+            if 'error' in image_result:
+                raise self._render_error(image_result)
+            return image_result
+        if kind == 'prompt':
+            image_result = stable_diffusion.generate_image_with_prompt(**params)
+        elif kind == 'content':
+            image_result = stable_diffusion.generate_image(**params)
+        else:
+            raise ValueError(f'Unknown image job kind: {kind}')
+
+        if 'error' in image_result or not image_result.get('image_data'):
+            raise self._render_error(image_result)
+
+        image_hash = image_store.put_base64(image_result.pop('image_data'))
+        image_derivatives.prefetch(image_hash, image_store.object_path(image_hash), SIZE_PRESETS)
+        image_result.update({
+            'image_hash': image_hash,
+            'image_url': f'/api/image/{image_hash}'
+        })
+        return image_result
+
+    @staticmethod
+    def _render_error(image_result: Dict[str, Any]) -> RuntimeError:
+        """Turn a failed service result into an exception, keeping whether it is worth retrying"""
+        message = image_result.get('error', 'Image generation failed')
+        return TransientJobError(message) if image_result.get('transient') else RuntimeError(message)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Only network errors, rate limiting and 5xx responses are worth another attempt"""
+        from services.stable_diffusion import is_transient_error
+        return isinstance(error, TransientJobError) or is_transient_error(error)
+
+# Global instance
+image_jobs = ImageJobManager()
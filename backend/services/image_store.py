@@ -0,0 +1,196 @@
+import os
+import re
+import time
+import base64
+import sqlite3
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'images')
+
+IMAGE_HASH_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ImageStore:
+    """Content-addressed image store on local disk, shared by every worker on the node.
+
+    Images are keyed by the SHA-256 of their bytes and written to
+    ``<root>/objects/<hh>/<hash>``. A SQLite index records size, content type and
+    last access so the store can be kept under a byte budget by evicting the least
+    recently used images. Small, hot images are also kept in a per-process LRU.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get('IMAGE_STORE_PATH', DEFAULT_STORE_PATH)
+        self.max_bytes = int(os.environ.get('IMAGE_STORE_MAX_BYTES', 2 * 1024 ** 3))
+        self.memory_bytes = int(os.environ.get('IMAGE_STORE_MEMORY_BYTES', 64 * 1024 ** 2))
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+    @staticmethod
+    def is_valid_hash(image_hash: str) -> bool:
+        """Check that a hash is a SHA-256 hex digest, so it is safe to use in a path"""
+        return bool(image_hash) and IMAGE_HASH_PATTERN.match(image_hash) is not None
+
+    def object_path(self, image_hash: str) -> str:
+        return os.path.join(self.root, 'objects', image_hash[:2], image_hash)
+
+    def put(self, data: bytes, content_type: str = 'image/png') -> str:
+        """Store image bytes and return their hash; storing the same bytes twice is a no-op"""
+        image_hash = hashlib.sha256(data).hexdigest()
+        path = self.object_path(image_hash)
+        now = time.time()
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial image
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                # mkstemp creates 0600 files; objects must stay readable by a fronting web server
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        conn = self._connection()
+        conn.execute(
+            """INSERT INTO images (hash, size, content_type, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(hash) DO UPDATE SET accessed_at = excluded.accessed_at""",
+            (image_hash, len(data), content_type, now, now)
+        )
+        conn.commit()
+
+        self._memory_set(image_hash, data)
+        self.stats['writes'] += 1
+        self._evict(conn, keep=image_hash)
+        return image_hash
+
+    def put_base64(self, image_data: str, content_type: str = 'image/png') -> str:
+        """Store a base64 encoded image (as returned by Stable Diffusion) and return its hash"""
+        return self.put(base64.b64decode(image_data), content_type)
+
+    def info(self, image_hash: str) -> Optional[Dict[str, object]]:
+        """Return path, size and content type for a stored image, or None if it is missing"""
+        if not self.is_valid_hash(image_hash):
+            return None
+
+        row = self._connection().execute(
+            'SELECT size, content_type, created_at FROM images WHERE hash = ?', (image_hash,)
+        ).fetchone()
+        path = self.object_path(image_hash)
+        if row is None or not os.path.exists(path):
+            return None
+
+        self._touch(image_hash)
+        size, content_type, created_at = row
+        return {'hash': image_hash, 'path': path, 'size': size, 'content_type': content_type, 'created_at': created_at}
+
+    def get(self, image_hash: str) -> Optional[bytes]:
+        """Return the bytes of a stored image, checking the memory tier first"""
+        if not self.is_valid_hash(image_hash):
+            return None
+
+        with self._lock:
+            data = self._memory.get(image_hash)
+            if data is not None:
+                self._memory.move_to_end(image_hash)
+                self.stats['memory_hits'] += 1
+                return data
+
+        try:
+            with open(self.object_path(image_hash), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.stats['misses'] += 1
+            return None
+
+        self._touch(image_hash)
+        self._memory_set(image_hash, data)
+        self.stats['disk_hits'] += 1
+        return data
+
+    def _memory_set(self, image_hash: str, data: bytes):
+        # Images larger than a quarter of the budget would just churn the tier
+        if len(data) > self.memory_bytes // 4:
+            return
+
+        with self._lock:
+            if image_hash in self._memory:
+                self._memory.move_to_end(image_hash)
+                return
+            self._memory[image_hash] = data
+            self._memory_size += len(data)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def _touch(self, image_hash: str):
+        conn = self._connection()
+        conn.execute('UPDATE images SET accessed_at = ? WHERE hash = ?', (time.time(), image_hash))
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's index connection, creating the schema on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        os.makedirs(self.root, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(self.root, 'index.db'), timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS images (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                content_type TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_images_accessed ON images (accessed_at)')
+        conn.commit()
+        self._local.conn = conn
+        return conn
+
+    def _evict(self, conn: sqlite3.Connection, keep: Optional[str] = None):
+        """Remove least recently used images until the store is within its byte budget"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM images').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for image_hash, size in conn.execute(
+            'SELECT hash, size FROM images ORDER BY accessed_at ASC'
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            if image_hash == keep:
+                continue
+            self._delete(conn, image_hash)
+            total -= size
+            self.stats['evictions'] += 1
+        conn.commit()
+
+    def _delete(self, conn: sqlite3.Connection, image_hash: str):
+        conn.execute('DELETE FROM images WHERE hash = ?', (image_hash,))
+        try:
+            os.remove(self.object_path(image_hash))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            data = self._memory.pop(image_hash, None)
+            if data is not None:
+                self._memory_size -= len(data)
+
+# Global instance
+image_store = ImageStore()
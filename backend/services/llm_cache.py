@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'llm_cache.db')
+
+
+class LLMResponseCache:
+    """Content-addressed cache for LLM completions: in-process LRU in front of a shared SQLite file"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.environ.get('LLM_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.enabled = os.environ.get('LLM_CACHE_ENABLED', 'true').lower() != 'false'
+        self.ttl = int(os.environ.get('LLM_CACHE_TTL', 86400))
+        self.memory_entries = int(os.environ.get('LLM_CACHE_MEMORY_ENTRIES', 256))
+        self.max_entries = int(os.environ.get('LLM_CACHE_MAX_ENTRIES', 5000))
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._disk_available = True
+        self._writes = 0
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'writes': 0}
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Fingerprint a chat completion payload (model, messages, temperature, max_tokens)"""
+        material = {
+            'model': payload.get('model'),
+            'messages': payload.get('messages'),
+            'temperature': payload.get('temperature'),
+            'max_tokens': payload.get('max_tokens')
+        }
+        encoded = json.dumps(material, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached completion, checking memory first and then disk"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats['memory_hits'] += 1
+                    return value
+                del self._memory[key]
+
+        row = self._disk_get(key, now)
+        if row is not None:
+            value, created_at = row
+            # Keep the entry's original expiry; a hit must not extend its lifetime
+            self._memory_set(key, value, created_at + self.ttl)
+            self.stats['disk_hits'] += 1
+            return value
+
+        self.stats['misses'] += 1
+        return None
+
+    def set(self, key: str, value: str):
+        """Store a completion in both tiers"""
+        if not self.enabled or not value:
+            return
+
+        now = time.time()
+        self._memory_set(key, value, now + self.ttl)
+        self._disk_set(key, value, now)
+        self.stats['writes'] += 1
+
+    def _memory_set(self, key: str, value: str, expires_at: float):
+        with self._lock:
+            self._memory[key] = (value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Return this thread's SQLite connection, creating the schema on first use"""
+        if not self._disk_available:
+            return None
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)')
+            conn.commit()
+            self._local.conn = conn
+            return conn
+        except sqlite3.Error as e:
+            print(f"LLM cache disk tier unavailable, using memory only: {e}")
+            self._disk_available = False
+            return None
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        """Return (value, created_at) for an unexpired entry, or None"""
+        conn = self._connection()
+        if conn is None:
+            return None
+
+        try:
+            row = conn.execute(
+                'SELECT value, created_at FROM llm_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if created_at + self.ttl <= now:
+                conn.execute('DELETE FROM llm_cache WHERE key = ?', (key,))
+                conn.commit()
+                return None
+            conn.execute('UPDATE llm_cache SET accessed_at = ? WHERE key = ?', (now, key))
+            conn.commit()
+            return value, created_at
+        except sqlite3.Error as e:
+            print(f"LLM cache read error: {e}")
+            return None
+
+    def _disk_set(self, key: str, value: str, now: float):
+        conn = self._connection()
+        if conn is None:
+            return
+
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, value, now, now)
+            )
+            conn.commit()
+            self._writes += 1
+            if self._writes % 50 == 0:
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            print(f"LLM cache write error: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired rows, then the least recently used rows beyond the size limit"""
+        conn.execute('DELETE FROM llm_cache WHERE created_at <= ?', (now - self.ttl,))
+        conn.execute("""
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+        conn.commit()
+
+    def clear(self):
+        """Empty both tiers"""
+        with self._lock:
+            self._memory.clear()
+        conn = self._connection()
+        if conn is not None:
+            try:
+                conn.execute('DELETE FROM llm_cache')
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"LLM cache clear error: {e}")
+
+# Global instance
+llm_cache = LLMResponseCache()
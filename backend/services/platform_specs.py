@@ -0,0 +1,10 @@
+# Image size each platform expects. The platform specification endpoint, the
+# derivative crops and the generated cards all read this one table.
+PLATFORM_IMAGE_SPECS = {
+    'facebook': {'width': 1200, 'height': 628, 'aspect_ratio': '2:1'},
+    'instagram': {'width': 1080, 'height': 1080, 'aspect_ratio': '1:1'},
+    'linkedin': {'width': 1200, 'height': 628, 'aspect_ratio': '2:1'},
+    'twitter': {'width': 1024, 'height': 512, 'aspect_ratio': '2:1'},
+    'youtube_shorts': {'width': 1080, 'height': 1920, 'aspect_ratio': '9:16'},
+    'blog': {'width': 1200, 'height': 628, 'aspect_ratio': '2:1'}
+}
@@ -0,0 +1,268 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from .single_flight import single_flight
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'search_cache.db')
+
+# Parameters that select a result page; the API key is deliberately not part of the key
+KEY_PARAMS = ('cx', 'q', 'gl', 'lr', 'start', 'num')
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+except Exception:
+    # Custom Search quotas reset at midnight Pacific time
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+class SearchResultCache:
+    """Shared cache and daily quota ledger for Google Custom Search.
+
+    Results are keyed on the normalized page parameters and kept in a SQLite
+    file used by every worker. A result is fresh for SEARCH_CACHE_TTL seconds
+    and may be served stale for SEARCH_CACHE_STALE_TTL more while a background
+    refresh runs. Every upstream call is charged to a per-day ledger; once
+    fewer than SEARCH_QUOTA_RESERVE queries remain, stale results are served
+    without refreshing, and at SEARCH_DAILY_QUOTA no further calls are made.
+
+    If the SQLite file cannot be used (unwritable directory, locked database),
+    lookups miss and the quota is counted per process instead of failing.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.environ.get('SEARCH_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.enabled = os.environ.get('SEARCH_CACHE_ENABLED', 'true').lower() != 'false'
+        self.ttl = int(os.environ.get('SEARCH_CACHE_TTL', 6 * 3600))
+        self.stale_ttl = int(os.environ.get('SEARCH_CACHE_STALE_TTL', 7 * 86400))
+        self.daily_quota = int(os.environ.get('SEARCH_DAILY_QUOTA', 100))
+        self.quota_reserve = int(os.environ.get('SEARCH_QUOTA_RESERVE', 20))
+
+        self._local = threading.local()
+        self._disk_available = True
+        self._error_logged = False
+        # Per-process fallback ledger for when the shared one cannot be used
+        self._memory_ledger: Dict[str, int] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='search-refresh')
+        self.stats = {'fresh_hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'api_calls': 0, 'quota_denied': 0}
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Fingerprint a request by its page parameters, ignoring case and extra whitespace in the query"""
+        material = {}
+        for name in KEY_PARAMS:
+            value = params.get(name)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = ' '.join(value.lower().split())
+            material[name] = value
+        encoded = json.dumps(material, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def fetch(self, params: Dict[str, Any], request: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Return the result for ``params``, calling ``request`` only when the cache and quota allow
+
+        ``request`` performs the API call and returns the decoded response, or
+        None on failure. Returns None when there is no usable result.
+        """
+        if not self.enabled:
+            return self._call(request) if self._consume_quota() else None
+
+        key = self.make_key(params)
+        cached = self._get(key)
+        if cached is not None:
+            value, age = cached
+            if age < self.ttl:
+                self.stats['fresh_hits'] += 1
+                return value
+
+            self.stats['stale_hits'] += 1
+            if self.remaining() > self.quota_reserve:
+                self._refresh_in_background(key, request)
+            return value
+
+        self.stats['misses'] += 1
+        return single_flight.do(
+            f'search:{key}',
+            lambda: self._fetch_and_store(key, request),
+            recheck=lambda: (self._get(key) or (None,))[0]
+        )
+
+    def remaining(self) -> int:
+        """Queries left in today's quota"""
+        conn = self._connection()
+        if conn is not None:
+            try:
+                row = conn.execute('SELECT used FROM quota_ledger WHERE day = ?', (self._today(),)).fetchone()
+                return max(0, self.daily_quota - (row[0] if row else 0))
+            except sqlite3.Error as e:
+                self._log_error('quota read', e)
+        with self._lock:
+            return max(0, self.daily_quota - self._memory_ledger.get(self._today(), 0))
+
+    def mark_exhausted(self):
+        """Record that the API reported the quota as used up, whatever the ledger says"""
+        with self._lock:
+            self._memory_ledger = {self._today(): self.daily_quota}
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                """INSERT INTO quota_ledger (day, used) VALUES (?, ?)
+                   ON CONFLICT(day) DO UPDATE SET used = MAX(used, excluded.used)""",
+                (self._today(), self.daily_quota)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            self._log_error('quota write', e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats.update({'quota_remaining': self.remaining(), 'daily_quota': self.daily_quota})
+        return stats
+
+    def _fetch_and_store(self, key: str, request: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        if not self._consume_quota():
+            return None
+        value = self._call(request)
+        if value is not None:
+            self._set(key, value)
+        return value
+
+    def _refresh_in_background(self, key: str, request: Callable[[], Optional[Dict[str, Any]]]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.stats['refreshes'] += 1
+                self._fetch_and_store(key, request)
+            except Exception as e:
+                print(f"Search cache refresh error: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+    def _call(self, request: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        self.stats['api_calls'] += 1
+        return request()
+
+    def _consume_quota(self) -> bool:
+        """Charge one query to today's ledger; False if the day's quota is used up"""
+        charged = None
+        conn = self._connection()
+        if conn is not None:
+            try:
+                cursor = conn.execute(
+                    """INSERT INTO quota_ledger (day, used) VALUES (?, 1)
+                       ON CONFLICT(day) DO UPDATE SET used = used + 1 WHERE used < ?""",
+                    (self._today(), self.daily_quota)
+                )
+                conn.commit()
+                charged = cursor.rowcount == 1
+            except sqlite3.Error as e:
+                self._log_error('quota write', e)
+
+        if charged is None:
+            with self._lock:
+                today = self._today()
+                used = self._memory_ledger.get(today, 0)
+                charged = used < self.daily_quota
+                if charged:
+                    self._memory_ledger = {today: used + 1}
+
+        if not charged:
+            self.stats['quota_denied'] += 1
+        return charged
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+    def _get(self, key: str):
+        """Return (value, age in seconds) for a usable entry, or None"""
+        now = time.time()
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute('SELECT value, created_at FROM search_cache WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            self._log_error('read', e)
+            return None
+        if row is None or now - row[1] >= self.ttl + self.stale_ttl:
+            return None
+        return json.loads(row[0]), now - row[1]
+
+    def _set(self, key: str, value: Dict[str, Any]):
+        now = time.time()
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO search_cache (key, value, created_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False), now)
+            )
+            conn.execute('DELETE FROM search_cache WHERE created_at <= ?', (now - self.ttl - self.stale_ttl,))
+            conn.commit()
+        except sqlite3.Error as e:
+            self._log_error('write', e)
+
+    def _log_error(self, action: str, error: Exception):
+        """Report the first SQLite failure; later ones fall back silently"""
+        if not self._error_logged:
+            self._error_logged = True
+            print(f"Search cache {action} error, falling back to no cache and a per-process quota: {error}")
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Return this thread's SQLite connection, creating the schema on first use"""
+        if not self._disk_available:
+            return None
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS quota_ledger (
+                    day TEXT PRIMARY KEY,
+                    used INTEGER NOT NULL
+                )
+            """)
+            conn.commit()
+            self._local.conn = conn
+            return conn
+        except (sqlite3.Error, OSError) as e:
+            self._log_error('open', e)
+            self._disk_available = False
+            return None
+
+# Global instance
+search_cache = SearchResultCache()
@@ -0,0 +1,163 @@
+import os
+import time
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+    FILE_LOCKS_AVAILABLE = True
+except ImportError:
+    FILE_LOCKS_AVAILABLE = False
+
+DEFAULT_LOCK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'single_flight')
+
+
+class _Call:
+    """An in-flight call that followers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single upstream call.
+
+    Within a process, the first caller for a key runs the function and every
+    concurrent caller with the same key waits for and shares its result. When
+    cross-process locking is enabled, the leader additionally takes an exclusive
+    file lock for the key and, once it holds the lock, runs ``recheck`` so a
+    result another worker stored in a shared cache meanwhile is reused.
+
+    Each key has its own lock file, so unrelated calls never wait on each other.
+    A leader waits at most SINGLE_FLIGHT_LOCK_WAIT seconds for another worker's
+    call and then runs its own rather than queueing behind a slow upstream.
+    """
+
+    def __init__(self, lock_dir: Optional[str] = None):
+        self.lock_dir = lock_dir or os.environ.get('SINGLE_FLIGHT_LOCK_DIR', DEFAULT_LOCK_DIR)
+        self.cross_process = (
+            os.environ.get('SINGLE_FLIGHT_CROSS_PROCESS', 'false').lower() == 'true'
+            and FILE_LOCKS_AVAILABLE
+        )
+        self.lock_wait = float(os.environ.get('SINGLE_FLIGHT_LOCK_WAIT', 30))
+        # Lock files untouched for this long are pruned so the directory stays bounded
+        self.lock_max_age = int(os.environ.get('SINGLE_FLIGHT_LOCK_MAX_AGE', 3600))
+        self._last_prune = 0.0
+
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'executions': 0, 'coalesced': 0, 'cross_process_hits': 0}
+
+    def do(self, key: str, fn: Callable[[], Any], recheck: Optional[Callable[[], Any]] = None) -> Any:
+        """Return ``fn()``, sharing one execution among concurrent callers with the same key.
+
+        ``recheck`` is only used with cross-process locking; a non-None return value
+        is used instead of calling ``fn``.
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.stats['coalesced'] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._execute(key, fn, recheck)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def _execute(self, key: str, fn: Callable[[], Any], recheck: Optional[Callable[[], Any]]) -> Any:
+        """Run the leader's call, holding the key's file lock when enabled"""
+        if not self.cross_process or recheck is None:
+            with self._lock:
+                self.stats['executions'] += 1
+            return fn()
+
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        path = os.path.join(self.lock_dir, digest[:2], f"{digest}.lock")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            lock_file = open(path, 'a')
+        except OSError as e:
+            print(f"Single-flight lock unavailable, running without it: {e}")
+            with self._lock:
+                self.stats['executions'] += 1
+            return fn()
+
+        with lock_file:
+            locked = self._acquire(lock_file)
+            try:
+                # Another worker may have finished the same call while we waited
+                result = recheck()
+                if result is not None:
+                    with self._lock:
+                        self.stats['cross_process_hits'] += 1
+                    return result
+                with self._lock:
+                    self.stats['executions'] += 1
+                return fn()
+            finally:
+                if locked:
+                    try:
+                        os.utime(path)
+                    except OSError:
+                        pass
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                self._prune_locks()
+
+    def _acquire(self, lock_file) -> bool:
+        """Take the file lock, giving up after ``lock_wait`` seconds; False if it was not acquired"""
+        deadline = time.monotonic() + self.lock_wait
+        delay = 0.01
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.25)
+
+    def _prune_locks(self):
+        """Remove lock files for keys nobody has used recently, at most once per ``lock_max_age``"""
+        now = time.time()
+        with self._lock:
+            if now - self._last_prune < self.lock_max_age:
+                return
+            self._last_prune = now
+
+        cutoff = now - self.lock_max_age
+        try:
+            with os.scandir(self.lock_dir) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as files:
+                        for entry in files:
+                            if entry.name.endswith('.lock') and entry.stat().st_mtime < cutoff:
+                                os.remove(entry.path)
+        except OSError:
+            pass
+
+# Global instance
+single_flight = SingleFlight()
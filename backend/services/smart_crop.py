@@ -0,0 +1,107 @@
+from typing import Dict, Iterable, Tuple
+
+try:
+    from PIL import Image as PILImage, ImageFilter, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Longest side of the thumbnail the saliency map is computed on
+ANALYSIS_SIZE = 96
+
+# Beyond this fraction of lost area, padding keeps more of the picture than cropping
+MAX_CROP_LOSS = 0.45
+
+
+def crop_loss(source_ratio: float, target_ratio: float) -> float:
+    """Fraction of the source area a cover crop to ``target_ratio`` discards"""
+    return 1 - min(source_ratio / target_ratio, target_ratio / source_ratio)
+
+
+def best_render_ratio(ratios: Dict[str, Dict[str, int]], targets: Iterable[Tuple[int, int]]) -> str:
+    """Pick the render aspect ratio that loses the least area across all targets"""
+    targets = list(targets)
+
+    def total_loss(name):
+        dims = ratios[name]
+        source_ratio = dims['width'] / dims['height']
+        return sum(crop_loss(source_ratio, width / height) for width, height in targets)
+
+    return min(ratios, key=total_loss)
+
+
+def _saliency_profile(img: 'PILImage.Image', axis: int) -> list:
+    """Per-column (axis 0) or per-row (axis 1) interest, from edge energy weighted towards the centre"""
+    small = img.convert('L')
+    small.thumbnail((ANALYSIS_SIZE, ANALYSIS_SIZE))
+    edges = small.filter(ImageFilter.FIND_EDGES)
+    width, height = edges.size
+    pixels = edges.load()
+
+    length = width if axis == 0 else height
+    span = height if axis == 0 else width
+    profile = []
+    for i in range(length):
+        total = sum(pixels[i, j] if axis == 0 else pixels[j, i] for j in range(span))
+        # Gentle centre bias so flat images still crop around the middle
+        distance = abs((i + 0.5) / length - 0.5) * 2
+        profile.append(total * (1 - 0.5 * distance) + 1)
+    return profile
+
+
+def _best_window(profile: list, window: int) -> int:
+    """Start index of the window with the largest summed interest"""
+    if window >= len(profile):
+        return 0
+    current = sum(profile[:window])
+    best_start, best_sum = 0, current
+    for start in range(1, len(profile) - window + 1):
+        current += profile[start + window - 1] - profile[start - 1]
+        if current > best_sum:
+            best_start, best_sum = start, current
+    return best_start
+
+
+def smart_crop(img: 'PILImage.Image', size: Tuple[int, int]) -> 'PILImage.Image':
+    """Cover-crop to ``size``, placing the window over the most salient region"""
+    target_width, target_height = size
+    width, height = img.size
+    target_ratio = target_width / target_height
+
+    if width / height > target_ratio:
+        # Too wide: choose which columns to keep
+        crop_width = round(height * target_ratio)
+        profile = _saliency_profile(img, axis=0)
+        scale = len(profile) / width
+        start = _best_window(profile, max(1, round(crop_width * scale)))
+        left = min(width - crop_width, round(start / scale))
+        box = (left, 0, left + crop_width, height)
+    else:
+        # Too tall: choose which rows to keep
+        crop_height = round(width / target_ratio)
+        profile = _saliency_profile(img, axis=1)
+        scale = len(profile) / height
+        start = _best_window(profile, max(1, round(crop_height * scale)))
+        top = min(height - crop_height, round(start / scale))
+        box = (0, top, width, top + crop_height)
+
+    return img.crop(box).resize(size, PILImage.LANCZOS)
+
+
+def pad_to(img: 'PILImage.Image', size: Tuple[int, int]) -> 'PILImage.Image':
+    """Fit the whole image inside ``size`` over a blurred, stretched copy of itself"""
+    background = img.convert('RGB').resize(size, PILImage.BILINEAR).filter(ImageFilter.GaussianBlur(24))
+    foreground = ImageOps.contain(img.convert('RGB'), size, PILImage.LANCZOS)
+    offset = ((size[0] - foreground.width) // 2, (size[1] - foreground.height) // 2)
+    background.paste(foreground, offset)
+    return background
+
+
+def fit_to_target(img: 'PILImage.Image', size: Tuple[int, int], max_crop_loss: float = MAX_CROP_LOSS) -> Tuple['PILImage.Image', str]:
+    """Derive a target size from a render, cropping when cheap and padding otherwise
+
+    Returns the derived image and the method used (``crop`` or ``pad``).
+    """
+    if crop_loss(img.width / img.height, size[0] / size[1]) > max_crop_loss:
+        return pad_to(img, size), 'pad'
+    return smart_crop(img, size), 'crop'
@@ -0,0 +1,253 @@
+import io
+import os
+import time
+import hashlib
+import tempfile
+import threading
+from typing import Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+try:
+    from PIL import Image as PILImage, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from .http_client import http_client
+from .single_flight import single_flight
+
+DEFAULT_THUMB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'thumbs')
+
+# Hosts the search results link artwork from; subdomains are allowed too.
+# frontend/pages/generator.js (THUMB_PROXY_HOSTS) only proxies these hosts, so keep the two lists in sync
+DEFAULT_ALLOWED_HOSTS = ('img.youtube.com', 'i.ytimg.com', 'images.unsplash.com', 'mzstatic.com')
+
+# Card sizes used by the video and podcast pickers, at 2x for high-density screens
+THUMB_SIZES = {
+    'video': (160, 128),
+    'square': (128, 128),
+    'small': (96, 96)
+}
+
+MAX_REDIRECTS = 3
+
+
+class ThumbnailUnavailable(Exception):
+    """Raised when a remote image cannot be fetched or decoded"""
+
+
+class ThumbnailProxy:
+    """Fetches remote artwork once, shrinks it to card size and caches it on disk.
+
+    Thumbnails are keyed by the SHA-256 of the source URL and size and stored
+    as ``<root>/<hh>/<key>.jpg``. Failed fetches leave a ``<key>.miss`` marker so
+    broken links are not retried until THUMB_NEGATIVE_TTL has passed. The cache
+    is kept under THUMB_CACHE_MAX_BYTES by deleting the least recently served
+    files; serving a thumbnail refreshes its mtime.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get('THUMB_CACHE_PATH', DEFAULT_THUMB_PATH)
+        self.max_bytes = int(os.environ.get('THUMB_CACHE_MAX_BYTES', 200 * 1024 ** 2))
+        self.max_source_bytes = int(os.environ.get('THUMB_MAX_SOURCE_BYTES', 5 * 1024 ** 2))
+        self.negative_ttl = int(os.environ.get('THUMB_NEGATIVE_TTL', 3600))
+        self.fetch_timeout = float(os.environ.get('THUMB_FETCH_TIMEOUT', 5))
+        hosts = os.environ.get('THUMB_ALLOWED_HOSTS')
+        self.allowed_hosts = tuple(h.strip().lower() for h in hosts.split(',') if h.strip()) if hosts else DEFAULT_ALLOWED_HOSTS
+
+        self._size_lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.stats = {'hits': 0, 'fetches': 0, 'negative_hits': 0, 'failures': 0, 'evictions': 0}
+
+    def is_allowed(self, url: str) -> bool:
+        """Only proxy http(s) URLs on an allowlisted host"""
+        parts = urlsplit(url or '')
+        host = (parts.hostname or '').lower()
+        if parts.scheme not in ('http', 'https') or not host:
+            return False
+        return any(host == allowed or host.endswith('.' + allowed) for allowed in self.allowed_hosts)
+
+    def key_for(self, url: str, size: str) -> str:
+        return hashlib.sha256(f'{size}:{url}'.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f'{key}.jpg')
+
+    def validate(self, url: str, size: str):
+        """Raise ValueError for URLs or sizes that are not allowed"""
+        if size not in THUMB_SIZES:
+            raise ValueError(f'Unsupported thumbnail size: {size}')
+        if not self.is_allowed(url):
+            raise ValueError('Thumbnail host is not allowed')
+
+    def get(self, url: str, size: str) -> str:
+        """Return the path of the cached thumbnail, fetching it the first time
+
+        Raises ValueError for URLs or sizes that are not allowed and
+        ThumbnailUnavailable when the source is (or recently was) unreachable.
+        """
+        self.validate(url, size)
+
+        key = self.key_for(url, size)
+        path = self.path_for(key)
+        if self._serve_cached(path):
+            return path
+        if self._is_negative(key):
+            self.stats['negative_hits'] += 1
+            raise ThumbnailUnavailable('Thumbnail source is unavailable')
+
+        return single_flight.do(
+            f'thumb:{key}',
+            lambda: self._fetch_and_store(url, size, key),
+            recheck=lambda: path if os.path.exists(path) else None
+        )
+
+    def _serve_cached(self, path: str) -> bool:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        self.stats['hits'] += 1
+        return True
+
+    def _negative_path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f'{key}.miss')
+
+    def _is_negative(self, key: str) -> bool:
+        try:
+            return time.time() - os.path.getmtime(self._negative_path(key)) < self.negative_ttl
+        except FileNotFoundError:
+            return False
+
+    def _fetch_and_store(self, url: str, size: str, key: str) -> str:
+        self.stats['fetches'] += 1
+        try:
+            data = self._download(url)
+            if data is None and self._youtube_fallback(url):
+                data = self._download(self._youtube_fallback(url))
+            if data is None:
+                raise ThumbnailUnavailable('Thumbnail source is unavailable')
+            thumbnail = self._resize(data, THUMB_SIZES[size])
+        except ThumbnailUnavailable:
+            self._mark_negative(key)
+            raise
+
+        path = self.path_for(key)
+        self._write(path, thumbnail)
+        self._account(len(thumbnail), keep=path)
+        return path
+
+    @staticmethod
+    def _youtube_fallback(url: str) -> Optional[str]:
+        """maxresdefault.jpg does not exist for many videos; hqdefault.jpg always does"""
+        if 'maxresdefault' in url and 'youtube.com/vi/' in url:
+            return url.replace('maxresdefault', 'hqdefault')
+        return None
+
+    def _download(self, url: str) -> Optional[bytes]:
+        """Fetch an image, following redirects only to allowed hosts; None on any failure"""
+        for _ in range(MAX_REDIRECTS + 1):
+            try:
+                response = http_client.get(url, timeout=self.fetch_timeout, stream=True, allow_redirects=False, retries=0)
+            except Exception:
+                return None
+
+            with response:
+                if response.is_redirect:
+                    url = urljoin(url, response.headers.get('Location', ''))
+                    if not self.is_allowed(url):
+                        return None
+                    continue
+                if response.status_code != 200 or not response.headers.get('Content-Type', '').startswith('image/'):
+                    return None
+
+                body = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) > self.max_source_bytes:
+                        return None
+                return bytes(body)
+        return None
+
+    @staticmethod
+    def _resize(data: bytes, size: Tuple[int, int]) -> bytes:
+        try:
+            with PILImage.open(io.BytesIO(data)) as img:
+                # Let the JPEG decoder skip most of the full-size pixels
+                img.draft('RGB', (size[0] * 2, size[1] * 2))
+                img = ImageOps.fit(ImageOps.exif_transpose(img).convert('RGB'), size, PILImage.LANCZOS)
+        except Exception as e:
+            raise ThumbnailUnavailable(f'Thumbnail source is not a readable image: {e}')
+
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=80, optimize=True, progressive=True)
+        return buffer.getvalue()
+
+    def _mark_negative(self, key: str):
+        self.stats['failures'] += 1
+        path = self._negative_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w'):
+            pass
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file and rename so readers never see a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # mkstemp creates 0600 files; keep thumbnails readable by a fronting web server
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _scan(self):
+        """List cached files as (mtime, size, path), including negative markers"""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        with os.scandir(self.root) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for entry in files:
+                        if entry.is_file() and not entry.name.startswith('.'):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _account(self, added: int, keep: Optional[str] = None):
+        """Track the cache size and evict the least recently served files when over budget"""
+        with self._size_lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_bytes += added
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            # Evict down to 90% so the next few writes do not trigger another scan
+            entries = sorted(self._scan())
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * 0.9
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                self.stats['evictions'] += 1
+            self._total_bytes = total
+
+# Global instance
+thumbnail_proxy = ThumbnailProxy()
@@ -0,0 +1,8 @@
+import os
+
+class Config:
+    """Settings shared by every environment"""
+    
+    # AI Services Configuration
+    # 'batch' requests main text and variations in one completion, 'parallel' issues concurrent calls
+    DEEPSEEK_VARIATIONS_MODE = os.environ.get('DEEPSEEK_VARIATIONS_MODE', 'batch')
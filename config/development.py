@@ -1,7 +1,9 @@
 import os
 from datetime import timedelta
 
-class DevelopmentConfig:
+from config.base import Config
+
+class DevelopmentConfig(Config):
     """Development configuration"""
     
     # Flask Configuration
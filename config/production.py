@@ -1,7 +1,9 @@
 import os
 from datetime import timedelta
 
-class ProductionConfig:
+from config.base import Config
+
+class ProductionConfig(Config):
     """Production configuration"""
     
     # Flask Configuration
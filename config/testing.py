@@ -1,7 +1,9 @@
 import os
 from datetime import timedelta
 
-class TestingConfig:
+from config.base import Config
+
+class TestingConfig(Config):
     """Testing configuration"""
     
     # Flask Configuration
@@ -1,7 +1,9 @@
 import os
 from datetime import timedelta
 
-class VercelConfig:
+from config.base import Config
+
+class VercelConfig(Config):
     """Vercel serverless configuration"""
     
     # Flask Configuration
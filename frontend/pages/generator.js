@@ -7,58 +7,43 @@ import { useAuth } from '../contexts/AuthContext'
 import { useLanguage } from '../contexts/LanguageContext'
 import { useRouter } from 'next/router'
 
-// GeneratedImage component to handle image fetching
+// Discovery results come from a cached pool on the backend; a per-tab seed and
+// page counter make each click show the next slice of that pool
+const discoverySeed = Math.random().toString(36).slice(2)
+const discoveryPages = { videos: 0, podcasts: 0 }
+
+// Remote video and podcast artwork goes through the backend thumbnail proxy,
+// which serves a cached card-sized copy instead of the full-size original.
+// Keep in sync with DEFAULT_ALLOWED_HOSTS in backend/services/thumbnail_proxy.py;
+// artwork on any other host (placeholders, arbitrary podcast sites) is loaded as is
+const THUMB_PROXY_HOSTS = ['img.youtube.com', 'i.ytimg.com', 'images.unsplash.com', 'mzstatic.com']
+
+function thumbUrl(url, size = 'video') {
+  if (!url) return url
+  let host
+  try {
+    const parsed = new URL(url)
+    if (!['http:', 'https:'].includes(parsed.protocol)) return url
+    host = parsed.hostname.toLowerCase()
+  } catch (e) {
+    return url
+  }
+  if (!THUMB_PROXY_HOSTS.some(allowed => host === allowed || host.endsWith(`.${allowed}`))) return url
+  const backendUrl = process.env.BACKEND_URL || 'https://content-contentmaker.up.railway.app'
+  return `${backendUrl}/api/thumb?size=${size}&url=${encodeURIComponent(url)}`
+}
+
+// GeneratedImage component to display a stored image by its content hash
 function GeneratedImage({ imageHash }) {
-  const [imageData, setImageData] = useState(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(false)
 
   useEffect(() => {
-    const fetchImage = async () => {
-      if (!imageHash || imageHash === 'generated') {
-        setLoading(false)
-        return
-      }
-
-      try {
-        setLoading(true)
-        setError(false)
-        
-        // Fetch image data from the backend using the same API configuration
-        const backendUrl = process.env.BACKEND_URL || 'https://content-contentmaker.up.railway.app'
-        const response = await fetch(`${backendUrl}/api/image/${imageHash}`)
-        
-        if (!response.ok) {
-          throw new Error(`Failed to fetch image: ${response.status}`)
-        }
-        
-        const data = await response.json()
-        
-        if (data.success && data.data?.image_data) {
-          setImageData(data.data.image_data)
-        } else {
-          throw new Error('No image data received')
-        }
-      } catch (err) {
-        console.error('Error fetching image:', err)
-        setError(true)
-      } finally {
-        setLoading(false)
-      }
-    }
-
-    fetchImage()
+    setLoading(true)
+    setError(false)
   }, [imageHash])
 
-  if (loading) {
-    return (
-      <div className="w-full h-48 bg-gray-200 rounded-lg flex items-center justify-center">
-        <RefreshCw className="w-6 h-6 animate-spin text-gray-500" />
-      </div>
-    )
-  }
-
-  if (error || !imageData) {
+  if (!imageHash || imageHash === 'generated' || error) {
     return (
       <div className="w-full h-48 bg-gray-200 rounded-lg flex items-center justify-center text-gray-500">
         <div className="text-center">
@@ -69,12 +54,27 @@ function GeneratedImage({ imageHash }) {
     )
   }
 
+  // The image is served as binary with long-lived caching, so the browser can load it directly
+  const backendUrl = process.env.BACKEND_URL || 'https://content-contentmaker.up.railway.app'
+
   return (
-    <img 
-      src={`data:image/jpeg;base64,${imageData}`} 
-      alt="Generated image"
-      className="w-full h-48 object-cover rounded-lg"
-    />
+    <div className="relative w-full h-48">
+      {loading && (
+        <div className="absolute inset-0 bg-gray-200 rounded-lg flex items-center justify-center">
+          <RefreshCw className="w-6 h-6 animate-spin text-gray-500" />
+        </div>
+      )}
+      <img 
+        src={`${backendUrl}/api/image/${imageHash}`} 
+        alt="Generated image"
+        className="w-full h-48 object-cover rounded-lg"
+        onLoad={() => setLoading(false)}
+        onError={() => {
+          console.error('Error loading image:', imageHash)
+          setError(true)
+        }}
+      />
+    </div>
   )
 }
 
@@ -1039,7 +1039,9 @@ export default function Generator() {
       const response = await apiClient.generateVideoLink({
         direction: formData.direction,
         categories: selectedCategories,
-        country: selectedCountry
+        country: selectedCountry,
+        seed: discoverySeed,
+        page: discoveryPages.videos++
       })
       
       if (response.success && response.data) {
@@ -1076,7 +1078,9 @@ export default function Generator() {
       const requestData = {
         direction: formData.direction,
         categories: selectedCategories,
-        country: selectedCountry
+        country: selectedCountry,
+        seed: discoverySeed,
+        page: discoveryPages.podcasts++
       };
       
       console.log('🎤 Frontend: Sending request with data:', requestData);
@@ -1471,7 +1475,7 @@ Generated on: ${new Date().toLocaleString()}
                                           <div key={index} className="p-3 bg-white border border-gray-200 rounded-lg hover:shadow-md transition-shadow">
                                             <div className="flex gap-3">
                                               <img 
-                                                src={video.thumbnail} 
+                                                src={thumbUrl(video.thumbnail, 'video')} 
                                                 alt={video.title}
                                                 className="w-20 h-16 object-cover rounded-lg flex-shrink-0"
                                               />
@@ -1571,7 +1575,7 @@ Generated on: ${new Date().toLocaleString()}
                                           <div key={index} className="p-3 bg-white border border-gray-200 rounded-lg hover:shadow-md transition-shadow">
                                             <div className="flex gap-3">
                                               <img 
-                                                src={podcast.cover} 
+                                                src={thumbUrl(podcast.cover, 'square')} 
                                                 alt={podcast.title}
                                                 className="w-16 h-16 object-cover rounded-lg flex-shrink-0"
                                               />
@@ -1648,7 +1652,7 @@ Generated on: ${new Date().toLocaleString()}
                         </h4>
                         <div className="flex items-center gap-3">
                           <img 
-                            src={selectedVideo?.thumbnail || selectedPodcast?.cover} 
+                            src={thumbUrl(selectedVideo?.thumbnail || selectedPodcast?.cover, 'small')} 
                             alt="Selected content"
                             className="w-12 h-12 object-cover rounded-lg"
                           />